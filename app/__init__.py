@@ -1,9 +1,19 @@
 from app.users.users_profile.handlers import router as user_routers
 from app.users.auth.handlers import router as auth_routers
+from app.users.auth.token.handlers import router as jwks_routers
 from app.tasks.handlers import router as task_routers
+from app.analytics.handlers import router as analytics_routers
+from app.categories.handlers import router as category_routers
+from app.pomodoros.handlers import router as pomodoro_routers
+from app.infrastructure.cache.handlers import router as redis_routers
 
 all_routers = [
     user_routers,
     auth_routers,
-    task_routers
+    jwks_routers,
+    task_routers,
+    category_routers,
+    analytics_routers,
+    pomodoro_routers,
+    redis_routers,
 ]
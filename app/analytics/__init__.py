@@ -0,0 +1,17 @@
+"""Аналитика по задачам: сводные таблицы, их инкрементальное обновление и эндпоинты чтения."""
+
+from app.analytics.models import UserTaskStatsModel, CategoryTaskStatsModel, DailyTaskStatsModel
+from app.analytics.repository import AnalyticsRepository
+from app.analytics.schemas import UserTaskStatsSchema, CategoryTaskStatsSchema, TimeBucketTaskStatsSchema
+from app.analytics.service import AnalyticsService
+
+__all__ = [
+    "AnalyticsRepository",
+    "AnalyticsService",
+    "CategoryTaskStatsModel",
+    "CategoryTaskStatsSchema",
+    "DailyTaskStatsModel",
+    "TimeBucketTaskStatsSchema",
+    "UserTaskStatsModel",
+    "UserTaskStatsSchema",
+]
@@ -0,0 +1,71 @@
+"""Эндпоинты аналитики по задачам авторизованного пользователя."""
+
+from datetime import date
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends
+
+from app.analytics import AnalyticsService, UserTaskStatsSchema, CategoryTaskStatsSchema, TimeBucketTaskStatsSchema
+from app.dependencies import get_analytics_service, UserGetterFromToken
+from app.settings.main_settings import Settings
+from app.users.users_profile import UserSchema
+
+settings = Settings()
+
+router = APIRouter(
+        prefix="/analytics",
+        tags=["analytics"],
+)
+
+
+@router.get("/totals", response_model=UserTaskStatsSchema)
+async def get_user_totals(
+        analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> UserTaskStatsSchema:
+    """
+    Итоги по задачам авторизованного пользователя.
+
+    Возвращает:
+    - Количество задач и суммарное количество помидоров.
+    """
+    return await analytics_service.get_user_totals(user.id)
+
+
+@router.get("/categories", response_model=list[CategoryTaskStatsSchema])
+async def get_category_totals(
+        analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> list[CategoryTaskStatsSchema]:
+    """
+    Итоги по задачам авторизованного пользователя в разрезе категорий.
+
+    Возвращает:
+    - Количество задач и помидоров по каждой категории, в которой у пользователя есть задачи.
+    """
+    return await analytics_service.get_category_totals(user.id)
+
+
+@router.get("/timeline", response_model=list[TimeBucketTaskStatsSchema])
+async def get_time_buckets(
+        analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+        bucket: Literal["day", "week", "month"] = "day",
+        date_from: date | None = None,
+        date_to: date | None = None,
+) -> list[TimeBucketTaskStatsSchema]:
+    """
+    Итоги по задачам авторизованного пользователя за периоды.
+
+    Описание:
+    - Задачи относятся к периоду по дате создания.
+
+    Аргументы:
+    - bucket: Размер периода ("day", "week" или "month").
+    - date_from: Первый день выборки (включительно).
+    - date_to: Последний день выборки (включительно).
+
+    Возвращает:
+    - Количество задач и помидоров по каждому периоду, в котором у пользователя есть задачи.
+    """
+    return await analytics_service.get_time_buckets(user.id, bucket, date_from, date_to)
@@ -0,0 +1,71 @@
+"""
+Сводные таблицы аналитики по задачам.
+
+Таблицы хранят готовые суммы и обновляются инкрементально в той же транзакции, что и изменение задач
+(см. app.analytics.rollup), поэтому чтение аналитики не сканирует таблицу tasks.
+"""
+
+from datetime import date
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database import Base
+
+
+class UserTaskStatsModel(Base):
+    """
+    Итоги по задачам пользователя.
+
+    Атрибуты:
+    user_id (Mapped[int]): Идентификатор пользователя.
+    tasks_count (Mapped[int]): Количество задач.
+    pomodoro_count (Mapped[int]): Суммарное количество помидоров.
+    """
+
+    __tablename__ = "analytics_user_totals"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user_profile.id", ondelete="CASCADE"), primary_key=True)
+    tasks_count: Mapped[int] = mapped_column(default=0)
+    pomodoro_count: Mapped[int] = mapped_column(default=0)
+
+
+class CategoryTaskStatsModel(Base):
+    """
+    Итоги по задачам пользователя в разрезе категорий.
+
+    Атрибуты:
+    user_id (Mapped[int]): Идентификатор пользователя.
+    category_id (Mapped[int]): Идентификатор категории.
+    tasks_count (Mapped[int]): Количество задач.
+    pomodoro_count (Mapped[int]): Суммарное количество помидоров.
+    """
+
+    __tablename__ = "analytics_category_totals"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user_profile.id", ondelete="CASCADE"), primary_key=True)
+    category_id: Mapped[int] = mapped_column(primary_key=True)
+    tasks_count: Mapped[int] = mapped_column(default=0)
+    pomodoro_count: Mapped[int] = mapped_column(default=0)
+
+
+class DailyTaskStatsModel(Base):
+    """
+    Итоги по задачам пользователя за день создания задач.
+
+    Недели и месяцы собираются из дневных строк, поэтому стоимость запроса зависит
+    только от количества дней в периоде.
+
+    Атрибуты:
+    user_id (Mapped[int]): Идентификатор пользователя.
+    day (Mapped[date]): День создания задач.
+    tasks_count (Mapped[int]): Количество задач.
+    pomodoro_count (Mapped[int]): Суммарное количество помидоров.
+    """
+
+    __tablename__ = "analytics_daily_totals"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("user_profile.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+    tasks_count: Mapped[int] = mapped_column(default=0)
+    pomodoro_count: Mapped[int] = mapped_column(default=0)
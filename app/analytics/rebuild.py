@@ -0,0 +1,24 @@
+"""
+Пересчет сводных таблиц аналитики по таблице задач.
+
+Запуск: python -m app.analytics.rebuild
+"""
+
+import asyncio
+
+from app.analytics.repository import AnalyticsRepository
+from app.infrastructure.database import create_database_engine, create_session_factory
+from app.settings.main_settings import Settings
+
+
+async def rebuild() -> None:
+    """Пересчитывает сводные таблицы аналитики и закрывает соединения с базой данных."""
+    engine = create_database_engine(Settings())
+    try:
+        await AnalyticsRepository(create_session_factory(engine)).rebuild_task_stats()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
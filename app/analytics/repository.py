@@ -0,0 +1,166 @@
+"""Чтение и пересчет сводных таблиц аналитики по задачам."""
+
+from collections.abc import Callable, Sequence
+from datetime import date
+from typing import TypeVar
+
+from sqlalchemy import select, delete, insert, func, cast, text, Date, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics.models import UserTaskStatsModel, CategoryTaskStatsModel, DailyTaskStatsModel
+from app.tasks.models import TaskModel
+
+T = TypeVar(
+        "T"
+)
+
+
+class AnalyticsRepository:
+    """
+    Класс для чтения сводных таблиц аналитики.
+
+    Все запросы читают только сводные таблицы, поэтому их стоимость зависит от количества строк в ответе
+    (категорий или дней периода), а не от количества задач.
+
+    Атрибуты:
+    session_factory (Callable[[T], AsyncSession]): Фабрика асинхронных сессий.
+
+    Методы:
+    get_user_totals(self, user_id: int) -> UserTaskStatsModel | None: Получает итоги пользователя.
+    get_category_totals(self, user_id: int) -> Sequence[CategoryTaskStatsModel]: Получает итоги по категориям.
+    get_time_buckets(self, user_id: int, bucket: str, date_from: date | None, date_to: date | None) -> Sequence[Row]:
+     Получает итоги по периодам.
+    rebuild_task_stats(self) -> None: Пересчитывает сводные таблицы по таблице задач.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[T], AsyncSession]
+    ):
+        self.session_factory = session_factory
+
+    async def get_user_totals(
+            self,
+            user_id: int
+    ) -> UserTaskStatsModel | None:
+        """
+        Получает итоги по задачам пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Итоги пользователя или None, если пользователь еще не создавал задач.
+        """
+        async with self.session_factory() as session:
+            return await session.get(UserTaskStatsModel, user_id)
+
+    async def get_category_totals(
+            self,
+            user_id: int
+    ) -> Sequence[CategoryTaskStatsModel]:
+        """
+        Получает итоги по задачам пользователя в разрезе категорий.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Итоги по категориям, в которых у пользователя есть задачи, отсортированные по категории.
+        """
+        query = (
+            select(
+                    CategoryTaskStatsModel
+            )
+            .where(
+                    CategoryTaskStatsModel.user_id == user_id,
+                    CategoryTaskStatsModel.tasks_count > 0
+            )
+            .order_by(
+                    CategoryTaskStatsModel.category_id
+            )
+        )
+        async with self.session_factory() as session:
+            return (await session.execute(query)).scalars().all()
+
+    async def get_time_buckets(
+            self,
+            user_id: int,
+            bucket: str,
+            date_from: date | None = None,
+            date_to: date | None = None
+    ) -> Sequence[Row]:
+        """
+        Получает итоги по задачам пользователя за периоды.
+
+        Описание:
+        - Дневные строки сводной таблицы группируются по date_trunc(bucket, day).
+
+        Аргументы:
+        - user_id: Идентификатор пользователя.
+        - bucket: Размер периода ("day", "week" или "month").
+        - date_from: Первый день выборки (включительно).
+        - date_to: Последний день выборки (включительно).
+
+        Возвращает:
+        - Строки (bucket_start, tasks_count, pomodoro_count), отсортированные по началу периода.
+        """
+        bucket_start = cast(func.date_trunc(bucket, DailyTaskStatsModel.day), Date).label("bucket_start")
+        query = (
+            select(
+                    bucket_start,
+                    func.sum(DailyTaskStatsModel.tasks_count).label("tasks_count"),
+                    func.sum(DailyTaskStatsModel.pomodoro_count).label("pomodoro_count"),
+            )
+            .where(
+                    DailyTaskStatsModel.user_id == user_id
+            )
+            .group_by(
+                    bucket_start
+            )
+            .having(
+                    func.sum(DailyTaskStatsModel.tasks_count) > 0
+            )
+            .order_by(
+                    bucket_start
+            )
+        )
+        if date_from is not None:
+            query = query.where(DailyTaskStatsModel.day >= date_from)
+        if date_to is not None:
+            query = query.where(DailyTaskStatsModel.day <= date_to)
+        async with self.session_factory() as session:
+            return (await session.execute(query)).all()
+
+    async def rebuild_task_stats(self) -> None:
+        """
+        Пересчитывает сводные таблицы по таблице задач.
+
+        Описание:
+        - Нужен один раз после создания сводных таблиц (для уже существующих задач) или для исправления
+         расхождений. В обычной работе таблицы обновляются инкрементально при изменении задач.
+        - Выполняется в одной транзакции: читатели видят либо старые, либо пересчитанные итоги.
+        - Таблица задач блокируется в режиме SHARE до конца транзакции. Задачи и сводные таблицы изменяются
+         в одной транзакции (apply_task_stats), поэтому блокировка дожидается завершения начатых изменений
+         и не пускает новые до commit: ни одно изменение не теряется между DELETE и INSERT ... SELECT
+         и не учитывается дважды. Чтение задач и сводных таблиц не блокируется.
+        """
+        groupings = {
+            UserTaskStatsModel: (TaskModel.user_id,),
+            CategoryTaskStatsModel: (TaskModel.user_id, TaskModel.category_id),
+            DailyTaskStatsModel: (TaskModel.user_id, cast(TaskModel.created_at, Date)),
+        }
+        async with self.session_factory() as session:
+            await session.execute(text(f"LOCK TABLE {TaskModel.__tablename__} IN SHARE MODE"))
+            for model, group_columns in groupings.items():
+                key_columns = [column.name for column in model.__table__.primary_key]
+                await session.execute(delete(model))
+                await session.execute(
+                        insert(
+                                model
+                        ).from_select(
+                                [*key_columns, "tasks_count", "pomodoro_count"],
+                                select(
+                                        *group_columns,
+                                        func.count(),
+                                        func.sum(TaskModel.pomodoro_count),
+                                ).group_by(
+                                        *group_columns
+                                ),
+                        )
+                )
+            await session.commit()
@@ -0,0 +1,87 @@
+"""
+Инкрементальное обновление сводных таблиц аналитики.
+
+TaskRepository вызывает apply_task_stats в той же сессии, что и изменение задач, до commit:
+сводные таблицы меняются атомарно вместе с tasks. Изменения суммируются в Python и применяются
+одним INSERT ... ON CONFLICT DO UPDATE на таблицу, независимо от количества задач в пакете.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Protocol
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics.models import UserTaskStatsModel, CategoryTaskStatsModel, DailyTaskStatsModel
+from app.infrastructure.database import Base
+
+
+class TaskStatsRow(Protocol):
+    """Поля задачи, от которых зависят сводные таблицы (TaskModel или строка RETURNING)."""
+
+    user_id: int
+    category_id: int
+    pomodoro_count: int
+    created_at: datetime
+
+
+def collect_task_stats_deltas(
+        tasks: Iterable[TaskStatsRow],
+        sign: int
+) -> dict[type[Base], list[dict]]:
+    """
+    Суммирует изменения сводных таблиц по пакету задач.
+
+    :param tasks: Созданные или удаленные задачи.
+    :param sign: 1 для созданных задач, -1 для удаленных.
+    :return: Строки изменений для каждой сводной таблицы.
+    """
+    keys = {
+        UserTaskStatsModel: lambda task: (task.user_id,),
+        CategoryTaskStatsModel: lambda task: (task.user_id, task.category_id),
+        DailyTaskStatsModel: lambda task: (task.user_id, task.created_at.date()),
+    }
+    totals = {model: defaultdict(lambda: [0, 0]) for model in keys}
+    for task in tasks:
+        for model, key in keys.items():
+            total = totals[model][key(task)]
+            total[0] += sign
+            total[1] += sign * task.pomodoro_count
+
+    deltas = {}
+    for model, model_totals in totals.items():
+        key_columns = [column.name for column in model.__table__.primary_key]
+        deltas[model] = [
+            {**dict(zip(key_columns, key, strict=True)), "tasks_count": tasks_count, "pomodoro_count": pomodoro_count}
+            for key, (tasks_count, pomodoro_count) in model_totals.items()
+        ]
+    return deltas
+
+
+async def apply_task_stats(
+        session: AsyncSession,
+        tasks: Iterable[TaskStatsRow],
+        sign: int
+) -> None:
+    """
+    Применяет изменения сводных таблиц в переданной сессии (без commit).
+
+    :param session: Сессия, в которой изменяются задачи.
+    :param tasks: Созданные или удаленные задачи.
+    :param sign: 1 для созданных задач, -1 для удаленных.
+    """
+    for model, rows in collect_task_stats_deltas(tasks, sign).items():
+        if not rows:
+            continue
+        query = insert(model).values(rows)
+        query = query.on_conflict_do_update(
+                index_elements=list(model.__table__.primary_key),
+                set_={
+                    "tasks_count": model.tasks_count + query.excluded.tasks_count,
+                    "pomodoro_count": model.pomodoro_count + query.excluded.pomodoro_count,
+                    "updated_at": datetime.now(),
+                },
+        )
+        await session.execute(query)
@@ -0,0 +1,42 @@
+"""Схемы ответов аналитики по задачам."""
+
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict
+
+
+class UserTaskStatsSchema(BaseModel):
+    """
+    Итоги по задачам пользователя.
+
+    Атрибуты:
+    tasks_count (int): Количество задач.
+    pomodoro_count (int): Суммарное количество помидоров.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    tasks_count: int = 0
+    pomodoro_count: int = 0
+
+
+class CategoryTaskStatsSchema(UserTaskStatsSchema):
+    """
+    Итоги по задачам пользователя в одной категории.
+
+    Атрибуты:
+    category_id (int): Идентификатор категории.
+    """
+
+    category_id: int
+
+
+class TimeBucketTaskStatsSchema(UserTaskStatsSchema):
+    """
+    Итоги по задачам пользователя, созданным за период.
+
+    Атрибуты:
+    bucket_start (date): Первый день периода.
+    """
+
+    bucket_start: date
@@ -0,0 +1,68 @@
+"""Сервис аналитики по задачам."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Literal
+
+from app.analytics.repository import AnalyticsRepository
+from app.analytics.schemas import UserTaskStatsSchema, CategoryTaskStatsSchema, TimeBucketTaskStatsSchema
+
+
+@dataclass
+class AnalyticsService:
+    """
+    Класс для получения аналитики по задачам.
+
+    Атрибуты:
+    analytics_repository (AnalyticsRepository): Репозиторий сводных таблиц аналитики.
+
+    Методы:
+    get_user_totals(self, user_id: int) -> UserTaskStatsSchema: Получает итоги пользователя.
+    get_category_totals(self, user_id: int) -> list[CategoryTaskStatsSchema]: Получает итоги по категориям.
+    get_time_buckets(self, user_id: int, bucket: str, date_from: date | None, date_to: date | None)
+     -> list[TimeBucketTaskStatsSchema]: Получает итоги по периодам.
+    """
+
+    analytics_repository: AnalyticsRepository
+
+    async def get_user_totals(
+            self,
+            user_id: int
+    ) -> UserTaskStatsSchema:
+        """
+        Возвращает итоги по задачам пользователя.
+        :param user_id: Идентификатор пользователя.
+        :return: Итоги пользователя (нулевые, если задач нет).
+        """
+        totals = await self.analytics_repository.get_user_totals(user_id)
+        return UserTaskStatsSchema.model_validate(totals) if totals else UserTaskStatsSchema()
+
+    async def get_category_totals(
+            self,
+            user_id: int
+    ) -> list[CategoryTaskStatsSchema]:
+        """
+        Возвращает итоги по задачам пользователя в разрезе категорий.
+        :param user_id: Идентификатор пользователя.
+        :return: Итоги по категориям.
+        """
+        totals = await self.analytics_repository.get_category_totals(user_id)
+        return [CategoryTaskStatsSchema.model_validate(category_totals) for category_totals in totals]
+
+    async def get_time_buckets(
+            self,
+            user_id: int,
+            bucket: Literal["day", "week", "month"],
+            date_from: date | None = None,
+            date_to: date | None = None
+    ) -> list[TimeBucketTaskStatsSchema]:
+        """
+        Возвращает итоги по задачам пользователя за периоды.
+        :param user_id: Идентификатор пользователя.
+        :param bucket: Размер периода.
+        :param date_from: Первый день выборки.
+        :param date_to: Последний день выборки.
+        :return: Итоги по периодам, в которых у пользователя есть задачи.
+        """
+        rows = await self.analytics_repository.get_time_buckets(user_id, bucket, date_from, date_to)
+        return [TimeBucketTaskStatsSchema.model_validate(row) for row in rows]
@@ -0,0 +1,12 @@
+"""Справочник категорий задач: хранение, кэш в памяти процесса и эндпоинты изменения."""
+
+from app.categories.cache_repository import CategoryCacheRepository, CategorySnapshot
+from app.categories.repository import CategoryRepository
+from app.categories.service import CategoryService
+
+__all__ = [
+    "CategoryCacheRepository",
+    "CategoryRepository",
+    "CategoryService",
+    "CategorySnapshot",
+]
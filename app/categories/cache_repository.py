@@ -0,0 +1,116 @@
+"""Кэш справочника категорий в памяти процесса с инвалидацией между воркерами через Redis pub/sub."""
+
+from dataclasses import dataclass
+
+from redis import asyncio as Redis  # noqa: N812
+
+from app.categories.local_cache import CATEGORIES_INVALIDATION_CHANNEL
+from app.infrastructure.cache.memory import MemoryCache
+from app.tasks.schemas import CategorySchema
+
+CATEGORIES_CACHE_KEY = "categories"
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """
+    Справочник категорий в памяти процесса.
+
+    Атрибуты:
+    categories (dict[int, CategorySchema]): Категории по идентификатору в порядке идентификаторов.
+    ids_by_name (dict[str, tuple[int, ...]]): Идентификаторы категорий по имени (имена не уникальны).
+
+    Методы:
+    from_categories(cls, categories: list[CategorySchema]) -> CategorySnapshot: Строит справочник.
+    """
+
+    categories: dict[int, CategorySchema]
+    ids_by_name: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def from_categories(
+            cls,
+            categories: list[CategorySchema]
+    ) -> "CategorySnapshot":
+        """
+        Строит справочник по списку категорий.
+
+        :param categories: Категории.
+        :return: Справочник категорий.
+        """
+        ids_by_name: dict[str, tuple[int, ...]] = {}
+        for category in categories:
+            ids_by_name[category.name] = (*ids_by_name.get(category.name, ()), category.id)
+        return cls(
+                categories={category.id: category for category in categories},
+                ids_by_name=ids_by_name,
+        )
+
+
+class CategoryCacheRepository:
+    """
+    Класс для работы с in-process кэшем справочника категорий.
+
+    Справочник хранится в памяти каждого воркера целиком и не дублируется в Redis:
+    Redis используется только для рассылки инвалидации между воркерами.
+
+    Атрибуты:
+    redis (Redis): Объект подключения к Redis.
+    local_cache (MemoryCache): In-process кэш справочника.
+
+    Методы:
+    get_snapshot(self) -> CategorySnapshot | None: Получает справочник из кэша.
+    get_epoch(self) -> int: Возвращает счетчик инвалидаций кэша.
+    set_snapshot(self, snapshot: CategorySnapshot, epoch: int) -> None: Сохраняет справочник.
+    invalidate(self) -> None: Сбрасывает справочник во всех воркерах.
+    handle_invalidation_message(self, message: bytes) -> None: Обрабатывает сообщение канала инвалидации.
+    """
+
+    def __init__(
+            self,
+            redis_session: Redis,
+            local_cache: MemoryCache
+    ):
+        self.redis = redis_session
+        self.local_cache = local_cache
+
+    def get_snapshot(self) -> CategorySnapshot | None:
+        """
+        Получает справочник категорий из кэша.
+
+        :return: Справочник или None, если он еще не загружен или сброшен.
+        """
+        return self.local_cache.get(CATEGORIES_CACHE_KEY)
+
+    def get_epoch(self) -> int:
+        """Возвращает счетчик инвалидаций кэша. Его нужно запомнить до чтения категорий из базы."""
+        return self.local_cache.epoch
+
+    def set_snapshot(
+            self,
+            snapshot: CategorySnapshot,
+            epoch: int
+    ) -> None:
+        """
+        Сохраняет справочник, если с момента чтения категорий из базы не было инвалидации.
+
+        :param snapshot: Справочник категорий.
+        :param epoch: Значение get_epoch до чтения категорий из базы.
+        """
+        self.local_cache.set(CATEGORIES_CACHE_KEY, snapshot, epoch=epoch)
+
+    async def invalidate(self) -> None:
+        """Сбрасывает справочник в текущем воркере и публикует инвалидацию для остальных."""
+        self.local_cache.clear()
+        await self.redis.publish(CATEGORIES_INVALIDATION_CHANNEL, b"")
+
+    def handle_invalidation_message(
+            self,
+            message: bytes
+    ) -> None:
+        """
+        Обрабатывает сообщение канала инвалидации категорий.
+
+        :param message: Тело сообщения (не используется).
+        """
+        self.local_cache.clear()
@@ -0,0 +1,110 @@
+"""Эндпоинты справочника категорий."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.status import HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+
+from app.categories import CategoryService
+from app.dependencies import get_category_service, UserGetterFromToken
+from app.exceptions import CategoryNotFoundError, CategoryInUseError
+from app.settings.main_settings import Settings
+from app.tasks import CategorySchema, CategoryCreateSchema
+from app.users.users_profile import UserSchema
+
+settings = Settings()
+
+router = APIRouter(
+        prefix="/categories",
+        tags=["categories"],
+)
+
+
+@router.get("/", response_model=list[CategorySchema])
+async def get_categories(
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+) -> list[CategorySchema]:
+    """
+    Получение всех категорий.
+
+    Возвращает:
+    - Категории, отсортированные по идентификатору (из справочника в памяти процесса).
+    """
+    return await category_service.get_categories()
+
+
+@router.get("/{category_id}", response_model=CategorySchema)
+async def get_category(
+        category_id: int,
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+) -> CategorySchema:
+    """
+    Получение категории по идентификатору.
+
+    Аргументы:
+    - category_id: Идентификатор категории.
+    """
+    try:
+        category = await category_service.get_category(category_id)
+    except CategoryNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    return category
+
+
+@router.post("/", response_model=CategorySchema)
+async def create_category(
+        body: CategoryCreateSchema,
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> CategorySchema:
+    """
+    Создание категории.
+
+    Аргументы:
+    - body: Имя и тип категории.
+    """
+    return await category_service.create_category(body)
+
+
+@router.patch("/{category_id}", response_model=CategorySchema)
+async def update_category(
+        category_id: int,
+        body: CategoryCreateSchema,
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> CategorySchema:
+    """
+    Изменение категории.
+
+    Аргументы:
+    - category_id: Идентификатор категории.
+    - body: Новые имя и тип категории.
+    """
+    try:
+        category = await category_service.update_category(category_id, body)
+    except CategoryNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    return category
+
+
+@router.delete("/{category_id}", status_code=HTTP_204_NO_CONTENT)
+async def delete_category(
+        category_id: int,
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> None:
+    """
+    Удаление категории.
+
+    Описание:
+    - Категорию, к которой относятся задачи, удалить нельзя.
+
+    Аргументы:
+    - category_id: Идентификатор категории.
+    """
+    try:
+        await category_service.delete_category(category_id)
+    except CategoryNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    except CategoryInUseError as error:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=error.detail)
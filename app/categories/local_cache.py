@@ -0,0 +1,12 @@
+"""
+Кэширование категорий в памяти процесса (воркера).
+
+In-process кэш справочника категорий (одна запись со всеми категориями) и объединение одновременных загрузок
+справочника из базы при промахе кэша создаются один раз на процесс в контейнере приложения
+(app.container.Container.create).
+
+Инвалидация между воркерами выполняется через Redis pub/sub канал CATEGORIES_INVALIDATION_CHANNEL:
+CategoryCacheRepository.invalidate публикует в него сообщение, а подписчик каждого воркера очищает кэш.
+"""
+
+CATEGORIES_INVALIDATION_CHANNEL = "categories:invalidate"
@@ -0,0 +1,135 @@
+"""Работа со справочником категорий в базе данных."""
+
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import CategoryInUseError
+from app.tasks.models import CategoryModel
+from app.tasks.schemas import CategoryCreateSchema
+
+T = TypeVar(
+        "T"
+)
+
+
+class CategoryRepository:
+    """
+    Класс для работы с категориями в базе данных.
+
+    Атрибуты:
+    session_factory (Callable[[T], AsyncSession]): Фабрика асинхронных сессий.
+
+    Методы:
+    get_categories(self) -> Sequence[CategoryModel]: Получает все категории.
+    create_category(self, category_data: CategoryCreateSchema) -> CategoryModel: Создает категорию.
+    update_category(self, category_id: int, category_data: CategoryCreateSchema) -> CategoryModel | None:
+     Изменяет категорию.
+    delete_category(self, category_id: int) -> bool: Удаляет категорию.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[T], AsyncSession]
+    ):
+        self.session_factory = session_factory
+
+    async def get_categories(self) -> Sequence[CategoryModel]:
+        """
+        Получает все категории.
+
+        Категорий немного, поэтому они загружаются целиком одним запросом и хранятся в кэше процесса.
+        :return: Категории, отсортированные по идентификатору.
+        """
+        async with self.session_factory() as session:
+            query_result = await session.execute(
+                    select(
+                            CategoryModel
+                    ).order_by(
+                            CategoryModel.id
+                    )
+            )
+            return query_result.scalars().all()
+
+    async def create_category(
+            self,
+            category_data: CategoryCreateSchema
+    ) -> CategoryModel:
+        """
+        Создает категорию.
+
+        :param category_data: Данные категории.
+        :return: Созданная категория.
+        """
+        async with self.session_factory() as session:
+            category = (await session.execute(
+                    insert(
+                            CategoryModel
+                    ).values(
+                            **category_data.model_dump()
+                    ).returning(
+                            CategoryModel
+                    )
+            )).scalar_one()
+            await session.commit()
+            return category
+
+    async def update_category(
+            self,
+            category_id: int,
+            category_data: CategoryCreateSchema
+    ) -> CategoryModel | None:
+        """
+        Изменяет имя и тип категории.
+
+        :param category_id: Идентификатор категории.
+        :param category_data: Новые данные категории.
+        :return: Измененная категория или None, если категория не найдена.
+        """
+        async with self.session_factory() as session:
+            category = (await session.execute(
+                    update(
+                            CategoryModel
+                    ).values(
+                            **category_data.model_dump()
+                    ).where(
+                            CategoryModel.id == category_id
+                    ).returning(
+                            CategoryModel
+                    ).execution_options(
+                            synchronize_session=False
+                    )
+            )).scalar_one_or_none()
+            await session.commit()
+            return category
+
+    async def delete_category(
+            self,
+            category_id: int
+    ) -> bool:
+        """
+        Удаляет категорию.
+
+        :param category_id: Идентификатор категории.
+        :raise CategoryInUseError: Если к категории относятся задачи.
+        :return: True, если категория удалена, False, если категория не найдена.
+        """
+        async with self.session_factory() as session:
+            try:
+                deleted_id = (await session.execute(
+                        delete(
+                                CategoryModel
+                        ).where(
+                                CategoryModel.id == category_id
+                        ).returning(
+                                CategoryModel.id
+                        )
+                )).scalar_one_or_none()
+                await session.commit()
+            except IntegrityError:
+                # tasks.category_id не допускает NULL, поэтому ON DELETE SET NULL отклоняет удаление
+                raise CategoryInUseError
+            return deleted_id is not None
@@ -0,0 +1,155 @@
+"""Сервис справочника категорий."""
+
+from dataclasses import dataclass, field
+
+from app.categories.cache_repository import CategoryCacheRepository, CategorySnapshot
+from app.categories.repository import CategoryRepository
+from app.exceptions import CategoryNotFoundError
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.tasks.schemas import CategorySchema, CategoryCreateSchema
+
+
+@dataclass
+class CategoryService:
+    """
+    Класс для работы с категориями.
+
+    Чтение выполняется из справочника в памяти процесса, который загружается при старте приложения
+    и перезагружается из базы одним запросом после каждой инвалидации.
+
+    Атрибуты:
+    category_repository (CategoryRepository): Репозиторий категорий.
+    category_cache_repository (CategoryCacheRepository): Кэш справочника категорий.
+    category_loads (SingleFlight): Объединяет одновременные загрузки справочника при промахе кэша.
+     Чтобы объединение работало между запросами, экземпляр должен быть общим для процесса.
+
+    Методы:
+    preload(self) -> None: Загружает справочник в кэш.
+    get_categories(self) -> list[CategorySchema]: Получает все категории.
+    get_category(self, category_id: int) -> CategorySchema: Получает категорию.
+    get_category_ids_by_name(self, name: str) -> tuple[int, ...]: Получает идентификаторы категорий по имени.
+    create_category(self, body: CategoryCreateSchema) -> CategorySchema: Создает категорию.
+    update_category(self, category_id: int, body: CategoryCreateSchema) -> CategorySchema: Изменяет категорию.
+    delete_category(self, category_id: int) -> None: Удаляет категорию.
+    """
+
+    category_repository: CategoryRepository
+    category_cache_repository: CategoryCacheRepository
+    category_loads: SingleFlight = field(default_factory=SingleFlight)
+
+    async def preload(self) -> None:
+        """Загружает справочник категорий в кэш, чтобы первые запросы не ждали базу данных."""
+        await self._get_snapshot()
+
+    async def get_categories(self) -> list[CategorySchema]:
+        """
+        Возвращает все категории.
+        :return: Категории, отсортированные по идентификатору.
+        """
+        return list((await self._get_snapshot()).categories.values())
+
+    async def get_category(
+            self,
+            category_id: int
+    ) -> CategorySchema:
+        """
+        Возвращает категорию по идентификатору.
+        :param category_id: Идентификатор категории.
+        :raise CategoryNotFoundError: Если категория не найдена.
+        :return: Категория.
+        """
+        if category := (await self._get_snapshot()).categories.get(category_id):
+            return category
+        raise CategoryNotFoundError
+
+    async def get_category_ids_by_name(
+            self,
+            name: str
+    ) -> tuple[int, ...]:
+        """
+        Возвращает идентификаторы категорий с указанным именем без обращения к базе данных.
+        :param name: Имя категории.
+        :raise CategoryNotFoundError: Если категорий с таким именем нет.
+        :return: Идентификаторы категорий.
+        """
+        if category_ids := (await self._get_snapshot()).ids_by_name.get(name):
+            return category_ids
+        raise CategoryNotFoundError
+
+    async def create_category(
+            self,
+            body: CategoryCreateSchema
+    ) -> CategorySchema:
+        """
+        Создает категорию и сбрасывает справочник во всех воркерах.
+        :param body: Данные категории.
+        :return: Созданная категория.
+        """
+        category = CategorySchema.model_validate(await self.category_repository.create_category(body))
+        await self.category_cache_repository.invalidate()
+        return category
+
+    async def update_category(
+            self,
+            category_id: int,
+            body: CategoryCreateSchema
+    ) -> CategorySchema:
+        """
+        Изменяет категорию и сбрасывает справочник во всех воркерах.
+        :param category_id: Идентификатор категории.
+        :param body: Новые данные категории.
+        :raise CategoryNotFoundError: Если категория не найдена.
+        :return: Измененная категория.
+        """
+        updated_category = await self.category_repository.update_category(category_id, body)
+        if not updated_category:
+            raise CategoryNotFoundError
+        await self.category_cache_repository.invalidate()
+        return CategorySchema.model_validate(updated_category)
+
+    async def delete_category(
+            self,
+            category_id: int
+    ) -> None:
+        """
+        Удаляет категорию и сбрасывает справочник во всех воркерах.
+        :param category_id: Идентификатор категории.
+        :raise CategoryNotFoundError: Если категория не найдена.
+        :raise CategoryInUseError: Если к категории относятся задачи.
+        """
+        if not await self.category_repository.delete_category(category_id):
+            raise CategoryNotFoundError
+        await self.category_cache_repository.invalidate()
+
+    async def _get_snapshot(self) -> CategorySnapshot:
+        """
+        Возвращает справочник категорий из кэша, при промахе загружает его из базы данных.
+
+        :return: Справочник категорий.
+        """
+        if snapshot := self.category_cache_repository.get_snapshot():
+            return snapshot
+        # epoch читается до обращения к базе: если категории изменятся во время выборки,
+        # устаревший справочник не будет сохранен в кэш.
+        epoch = self.category_cache_repository.get_epoch()
+        return await self.category_loads.do(
+                ("categories", epoch),
+                lambda: self._load_snapshot(epoch),
+        )
+
+    async def _load_snapshot(
+            self,
+            epoch: int
+    ) -> CategorySnapshot:
+        """
+        Загружает справочник категорий из базы данных и сохраняет его в кэш.
+
+        :param epoch: Счетчик инвалидаций кэша до обращения к базе.
+        :return: Справочник категорий.
+        """
+        categories = await self.category_repository.get_categories()
+        snapshot = CategorySnapshot.from_categories(
+                [CategorySchema.model_validate(category) for category in categories]
+        )
+        self.category_cache_repository.set_snapshot(snapshot, epoch)
+        return snapshot
@@ -0,0 +1,186 @@
+"""
+Контейнер объектов приложения.
+
+Настройки, подключения, кэши, ключи JWT, репозитории и сервисы не хранят состояния отдельного запроса, поэтому
+создаются один раз в lifespan приложения и сохраняются в app.state.container. Зависимости FastAPI только
+возвращают готовые объекты контейнера: на запросе не разбирается .env, не создаются клиенты Redis и сервисы.
+"""
+
+from dataclasses import dataclass
+
+from redis import asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.analytics import AnalyticsRepository, AnalyticsService
+from app.categories import CategoryRepository, CategoryCacheRepository, CategoryService
+from app.infrastructure.cache import create_redis_pool, get_redis_connection
+from app.infrastructure.cache.memory import CacheStats, MemoryCache
+from app.infrastructure.cache.pool import InstrumentedConnectionPool
+from app.infrastructure.database.database import create_database_engine, create_session_factory
+from app.infrastructure.executor import BoundedExecutor
+from app.pomodoros import PomodoroSessionRepository, PomodoroSessionService, PomodoroSessionWriter
+from app.settings.main_settings import Settings
+from app.tasks import TaskRepository, TaskCacheRepository, TaskService
+from app.tasks.repository.codecs import get_task_list_codec
+from app.users.auth import AuthService
+from app.users.auth.password import PasswordHasher, create_password_hasher
+from app.users.auth.token.keys import JWTKeyManager
+from app.users.auth.token.service import TokenService
+from app.users.auth.token.verified_cache import VerifiedTokenCache
+from app.users.users_profile import UserService, UserRepository
+from app.users.users_profile.cache_repository import UserCacheRepository
+
+
+@dataclass
+class Container:
+    """
+    Общие для процесса объекты приложения.
+
+    Атрибуты:
+    settings (Settings): Настройки приложения.
+    engine (AsyncEngine): Движок SQLAlchemy с пулом соединений PostgreSQL.
+    session_factory (async_sessionmaker): Фабрика асинхронных сессий.
+    redis_pool (InstrumentedConnectionPool): Общий пул соединений Redis.
+    redis (Redis): Клиент Redis на общем пуле, общий для всех репозиториев кэша.
+    key_manager (JWTKeyManager): Ключи подписи и проверки JWT.
+    crypto_executor (BoundedExecutor): Пул потоков для хэширования паролей и подписи токенов.
+    password_hasher (PasswordHasher): Хэшер паролей bcrypt.
+    pomodoro_session_writer (PomodoroSessionWriter): Буфер пакетной записи сессий помидоров.
+     Запускается и останавливается в lifespan приложения.
+    остальные атрибуты: Репозитории и сервисы, которые возвращают зависимости FastAPI.
+
+    Методы:
+    create(cls, settings: Settings | None = None) -> Container: Создает объекты приложения.
+    aclose(self) -> None: Закрывает соединения с Redis и PostgreSQL.
+    """
+
+    settings: Settings
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+    redis_pool: InstrumentedConnectionPool
+    redis: redis.Redis
+    key_manager: JWTKeyManager
+    crypto_executor: BoundedExecutor
+    password_hasher: PasswordHasher
+    pomodoro_session_writer: PomodoroSessionWriter
+    task_repository: TaskRepository
+    task_cache_repository: TaskCacheRepository
+    task_service: TaskService
+    category_cache_repository: CategoryCacheRepository
+    category_service: CategoryService
+    analytics_service: AnalyticsService
+    pomodoro_session_service: PomodoroSessionService
+    user_repository: UserRepository
+    user_cache_repository: UserCacheRepository
+    token_service: TokenService
+    auth_service: AuthService
+    user_service: UserService
+
+    @classmethod
+    def create(
+            cls,
+            settings: Settings | None = None
+    ) -> "Container":
+        """
+        Создает объекты приложения.
+
+        Все объекты, включая движок базы данных, пул соединений Redis, ключи JWT, пул потоков, хэшер паролей,
+        буфер записи сессий помидоров и кэши в памяти процесса, создаются из переданных настроек
+        и принадлежат контейнеру: aclose закрывает только их.
+        :param settings: Настройки. По умолчанию читаются из окружения и .env.
+        :return: Контейнер.
+        """
+        settings = settings or Settings()
+        engine = create_database_engine(settings)
+        session_factory = create_session_factory(engine)
+        redis_pool = create_redis_pool(settings)
+        redis_session = get_redis_connection(redis_pool)
+        key_manager = JWTKeyManager(settings.auth_jwt)
+        crypto_executor = BoundedExecutor(
+                "crypto",
+                workers=settings.crypto_executor_workers,
+                queue_size=settings.crypto_executor_queue_size,
+        )
+        password_hasher = create_password_hasher(settings)
+        pomodoro_session_repository = PomodoroSessionRepository(session_factory)
+        pomodoro_session_writer = PomodoroSessionWriter(
+                pomodoro_session_repository,
+                queue_size=settings.pomodoro_sessions_queue_size,
+                flush_size=settings.pomodoro_sessions_flush_size,
+                flush_interval=settings.pomodoro_sessions_flush_interval,
+        )
+        task_repository = TaskRepository(session_factory)
+        task_cache_repository = TaskCacheRepository(
+                redis_session,
+                ttl=settings.tasks_cache_ttl,
+                local_cache=MemoryCache(max_size=settings.tasks_local_cache_size, ttl=settings.tasks_local_cache_ttl),
+                redis_stats=CacheStats(),
+                codec=get_task_list_codec(settings.tasks_cache_codec),
+        )
+        category_cache_repository = CategoryCacheRepository(
+                redis_session,
+                MemoryCache(max_size=1, ttl=settings.categories_cache_ttl),
+        )
+        user_repository = UserRepository(session_factory=session_factory)
+        user_cache_repository = UserCacheRepository(
+                redis_session,
+                MemoryCache(max_size=settings.users_cache_size, ttl=settings.users_cache_ttl),
+        )
+        token_service = TokenService(
+                settings=settings,
+                key_manager=key_manager,
+                verified_tokens=VerifiedTokenCache(
+                        MemoryCache(max_size=settings.jwt_verified_cache_size, ttl=settings.jwt_verified_cache_ttl)
+                ),
+        )
+        auth_service = AuthService(
+                user_repository=user_repository,
+                settings=settings,
+                token_service=token_service,
+                crypto_executor=crypto_executor,
+                password_hasher=password_hasher,
+                user_cache_repository=user_cache_repository,
+        )
+        return cls(
+                settings=settings,
+                engine=engine,
+                session_factory=session_factory,
+                redis_pool=redis_pool,
+                redis=redis_session,
+                key_manager=key_manager,
+                crypto_executor=crypto_executor,
+                password_hasher=password_hasher,
+                pomodoro_session_writer=pomodoro_session_writer,
+                task_repository=task_repository,
+                task_cache_repository=task_cache_repository,
+                task_service=TaskService(
+                        task_repository=task_repository,
+                        task_cache_repository=task_cache_repository,
+                ),
+                category_cache_repository=category_cache_repository,
+                category_service=CategoryService(
+                        category_repository=CategoryRepository(session_factory),
+                        category_cache_repository=category_cache_repository,
+                ),
+                analytics_service=AnalyticsService(analytics_repository=AnalyticsRepository(session_factory)),
+                pomodoro_session_service=PomodoroSessionService(
+                        pomodoro_session_repository=pomodoro_session_repository,
+                        pomodoro_session_writer=pomodoro_session_writer,
+                ),
+                user_repository=user_repository,
+                user_cache_repository=user_cache_repository,
+                token_service=token_service,
+                auth_service=auth_service,
+                user_service=UserService(
+                        user_repository=user_repository,
+                        auth_service=auth_service,
+                        user_cache_repository=user_cache_repository,
+                ),
+        )
+
+    async def aclose(self) -> None:
+        """Закрывает соединения с Redis и PostgreSQL контейнера и останавливает его пул потоков."""
+        await self.redis.aclose()
+        await self.redis_pool.aclose()
+        await self.engine.dispose()
+        self.crypto_executor.shutdown()
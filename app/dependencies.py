@@ -1,182 +1,193 @@
 from typing import Annotated
 
-from fastapi import Depends, security, Security, HTTPException
+from fastapi import Depends, Request
 from jwt import InvalidTokenError
-from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
-from app.exceptions import TokenIsNotCorrectError, TokenExpiredError
-from app.infrastructure.cache import get_redis_connection
-from app.infrastructure.database import async_session_factory
-from app.settings.main_settings import Settings
+from app.analytics import AnalyticsService
+from app.categories import CategoryService
+from app.container import Container
+from app.infrastructure.cache.pool import InstrumentedConnectionPool
+from app.pomodoros import PomodoroSessionService
 from app.tasks import TaskRepository, TaskCacheRepository, TaskService
 from app.users.auth import AuthService
 from app.users.auth.exceptions import InvalidAuthTokenError
 from app.users.auth.token.service import TokenService, ouath2_bearer
 from app.users.users_profile import UserService, UserRepository, UserSchema
+from app.users.users_profile.cache_repository import UserCacheRepository
 
 
-async def get_tasks_repository() -> TaskRepository:
+async def get_container(request: Request) -> Container:
     """
-    Функция для получения экземпляра класса TaskRepository.
+    Функция для получения контейнера объектов приложения.
 
-    :return: TaskRepository: Экземпляр класса TaskRepository,
-     который используется для работы с задачами в базе данных.
+    :param request: Запрос.
+    :return: Container: Контейнер, созданный в lifespan приложения.
 
     Примечание:
-    Эта функция используется для получения экземпляра класса TaskRepository,
+    Зависимости ниже возвращают готовые объекты контейнера. Они объявлены асинхронными,
+     чтобы FastAPI не выполнял их в пуле потоков.
+    """
+    return request.app.state.container
+
+
+async def get_redis_pool(container: Annotated[Container, Depends(get_container)]) -> InstrumentedConnectionPool:
+    """
+    Функция для получения общего пула соединений Redis.
+
+    :return: InstrumentedConnectionPool: Пул соединений Redis текущего воркера.
+    """
+    return container.redis_pool
+
+
+async def get_tasks_repository(container: Annotated[Container, Depends(get_container)]) -> TaskRepository:
+    """
+    Функция для получения экземпляра класса TaskRepository.
+
+    :return: TaskRepository: Экземпляр класса TaskRepository,
      который используется для работы с задачами в базе данных.
-    Экземпляр класса TaskRepository создается с использованием фабрики асинхронных сессий async_session_factory.
     """
-    return TaskRepository(async_session_factory)
+    return container.task_repository
 
 
-async def get_task_cache_repository() -> TaskCacheRepository:
+async def get_task_cache_repository(container: Annotated[Container, Depends(get_container)]) -> TaskCacheRepository:
     """
     Функция для получения экземпляра класса TaskCacheRepository.
 
     :return: TaskCacheRepository: Экземпляр класса TaskCacheRepository,
-     который используется для работы с кэшем задач в Redis.
-
-    Примечание:
-    Эта функция используется для получения экземпляра класса TaskCacheRepository,
-     который используется для работы с кэшем задач в Redis.
-    Экземпляр класса TaskCacheRepository создается с использованием функции get_redis_connection(),
-     которая возвращает соединение с Redis.
+     который используется для работы с кэшем задач в Redis и общим для процесса in-process кэшем задач.
     """
-    return TaskCacheRepository(get_redis_connection())
+    return container.task_cache_repository
 
 
-async def get_tasks_service(
-        task_repository: Annotated[TaskRepository, Depends(get_tasks_repository)],
-        task_cache_repository: Annotated[
-            TaskCacheRepository, Depends(get_task_cache_repository)
-        ],
-) -> TaskService:
+async def get_tasks_service(container: Annotated[Container, Depends(get_container)]) -> TaskService:
     """
     Функция для получения экземпляра класса TaskService.
 
-    Параметры:
-    task_repository (Annotated[TaskRepository, Depends(get_tasks_repository)]): Экземпляр класса TaskRepository,
-     который используется для работы с задачами в базе данных.
-    task_cache_repository (Annotated[TaskCacheRepository, Depends(get_task_cache_repository)]):
-    Экземпляр класса TaskCacheRepository, который используется для работы с кэшем задач в Redis.
+    :return: TaskService: Экземпляр класса TaskService, который используется для работы с задачами.
+    """
+    return container.task_service
 
-    Возвращает:
-    TaskService: Экземпляр класса TaskService, который используется для работы с задачами.
 
-    Примечание:
-    Эта функция используется для получения экземпляра класса TaskService, который используется для работы с задачами.
-    Экземпляры классов TaskRepository и TaskCacheRepository передаются в качестве параметров функции
-     и используются для создания экземпляра класса TaskService.
+async def get_category_service(container: Annotated[Container, Depends(get_container)]) -> CategoryService:
     """
-    return TaskService(
-            task_repository=task_repository, task_cache_repository=task_cache_repository
-    )
-
+    Функция для получения экземпляра класса CategoryService.
 
-async def get_user_repository() -> UserRepository:
+    :return: CategoryService: Экземпляр класса CategoryService, который используется для работы с категориями.
     """
-    Функция для получения экземпляра класса UserRepository.
+    return container.category_service
 
-    Возвращает:
-    UserRepository: Экземпляр класса UserRepository, который используется для работы с пользователями в базе данных.
 
-    Примечание:
-    Эта функция используется для получения экземпляра класса UserRepository,
-    который используется для работы с пользователями в базе данных.
-    Экземпляр класса UserRepository создается с использованием фабрики асинхронных сессий async_session_factory.
+async def get_analytics_service(container: Annotated[Container, Depends(get_container)]) -> AnalyticsService:
     """
-    return UserRepository(session_factory=async_session_factory)
+    Функция для получения экземпляра класса AnalyticsService.
 
+    :return: AnalyticsService: Экземпляр класса AnalyticsService.
+    """
+    return container.analytics_service
 
-def get_token_service() -> TokenService:
-    """Функция для получения экземпляра класса TokenService."""
-    return TokenService(settings=Settings())
 
+async def get_pomodoro_session_service(
+        container: Annotated[Container, Depends(get_container)],
+) -> PomodoroSessionService:
+    """
+    Функция для получения экземпляра класса PomodoroSessionService.
 
-async def get_auth_service(
-        user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-        token_service: Annotated[TokenService, Depends(get_token_service)],
-) -> AuthService:
+    :return: PomodoroSessionService: Экземпляр класса PomodoroSessionService,
+     который используется для записи сессий помидоров.
     """
-    Функция для получения экземпляра класса AuthService.
+    return container.pomodoro_session_service
 
-    Параметры:
-    user_repository (Annotated[UserRepository, Depends(get_user_repository)]): Экземпляр класса UserRepository,
-    который используется для работы с пользователями в базе данных.
 
-    Возвращает:
-    AuthService: Экземпляр класса AuthService, который используется для работы с аутентификацией пользователей.
+async def get_user_repository(container: Annotated[Container, Depends(get_container)]) -> UserRepository:
+    """
+    Функция для получения экземпляра класса UserRepository.
 
-    Примечание:
-    Эта функция используется для получения экземпляра класса AuthService,
-    который используется для работы с аутентификацией пользователей.
-    Экземпляр класса UserRepository передается в качестве параметра функции и
-     используется для создания экземпляра класса AuthService.
+    :return: UserRepository: Экземпляр класса UserRepository,
+     который используется для работы с пользователями в базе данных.
     """
-    return AuthService(user_repository=user_repository, settings=Settings(), token_service=token_service)
+    return container.user_repository
 
 
-def get_user_service(
-        user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-        auth_service: Annotated[AuthService, Depends(get_auth_service)],
-) -> UserService:
+async def get_user_cache_repository(container: Annotated[Container, Depends(get_container)]) -> UserCacheRepository:
     """
-    Функция для получения экземпляра UserService.
+    Функция для получения экземпляра класса UserCacheRepository.
 
-    :param user_repository: Репозиторий пользователей.
-    :param auth_service: Сервис аутентификации.
-    :return: Экземпляр UserService.
+    :return: UserCacheRepository: Экземпляр класса UserCacheRepository, который используется
+     для работы с кэшем профилей пользователей.
     """
-    return UserService(user_repository=user_repository, auth_service=auth_service)
+    return container.user_cache_repository
 
 
-reusable_oauth2 = security.HTTPBearer()
+async def get_token_service(container: Annotated[Container, Depends(get_container)]) -> TokenService:
+    """Функция для получения экземпляра класса TokenService."""
+    return container.token_service
 
 
-async def get_request_user_id(
-        auth_service: Annotated[AuthService, Depends(get_auth_service)],
-        token: security.http.HTTPAuthorizationCredentials = Security(reusable_oauth2),  # noqa: B008
-) -> int:
+async def get_auth_service(container: Annotated[Container, Depends(get_container)]) -> AuthService:
     """
-    Функция для получения идентификатора пользователя из токена доступа.
+    Функция для получения экземпляра класса AuthService.
 
-    :param auth_service: Сервис аутентификации.
-    :param token: Объект с данными токена доступа.
-    :return: Идентификатор пользователя.
-    :raises HTTPException: Если токен некорректен или истек срок его действия.
+    :return: AuthService: Экземпляр класса AuthService, который используется для работы
+     с аутентификацией пользователей.
     """
-    try:
-        user_id = auth_service.get_user_id_from_access_token(token.credentials)
-    except TokenIsNotCorrectError as error:
-        # Обычно HTTPException вызывается на уровне handlers,
-        # но т.к. данный метод по Depends вызывается только там, в таком случае допускается.
-        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail=error.detail)
-    except TokenExpiredError as error:
-        raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail=error.detail)
-    return user_id
+    return container.auth_service
 
 
-def get_token_payload(
+async def get_user_service(container: Annotated[Container, Depends(get_container)]) -> UserService:
+    """
+    Функция для получения экземпляра UserService.
+
+    :return: Экземпляр UserService.
+    """
+    return container.user_service
+
+
+async def get_token_payload(
         token_service: Annotated[TokenService, Depends(get_token_service)],
         token: str = Depends(ouath2_bearer)
 ) -> dict:
     """
     Декодирует JWT-токен и возвращает полезную нагрузку.
 
+    Подпись повторно предъявляемого токена не проверяется заново: результат берется из кэша проверенных токенов.
+    Функция асинхронная, чтобы FastAPI не выполнял ее в пуле потоков: кэш проверенных токенов
+     рассчитан на доступ только из event loop.
     :param token_service:
     :param token: JWT-токен, переданный через зависимость OAuth2PasswordBearer.
     :return: Раскодированные данные токена.
     :raises InvalidAuthTokenError: Если токен некорректен.
     """
     try:
-        if decoded_payload := token_service.decode_jwt(token):
+        if decoded_payload := token_service.verify_jwt(token):
             return decoded_payload
     except InvalidTokenError as e:
         raise InvalidAuthTokenError(e)
     raise InvalidAuthTokenError
 
 
+async def get_request_user_id(
+        token_service: Annotated[TokenService, Depends(get_token_service)],
+        user_service: Annotated[UserService, Depends(get_user_service)],
+        payload: Annotated[dict, Depends(get_token_payload)],
+) -> int:
+    """
+    Функция для получения идентификатора активного пользователя из токена доступа.
+
+    Профиль пользователя берется из кэша профилей (при промахе - из базы данных) только для проверки
+    признака активности: токены деактивированного пользователя не принимаются.
+    :param token_service: Сервис токенов.
+    :param user_service: Сервис пользователей.
+    :param payload: Раскодированные данные токена.
+    :return: Идентификатор пользователя.
+    :raises InvalidAuthTokenError: Если токен некорректен или не является токеном доступа.
+    :raises UserIsNotExistsError: Если пользователь не найден.
+    :raises UserIsNotActiveError: Если пользователь неактивен.
+    """
+    token_service.validate_token_type(payload, token_service.settings.auth_jwt.access_token_type)
+    user = await user_service.get_user_by_token_sub(payload)
+    return user.id
+
+
 class UserGetterFromToken:
     """
     Класс для получения пользователя из токена.
@@ -36,3 +36,39 @@ class TaskNotFoundError(Exception):
     """Исключение, возникающее при отсутствии задачи."""
 
     detail = "Task not found"
+
+
+class TaskNameConflictError(Exception):
+    """Исключение, возникающее, когда у пользователя уже есть задача с таким именем."""
+
+    detail = "Task name is already used"
+
+
+class CategoryNotFoundError(Exception):
+    """Исключение, возникающее при отсутствии категории."""
+
+    detail = "Category not found"
+
+
+class CategoryInUseError(Exception):
+    """Исключение, возникающее при удалении категории, к которой относятся задачи."""
+
+    detail = "Category is used by tasks"
+
+
+class InvalidCursorError(Exception):
+    """Исключение, возникающее при передаче некорректного курсора пагинации."""
+
+    detail = "Pagination cursor is not correct"
+
+
+class PomodoroSessionQueueFullError(Exception):
+    """Исключение, возникающее при переполнении буфера записи сессий помидоров."""
+
+    detail = "Pomodoro session ingestion queue is full, retry later"
+
+
+class ExecutorSaturatedError(Exception):
+    """Исключение, возникающее, когда все потоки пула заняты, а очередь ожидающих вызовов заполнена."""
+
+    detail = "Server is busy, retry later"
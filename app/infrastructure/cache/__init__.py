@@ -1,3 +1,3 @@
-__all__ = ["get_redis_connection"]
+__all__ = ["create_redis_pool", "get_redis_connection"]
 
-from app.infrastructure.cache.accessor import get_redis_connection
+from app.infrastructure.cache.accessor import create_redis_pool, get_redis_connection
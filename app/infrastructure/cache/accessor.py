@@ -1,21 +1,64 @@
 from redis import asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 
+from app.infrastructure.cache.pool import InstrumentedConnectionPool
 from app.settings.main_settings import Settings
 
 settings = Settings()
 
 
-def get_redis_connection() -> redis.Redis:
+def create_redis_pool(settings: Settings = settings) -> InstrumentedConnectionPool:
+    """
+    Функция для создания пула соединений Redis.
+
+    Описание:
+    - Создает пул с ограничением количества соединений, таймаутами, проверкой простаивающих соединений
+     и повтором команд при таймауте из настроек.
+    - Пул создается один раз на процесс (в lifespan приложения) и закрывается при остановке.
+
+    Аргументы:
+    - settings: Настройки приложения. По умолчанию - настройки из файла settings.
+
+    Возвращает:
+    - Пул соединений Redis.
+    """
+    return InstrumentedConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            retry_on_timeout=settings.redis_retry_on_timeout,
+            retry=Retry(ExponentialBackoff(), settings.redis_retries),
+    )
+
+
+def get_redis_connection(
+        connection_pool: redis.ConnectionPool | None = None,
+        settings: Settings = settings
+) -> redis.Redis:
     """
     Функция для получения подключения к Redis.
 
     Описание:
-    - Создает подключение к Redis с использованием настроек из файла settings.
-    - Возвращает объект подключения к Redis.
+    - С connection_pool возвращает клиент, использующий общий пул. Закрытие такого клиента не закрывает пул.
+    - Без connection_pool создает клиент с собственным пулом с использованием настроек settings.
+     Так подключаются подписчики pub/sub: они держат соединение, пока слушают канал, и не должны
+     получать таймаут чтения, заданный для команд общего пула.
+
+    Аргументы:
+    - connection_pool: Общий пул соединений.
+    - settings: Настройки приложения. По умолчанию - настройки из файла settings.
 
     Возвращает:
     - Объект подключения к Redis.
     """
+    if connection_pool is not None:
+        return redis.Redis(connection_pool=connection_pool)
     redis_host = settings.redis_host
     redis_port = settings.redis_port
     redis_db = settings.redis_db
@@ -0,0 +1,29 @@
+"""Эндпоинты статистики пула соединений Redis."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_redis_pool, get_request_user_id
+from app.infrastructure.cache.pool import InstrumentedConnectionPool
+
+router = APIRouter(
+        prefix="/redis",
+        tags=["redis"],
+        dependencies=[Depends(get_request_user_id)],
+)
+
+
+@router.get("/pool/stats")
+async def get_redis_pool_stats(
+        redis_pool: Annotated[InstrumentedConnectionPool, Depends(get_redis_pool)],
+) -> dict:
+    """
+    Статистика общего пула соединений Redis. Доступна только с токеном доступа активного пользователя.
+
+    Возвращает:
+    - Размер пула, количество занятых и свободных соединений и команд, ожидающих соединения,
+     количество выданных соединений и ошибок получения, среднее и максимальное время получения соединения
+     в миллисекундах для текущего воркера.
+    """
+    return redis_pool.get_stats()
@@ -0,0 +1,108 @@
+"""Рассылка сообщений об инвалидации in-process кэшей между воркерами через Redis pub/sub."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from redis import asyncio as redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationListener:
+    """
+    Фоновый подписчик на канал инвалидации.
+
+    Каждый воркер запускает собственного подписчика при старте приложения.
+    Пока соединение с Redis разорвано, сообщения теряются, поэтому после каждого (пере)подключения
+    вызывается on_subscribe, который должен полностью очистить локальный кэш. Если on_message не смог
+    обработать сообщение (например, сообщение некорректно), ошибка записывается в лог, кэш так же очищается
+    через on_subscribe, и подписчик продолжает слушать канал.
+
+    Атрибуты:
+    redis (Redis): Объект подключения к Redis.
+    channel (str): Имя канала.
+    on_message (Callable[[bytes], None]): Обработчик сообщения.
+    on_subscribe (Callable[[], None]): Обработчик успешной подписки.
+    retry_delay (float): Пауза перед повторным подключением в секундах.
+    subscribed (asyncio.Event): Устанавливается после первой успешной подписки.
+
+    Методы:
+    start(self) -> None: Запускает подписчика в фоновой задаче.
+    wait_subscribed(self, timeout: float) -> bool: Ожидает первой успешной подписки.
+    stop(self) -> None: Останавливает подписчика и закрывает соединение с Redis.
+    """
+
+    def __init__(
+            self,
+            redis_session: redis.Redis,
+            channel: str,
+            on_message: Callable[[bytes], None],
+            on_subscribe: Callable[[], None],
+            retry_delay: float = 1.0
+    ):
+        self.redis = redis_session
+        self.channel = channel
+        self.on_message = on_message
+        self.on_subscribe = on_subscribe
+        self.retry_delay = retry_delay
+        self.subscribed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Запускает подписчика в фоновой задаче."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def wait_subscribed(
+            self,
+            timeout: float
+    ) -> bool:
+        """
+        Ожидает первой успешной подписки.
+
+        Кэш, заполненный до подписки, будет очищен в on_subscribe, поэтому предварительную загрузку
+        данных в кэш нужно выполнять после этого ожидания.
+        :param timeout: Максимальное время ожидания в секундах.
+        :return: True, если подписка выполнена, False, если Redis не ответил за timeout.
+        """
+        try:
+            await asyncio.wait_for(self.subscribed.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def stop(self) -> None:
+        """Останавливает подписчика и закрывает соединение с Redis."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.aclose()
+
+    async def _listen(self) -> None:
+        """Слушает канал, переподключаясь при ошибках Redis."""
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self.on_subscribe()
+                    self.subscribed.set()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._handle_message(message["data"])
+            except RedisError as error:
+                logger.warning("Cache invalidation channel %s is unavailable: %s", self.channel, error)
+            await asyncio.sleep(self.retry_delay)
+
+    def _handle_message(self, data: bytes) -> None:
+        """Передает сообщение в on_message. При ошибке обработчика очищает кэш, не останавливая подписчика."""
+        try:
+            self.on_message(data)
+        except Exception:
+            logger.exception("Failed to handle cache invalidation message %r on channel %s", data, self.channel)
+            self.on_subscribe()
@@ -0,0 +1,151 @@
+"""Ограниченный по размеру in-process кэш с вытеснением LRU и временем жизни записей."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    """
+    Счетчики обращений к кэшу.
+
+    Атрибуты:
+    hits (int): Количество попаданий.
+    misses (int): Количество промахов.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict:
+        """Возвращает счетчики и долю попаданий в виде словаря."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class MemoryCache:
+    """
+    Кэш в памяти процесса с вытеснением давно неиспользуемых записей (LRU) и временем жизни (TTL).
+
+    Кэш не потокобезопасен и рассчитан на использование из одного event loop.
+    Значения возвращаются без копирования, поэтому изменять их нельзя.
+
+    Счетчик epoch увеличивается при каждом удалении записей. Если значение читается из внешнего хранилища,
+    нужно запомнить epoch до чтения и передать его в set: если за время чтения пришла инвалидация,
+    прочитанное значение может быть устаревшим и не будет сохранено.
+
+    Атрибуты:
+    max_size (int): Максимальное количество записей.
+    ttl (float): Время жизни записи по умолчанию в секундах.
+    stats (CacheStats): Счетчики попаданий и промахов.
+    epoch (int): Количество инвалидаций кэша.
+
+    Методы:
+    get(self, key: Hashable) -> object | None: Получает значение по ключу.
+    set(self, key: Hashable, value: object, ttl: float | None = None, epoch: int | None = None) -> None:
+     Сохраняет значение.
+    delete(self, *keys: Hashable) -> None: Удаляет значения по ключам.
+    delete_matching(self, predicate: Callable[[object], bool]) -> int: Удаляет значения, подходящие под условие.
+    clear(self) -> None: Очищает кэш.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            ttl: float
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.epoch = 0
+        # Ключ -> (момент истечения по time.monotonic, значение). Порядок словаря - порядок использования.
+        self._data: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+
+    def get(
+            self,
+            key: Hashable
+    ) -> object | None:
+        """
+        Получает значение по ключу.
+
+        :param key: Ключ записи.
+        :return: Значение или None, если записи нет или ее время жизни истекло.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(
+            self,
+            key: Hashable,
+            value: object,
+            ttl: float | None = None,
+            epoch: int | None = None
+    ) -> None:
+        """
+        Сохраняет значение, при переполнении вытесняя самую давно использованную запись.
+
+        :param key: Ключ записи.
+        :param value: Значение.
+        :param ttl: Время жизни записи в секундах (по умолчанию - время жизни кэша).
+        :param epoch: Значение epoch до чтения значения из внешнего хранилища.
+        """
+        if self.max_size <= 0 or (epoch is not None and epoch != self.epoch):
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(
+            self,
+            *keys: Hashable
+    ) -> None:
+        """
+        Удаляет значения по ключам.
+
+        :param keys: Ключи записей.
+        """
+        self.epoch += 1
+        for key in keys:
+            self._data.pop(key, None)
+
+    def delete_matching(
+            self,
+            predicate: Callable[[object], bool]
+    ) -> int:
+        """
+        Удаляет значения, для которых predicate возвращает True. Просматривает все записи кэша.
+
+        :param predicate: Условие удаления значения.
+        :return: Количество удаленных записей.
+        """
+        self.epoch += 1
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self.epoch += 1
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Возвращает количество записей, включая истекшие, но еще не удаленные."""
+        return len(self._data)
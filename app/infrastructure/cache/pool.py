@@ -0,0 +1,85 @@
+"""
+Общий пул соединений Redis со статистикой загрузки.
+
+Пул ограничен max_connections: когда все соединения заняты, команда ждет освобождения соединения
+не дольше timeout секунд, а затем получает ConnectionError. Статистика показывает количество занятых
+и свободных соединений, ожидающих команд и время ожидания - по ней подбирается размер пула.
+"""
+
+import time
+from dataclasses import dataclass
+
+from redis.asyncio import BlockingConnectionPool
+from redis.exceptions import ConnectionError
+
+
+@dataclass
+class RedisPoolStats:
+    """
+    Счетчики получения соединений из пула.
+
+    Атрибуты:
+    acquired (int): Количество выданных соединений.
+    errors (int): Количество неудачных попыток получить соединение (пул исчерпан или Redis недоступен).
+    wait_seconds_total (float): Суммарное время получения соединения, включая неудачные попытки.
+    wait_seconds_max (float): Максимальное время получения соединения, включая неудачные попытки.
+    """
+
+    acquired: int = 0
+    errors: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Блокирующий пул соединений Redis, который считает время получения соединений.
+
+    Время получения включает ожидание свободного соединения и установку нового соединения.
+
+    Атрибуты:
+    stats (RedisPoolStats): Счетчики получения соединений.
+
+    Методы:
+    get_connection(self, *args, **kwargs) -> Connection: Получает соединение из пула.
+    get_stats(self) -> dict: Возвращает загрузку пула и счетчики.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = RedisPoolStats()
+        self._waiting = 0
+
+    async def get_connection(self, *args, **kwargs):  # noqa: ANN201
+        """Получает соединение из пула, ожидая освобождения соединения не дольше timeout секунд."""
+        started_at = time.monotonic()
+        self._waiting += 1
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except ConnectionError:
+            self.stats.errors += 1
+            raise
+        else:
+            self.stats.acquired += 1
+        finally:
+            self._waiting -= 1
+            wait_seconds = time.monotonic() - started_at
+            self.stats.wait_seconds_total += wait_seconds
+            self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, wait_seconds)
+        return connection
+
+    def get_stats(self) -> dict:
+        """Возвращает занятые, свободные соединения, ожидающие команды и время получения соединения в мс."""
+        attempts = self.stats.acquired + self.stats.errors or 1
+        return {
+            "max_connections": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "idle": len(self._available_connections),
+            "waiting": self._waiting,
+            "acquired": self.stats.acquired,
+            "errors": self.stats.errors,
+            "wait_ms": {
+                "avg": round(self.stats.wait_seconds_total / attempts * 1000, 3),
+                "max": round(self.stats.wait_seconds_max * 1000, 3),
+            },
+        }
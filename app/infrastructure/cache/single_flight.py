@@ -0,0 +1,45 @@
+"""Объединение одновременных одинаковых загрузок (single-flight) в пределах процесса."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Гарантирует, что для одного ключа одновременно выполняется не более одной загрузки.
+
+    Первый вызов с ключом запускает загрузку в отдельной задаче, остальные вызовы с тем же ключом
+    дожидаются ее результата (или исключения). Отмена одного из ожидающих запросов (например,
+    при разрыве соединения клиентом) не отменяет загрузку для остальных.
+
+    Методы:
+    do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T: Выполняет загрузку или присоединяется к ней.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+            self,
+            key: Hashable,
+            load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Выполняет загрузку или присоединяется к уже выполняющейся загрузке с тем же ключом.
+
+        :param key: Ключ загрузки.
+        :param load: Функция, выполняющая загрузку.
+        :return: Результат загрузки.
+        """
+        if (call := self._calls.get(key)) is None:
+            call = asyncio.ensure_future(load())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(call)
+
+    def __len__(self) -> int:
+        """Возвращает количество выполняющихся загрузок."""
+        return len(self._calls)
@@ -1,3 +1,3 @@
-from app.infrastructure.database.database import async_session_factory, Base, intpk
+from app.infrastructure.database.database import Base, create_database_engine, create_session_factory, intpk
 
-__all__ = ["async_session_factory", "Base", "intpk"]
+__all__ = ["Base", "create_database_engine", "create_session_factory", "intpk"]
@@ -4,11 +4,39 @@ from datetime import datetime
 from typing import Annotated
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Mapped, mapped_column
 
 from app.settings.main_settings import Settings
 
+
+def create_database_engine(settings: Settings) -> AsyncEngine:
+    """
+    Создает асинхронный движок SQLAlchemy с пулом соединений PostgreSQL.
+
+    :param settings: Настройки приложения.
+    :return: Движок.
+    """
+    return create_async_engine(
+            url=settings.async_database_dsn,  # dsn-url
+            echo=settings.debug,  # Echo отвечает, будут ли запросы выводиться в консоль
+            pool_size=5,  # Количество соединений
+            max_overflow=10,  # На сколько больше соединений можно открывать
+    )
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Создает фабрику асинхронных сессий.
+
+    Объекты, полученные через INSERT/UPDATE ... RETURNING, возвращаются из репозиториев уже после commit.
+    Без expire_on_commit=False их атрибуты сбрасываются при commit и не могут быть дозагружены вне сессии.
+    :param engine: Движок.
+    :return: Фабрика сессий.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
 settings = Settings()
 
 sync_engine = create_engine(
@@ -18,15 +46,7 @@ sync_engine = create_engine(
         max_overflow=10,  # На сколько больше соединений можно открывать
 )
 
-async_engine = create_async_engine(
-        url=settings.async_database_dsn,  # dsn-url
-        echo=settings.debug,  # Echo отвечает, будут ли запросы выводиться в консоль
-        pool_size=5,  # Количество соединений
-        max_overflow=10,  # На сколько больше соединений можно открывать
-)
-
 session_factory = sessionmaker(sync_engine)
-async_session_factory = async_sessionmaker(async_engine)
 
 
 # Если указать в Mapped данный тип поля, то оно будет являться первичным ключом
@@ -0,0 +1,169 @@
+"""
+Ограниченный пул потоков для CPU-емких операций (bcrypt, подпись JWT).
+
+Вызов bcrypt занимает десятки миллисекунд и, выполненный в обработчике, останавливает event loop
+вместе со всеми остальными запросами воркера. bcrypt и cryptography освобождают GIL на время вычислений,
+поэтому в пуле потоков они выполняются параллельно с event loop и друг с другом.
+
+Количество одновременно выполняемых операций ограничено числом потоков, а количество ожидающих - queue_size.
+Если очередь заполнена, вызов сразу завершается ExecutorSaturatedError: лучше быстро ответить 503, чем
+накапливать запросы, которые все равно не успеют выполниться до таймаута клиента.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from app.exceptions import ExecutorSaturatedError
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    """
+    Счетчики пула.
+
+    Атрибуты:
+    submitted (int): Количество принятых вызовов.
+    completed (int): Количество завершенных вызовов (в том числе с исключением).
+    rejected (int): Количество вызовов, отклоненных из-за заполненной очереди.
+    wait_seconds_total (float): Суммарное время ожидания свободного потока.
+    wait_seconds_max (float): Максимальное время ожидания свободного потока.
+    run_seconds_total (float): Суммарное время выполнения.
+    run_seconds_max (float): Максимальное время выполнения.
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+    run_seconds_max: float = 0.0
+
+
+class BoundedExecutor:
+    """
+    Пул потоков с ограниченной очередью.
+
+    Пул рассчитан на использование из одного event loop: счетчики изменяются только в нем.
+    Вызов занимает место в пуле, пока поток не завершит функцию, даже если ожидающая его корутина отменена.
+
+    Атрибуты:
+    name (str): Имя пула (префикс имен потоков).
+    workers (int): Количество потоков.
+    queue_size (int): Максимальное количество вызовов, ожидающих свободного потока.
+    stats (ExecutorStats): Счетчики пула.
+
+    Методы:
+    run(self, function: Callable[..., T], *args: object) -> T: Выполняет функцию в пуле.
+    shutdown(self) -> None: Дожидается выполняемых вызовов и останавливает потоки.
+    get_stats(self) -> dict: Возвращает загрузку и счетчики пула.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            workers: int,
+            queue_size: int
+    ):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.stats = ExecutorStats()
+        self._in_flight = 0
+        self._pool: ThreadPoolExecutor | None = None
+
+    async def run(
+            self,
+            function: Callable[..., T],
+            *args: object
+    ) -> T:
+        """
+        Выполняет функцию в пуле и возвращает ее результат.
+
+        :param function: Функция.
+        :param args: Аргументы функции.
+        :raise ExecutorSaturatedError: Если все потоки заняты и очередь заполнена.
+        :return: Результат функции.
+        """
+        if self._in_flight >= self.workers + self.queue_size:
+            self.stats.rejected += 1
+            raise ExecutorSaturatedError
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+        self._in_flight += 1
+        self.stats.submitted += 1
+        submitted_at = time.monotonic()
+        started_at = finished_at = None
+
+        def call() -> T:
+            nonlocal started_at, finished_at
+            started_at = time.monotonic()
+            try:
+                return function(*args)
+            finally:
+                finished_at = time.monotonic()
+
+        def release() -> None:
+            self._in_flight -= 1
+            self.stats.completed += 1
+            if started_at is not None:
+                self._record(started_at - submitted_at, finished_at - started_at)
+
+        loop = asyncio.get_running_loop()
+
+        def on_done(_: Future) -> None:
+            # Вызывается, когда поток завершил функцию или вызов отменен до запуска. Отмена ожидающей корутины
+            # не останавливает поток, поэтому место в пуле освобождается здесь, а не после await
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                # event loop уже закрыт (shutdown после остановки приложения)
+                release()
+
+        future = self._pool.submit(call)
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Дожидается выполняемых вызовов и останавливает потоки. При следующем вызове run пул создается заново."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def get_stats(self) -> dict:
+        """Возвращает загрузку пула, счетчики и время ожидания и выполнения вызовов в миллисекундах."""
+        completed = self.stats.completed or 1
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "running": min(self._in_flight, self.workers),
+            "queued": max(self._in_flight - self.workers, 0),
+            "submitted": self.stats.submitted,
+            "completed": self.stats.completed,
+            "rejected": self.stats.rejected,
+            "wait_ms": {
+                "avg": round(self.stats.wait_seconds_total / completed * 1000, 3),
+                "max": round(self.stats.wait_seconds_max * 1000, 3),
+            },
+            "run_ms": {
+                "avg": round(self.stats.run_seconds_total / completed * 1000, 3),
+                "max": round(self.stats.run_seconds_max * 1000, 3),
+            },
+        }
+
+    def _record(
+            self,
+            wait_seconds: float,
+            run_seconds: float
+    ) -> None:
+        """Учитывает время ожидания и выполнения вызова."""
+        self.stats.wait_seconds_total += wait_seconds
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, wait_seconds)
+        self.stats.run_seconds_total += run_seconds
+        self.stats.run_seconds_max = max(self.stats.run_seconds_max, run_seconds)
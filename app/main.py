@@ -1,8 +1,69 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app import all_routers
+from app.categories.local_cache import CATEGORIES_INVALIDATION_CHANNEL
+from app.container import Container
+from app.infrastructure.cache import get_redis_connection
+from app.infrastructure.cache.invalidation import CacheInvalidationListener
+from app.tasks.repository.local_cache import TASKS_INVALIDATION_CHANNEL
+from app.users.users_profile.local_cache import USERS_INVALIDATION_CHANNEL
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Жизненный цикл приложения.
+
+    - Создает контейнер объектов приложения (app.state.container), которые используются всеми запросами.
+    - Запускает подписчика на канал инвалидации in-process кэша задач.
+    - Загружает справочник категорий и запускает подписчика на канал его инвалидации.
+    - Запускает подписчика на канал инвалидации кэша профилей пользователей и проверенных токенов.
+    - Подбирает стоимость bcrypt под целевое время хэширования пароля.
+    - Запускает фоновую пакетную запись сессий помидоров. При остановке сначала записываются
+     все принятые сессии, и только потом закрываются соединения и останавливается пул потоков
+     для хэширования паролей и подписи токенов.
+    """
+    container = Container.create()
+    app.state.container = container
+    # Подписчики держат соединение Redis открытым, пока слушают канал, поэтому у каждого собственный клиент
+    # вне общего пула: соединение подписчика не занимает место в пуле и не получает таймаут чтения команд
+    tasks_invalidation_listener = CacheInvalidationListener(
+            get_redis_connection(settings=container.settings),
+            TASKS_INVALIDATION_CHANNEL,
+            on_message=container.task_cache_repository.handle_invalidation_message,
+            on_subscribe=container.task_cache_repository.local_cache.clear,
+    )
+    tasks_invalidation_listener.start()
+    categories_invalidation_listener = CacheInvalidationListener(
+            get_redis_connection(settings=container.settings),
+            CATEGORIES_INVALIDATION_CHANNEL,
+            on_message=container.category_cache_repository.handle_invalidation_message,
+            on_subscribe=container.category_cache_repository.local_cache.clear,
+    )
+    categories_invalidation_listener.start()
+    users_invalidation_listener = CacheInvalidationListener(
+            get_redis_connection(settings=container.settings),
+            USERS_INVALIDATION_CHANNEL,
+            on_message=container.user_service.handle_invalidation_message,
+            on_subscribe=container.user_cache_repository.local_cache.clear,
+    )
+    users_invalidation_listener.start()
+    await categories_invalidation_listener.wait_subscribed(timeout=5)
+    await container.category_service.preload()
+    await container.crypto_executor.run(container.password_hasher.calibrate)
+    container.pomodoro_session_writer.start()
+    yield
+    await container.pomodoro_session_writer.stop()
+    await tasks_invalidation_listener.stop()
+    await categories_invalidation_listener.stop()
+    await users_invalidation_listener.stop()
+    await container.aclose()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 for router in all_routers:
     app.include_router(router)
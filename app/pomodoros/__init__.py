@@ -0,0 +1,16 @@
+"""Сессии помидоров: прием пакетов сессий и их буферизованная запись в базу данных."""
+
+from app.pomodoros.models import PomodoroSessionModel
+from app.pomodoros.repository import PomodoroSessionRepository
+from app.pomodoros.schemas import PomodoroSessionCreateSchema, PomodoroSessionBatchAcceptedSchema
+from app.pomodoros.service import PomodoroSessionService
+from app.pomodoros.writer import PomodoroSessionWriter
+
+__all__ = [
+    "PomodoroSessionBatchAcceptedSchema",
+    "PomodoroSessionCreateSchema",
+    "PomodoroSessionModel",
+    "PomodoroSessionRepository",
+    "PomodoroSessionService",
+    "PomodoroSessionWriter",
+]
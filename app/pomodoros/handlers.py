@@ -0,0 +1,61 @@
+"""Эндпоинты приема сессий помидоров."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, HTTPException
+from starlette.status import HTTP_202_ACCEPTED, HTTP_404_NOT_FOUND, HTTP_503_SERVICE_UNAVAILABLE
+
+from app.dependencies import get_pomodoro_session_service, UserGetterFromToken
+from app.exceptions import TaskNotFoundError, PomodoroSessionQueueFullError
+from app.pomodoros import PomodoroSessionService, PomodoroSessionCreateSchema, PomodoroSessionBatchAcceptedSchema
+from app.settings.main_settings import Settings
+from app.users.users_profile import UserSchema
+
+settings = Settings()
+
+router = APIRouter(
+        prefix="/pomodoros",
+        tags=["pomodoros"],
+)
+
+
+@router.post("/sessions", response_model=PomodoroSessionBatchAcceptedSchema, status_code=HTTP_202_ACCEPTED)
+async def ingest_sessions(
+        body: Annotated[
+            list[PomodoroSessionCreateSchema],
+            Body(min_length=1, max_length=settings.pomodoro_sessions_batch_max_size),
+        ],
+        pomodoro_session_service: Annotated[PomodoroSessionService, Depends(get_pomodoro_session_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> PomodoroSessionBatchAcceptedSchema:
+    """
+    Запись пакета сессий помидоров.
+
+    Описание:
+    - Сессии принимаются в буфер и записываются в базу данных пакетами в фоне,
+     поэтому появляются в ней с задержкой до POMODORO_SESSIONS_FLUSH_INTERVAL секунд.
+    - Все задачи пакета должны принадлежать авторизованному пользователю.
+
+    Возвращает:
+    - Количество принятых сессий.
+    """
+    try:
+        accepted = await pomodoro_session_service.ingest_sessions(body, user.id)
+    except TaskNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    except PomodoroSessionQueueFullError as error:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=error.detail, headers={"Retry-After": "1"})
+    return PomodoroSessionBatchAcceptedSchema(accepted=accepted)
+
+
+@router.get("/sessions/ingestion/stats")
+async def get_ingestion_stats(
+        pomodoro_session_service: Annotated[PomodoroSessionService, Depends(get_pomodoro_session_service)],
+) -> dict:
+    """
+    Статистика буфера записи сессий текущего воркера.
+
+    Возвращает:
+    - Количество принятых, записанных и отброшенных сессий, количество COPY и текущую длину очереди.
+    """
+    return pomodoro_session_service.get_ingestion_stats()
@@ -0,0 +1,43 @@
+"""Модель сессии помидора."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database import Base
+
+
+class PomodoroSessionModel(Base):
+    """
+    Модель сессии помидора.
+
+    Строки добавляются пакетами через COPY (см. app.pomodoros.writer) и не изменяются.
+
+    Атрибуты:
+    id (Mapped[int]): Идентификатор сессии.
+    task_id (Mapped[int]): Идентификатор задачи.
+    user_id (Mapped[int]): Идентификатор пользователя.
+    started_at (Mapped[datetime]): Начало сессии.
+    finished_at (Mapped[datetime]): Окончание сессии.
+    """
+
+    __tablename__ = "pomodoro_sessions"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("user_profile.id", ondelete="CASCADE"))
+    started_at: Mapped[datetime]
+    finished_at: Mapped[datetime]
+
+    __table_args__ = (
+        Index(
+                "pomodoro_sessions_user_started_idx",
+                "user_id",
+                "started_at",
+        ),
+        Index(
+                "pomodoro_sessions_task_idx",
+                "task_id",
+        ),
+    )
@@ -0,0 +1,105 @@
+"""Запись и чтение сессий помидоров в базе данных."""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import TypeVar
+
+from sqlalchemy import select, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.pomodoros.models import PomodoroSessionModel
+from app.tasks.models import TaskModel
+
+T = TypeVar(
+        "T"
+)
+
+# Порядок значений в строках, передаваемых в copy_sessions
+POMODORO_SESSION_COPY_COLUMNS = ("task_id", "user_id", "started_at", "finished_at", "created_at", "updated_at")
+
+PomodoroSessionRecord = tuple[int, int, datetime, datetime, datetime, datetime]
+
+
+class PomodoroSessionRepository:
+    """
+    Класс для работы с сессиями помидоров в базе данных.
+
+    Атрибуты:
+    session_factory (Callable[[T], AsyncSession]): Фабрика асинхронных сессий.
+
+    Методы:
+    get_user_task_ids(self, user_id: int, task_ids: list[int]) -> set[int]: Отбирает задачи пользователя.
+    get_existing_task_ids(self, task_ids: list[int]) -> set[int]: Отбирает существующие задачи.
+    copy_sessions(self, records: list[PomodoroSessionRecord]) -> None: Записывает сессии через COPY.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[T], AsyncSession]
+    ):
+        self.session_factory = session_factory
+
+    async def get_user_task_ids(
+            self,
+            user_id: int,
+            task_ids: list[int]
+    ) -> set[int]:
+        """
+        Отбирает из переданных идентификаторов задачи, принадлежащие пользователю.
+
+        :param user_id: Идентификатор пользователя.
+        :param task_ids: Идентификаторы задач.
+        :return: Идентификаторы задач пользователя.
+        """
+        query = select(
+                TaskModel.id
+        ).where(
+                TaskModel.id == any_(bindparam("ids", task_ids, type_=ARRAY(Integer))),
+                TaskModel.user_id == user_id
+        )
+        async with self.session_factory() as session:
+            return set((await session.execute(query)).scalars().all())
+
+    async def get_existing_task_ids(
+            self,
+            task_ids: list[int]
+    ) -> set[int]:
+        """
+        Отбирает из переданных идентификаторов существующие задачи.
+
+        :param task_ids: Идентификаторы задач.
+        :return: Идентификаторы существующих задач.
+        """
+        query = select(
+                TaskModel.id
+        ).where(
+                TaskModel.id == any_(bindparam("ids", task_ids, type_=ARRAY(Integer)))
+        )
+        async with self.session_factory() as session:
+            return set((await session.execute(query)).scalars().all())
+
+    async def copy_sessions(
+            self,
+            records: list[PomodoroSessionRecord]
+    ) -> None:
+        """
+        Записывает сессии одним COPY через asyncpg.
+
+        Описание:
+        - copy_records_to_table передает строки в бинарном формате COPY без построения INSERT
+         и без параметров на каждую строку, поэтому пакет из тысяч строк записывается за один обмен с сервером.
+        - COPY выполняется атомарно: при ошибке (например, задача удалена) не записывается ни одна строка пакета.
+
+        Аргументы:
+        - records: Строки в порядке столбцов POMODORO_SESSION_COPY_COLUMNS.
+        """
+        async with self.session_factory() as session:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                    PomodoroSessionModel.__tablename__,
+                    records=records,
+                    columns=POMODORO_SESSION_COPY_COLUMNS,
+            )
+            await session.commit()
@@ -0,0 +1,58 @@
+"""Схемы запросов и ответов приема сессий помидоров."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, field_validator, model_validator
+
+
+class PomodoroSessionCreateSchema(BaseModel):
+    """
+    Схема записи сессии помидора.
+
+    Атрибуты:
+    task_id (int): Идентификатор задачи.
+    started_at (datetime): Начало сессии.
+    finished_at (datetime): Окончание сессии.
+    """
+
+    task_id: int
+    started_at: datetime
+    finished_at: datetime
+
+    # noinspection PyNestedDecorators
+    @field_validator("started_at", "finished_at")
+    @classmethod
+    def to_local_naive(cls, value: datetime) -> datetime:
+        """
+        Приводит время к локальному времени без часового пояса, как в остальных столбцах даты и времени.
+
+        Аргументы:
+        - value: Время, переданное клиентом.
+
+        Возвращает:
+        - Локальное время без часового пояса.
+        """
+        return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+    @model_validator(mode="after")
+    def finished_after_started(self) -> "PomodoroSessionCreateSchema":
+        """
+        Проверяет, что сессия заканчивается позже, чем начинается.
+
+        Возвращает:
+        - Модель после проверки.
+        """
+        if self.finished_at <= self.started_at:
+            raise ValueError("finished_at must be later than started_at")
+        return self
+
+
+class PomodoroSessionBatchAcceptedSchema(BaseModel):
+    """
+    Ответ на запись пакета сессий.
+
+    Атрибуты:
+    accepted (int): Количество сессий, принятых в буфер записи.
+    """
+
+    accepted: int
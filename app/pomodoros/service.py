@@ -0,0 +1,63 @@
+"""Сервис приема сессий помидоров."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.exceptions import TaskNotFoundError
+from app.pomodoros.repository import PomodoroSessionRepository
+from app.pomodoros.schemas import PomodoroSessionCreateSchema
+from app.pomodoros.writer import PomodoroSessionWriter
+
+
+@dataclass
+class PomodoroSessionService:
+    """
+    Класс для работы с сессиями помидоров.
+
+    Атрибуты:
+    pomodoro_session_repository (PomodoroSessionRepository): Репозиторий сессий помидоров.
+    pomodoro_session_writer (PomodoroSessionWriter): Общий для процесса буфер пакетной записи сессий.
+
+    Методы:
+    ingest_sessions(self, sessions: list[PomodoroSessionCreateSchema], user_id: int) -> int:
+     Принимает сессии на запись.
+    get_ingestion_stats(self) -> dict: Возвращает счетчики буфера записи.
+    """
+
+    pomodoro_session_repository: PomodoroSessionRepository
+    pomodoro_session_writer: PomodoroSessionWriter
+
+    async def ingest_sessions(
+            self,
+            sessions: list[PomodoroSessionCreateSchema],
+            user_id: int
+    ) -> int:
+        """
+        Принимает сессии пользователя на запись.
+
+        Описание:
+        - Одним запросом проверяет, что все задачи пакета принадлежат пользователю.
+        - Ставит сессии в очередь буфера записи. В базе данных они появятся после ближайшей записи пакета.
+
+        :param sessions: Сессии помидоров.
+        :param user_id: Идентификатор пользователя.
+        :raise TaskNotFoundError: Если хотя бы одна задача не существует или принадлежит другому пользователю.
+        :raise PomodoroSessionQueueFullError: Если буфер записи переполнен.
+        :return: Количество принятых сессий.
+        """
+        task_ids = list({session.task_id for session in sessions})
+        if len(await self.pomodoro_session_repository.get_user_task_ids(user_id, task_ids)) != len(task_ids):
+            raise TaskNotFoundError
+        now = datetime.now()
+        self.pomodoro_session_writer.submit(
+                [(session.task_id, user_id, session.started_at, session.finished_at, now, now) for session in sessions]
+        )
+        return len(sessions)
+
+    def get_ingestion_stats(self) -> dict:
+        """
+        Возвращает счетчики буфера записи текущего воркера.
+
+        :return: Словарь со счетчиками принятых, записанных и отброшенных сессий.
+        """
+        return self.pomodoro_session_writer.get_stats()
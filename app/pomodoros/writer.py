@@ -0,0 +1,171 @@
+"""
+Буферизованная запись сессий помидоров.
+
+Запросы только кладут строки в очередь процесса и сразу получают ответ. Фоновая задача забирает строки
+пакетами и записывает их одним COPY: пакет уходит, как только набрано flush_size строк
+или прошло flush_interval секунд с момента получения первой строки пакета.
+
+Гарантия доставки - не более одного раза: строки, не записанные из-за ошибки базы данных, отбрасываются
+(с записью в лог), а при аварийном завершении процесса теряется содержимое очереди.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from asyncpg.exceptions import ForeignKeyViolationError
+
+from app.exceptions import PomodoroSessionQueueFullError
+from app.pomodoros.repository import PomodoroSessionRepository, PomodoroSessionRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PomodoroSessionWriterStats:
+    """
+    Счетчики буфера записи.
+
+    Атрибуты:
+    accepted (int): Количество строк, принятых в очередь.
+    written (int): Количество записанных строк.
+    dropped (int): Количество строк, отброшенных из-за ошибок записи.
+    flushes (int): Количество выполненных COPY.
+    """
+
+    accepted: int = 0
+    written: int = 0
+    dropped: int = 0
+    flushes: int = 0
+
+
+class PomodoroSessionWriter:
+    """
+    Фоновая пакетная запись сессий помидоров.
+
+    Атрибуты:
+    repository (PomodoroSessionRepository): Репозиторий сессий помидоров.
+    flush_size (int): Максимальное количество строк в одном COPY.
+    flush_interval (float): Максимальное время ожидания неполного пакета в секундах.
+    queue (asyncio.Queue): Очередь строк, ожидающих записи.
+    stats (PomodoroSessionWriterStats): Счетчики буфера записи.
+
+    Методы:
+    submit(self, records: list[PomodoroSessionRecord]) -> None: Ставит строки в очередь записи.
+    start(self) -> None: Запускает фоновую запись.
+    stop(self) -> None: Записывает оставшиеся строки и останавливает фоновую запись.
+    get_stats(self) -> dict: Возвращает счетчики буфера записи.
+    """
+
+    def __init__(
+            self,
+            repository: PomodoroSessionRepository,
+            queue_size: int,
+            flush_size: int,
+            flush_interval: float
+    ):
+        self.repository = repository
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue[PomodoroSessionRecord | None] = asyncio.Queue(maxsize=queue_size)
+        self.stats = PomodoroSessionWriterStats()
+        self._task: asyncio.Task | None = None
+
+    def submit(
+            self,
+            records: list[PomodoroSessionRecord]
+    ) -> None:
+        """
+        Ставит строки в очередь записи.
+
+        Строки пакета принимаются либо все, либо ни одной.
+        :param records: Строки сессий.
+        :raise PomodoroSessionQueueFullError: Если в очереди нет места для всех строк.
+        """
+        if self.queue.maxsize - self.queue.qsize() < len(records):
+            raise PomodoroSessionQueueFullError
+        for record in records:
+            self.queue.put_nowait(record)
+        self.stats.accepted += len(records)
+
+    def start(self) -> None:
+        """Запускает фоновую запись."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Записывает все строки, уже находящиеся в очереди, и останавливает фоновую запись."""
+        if self._task is not None:
+            # None - признак остановки: он встает в очередь после всех принятых строк.
+            await self.queue.put(None)
+            await self._task
+            self._task = None
+
+    def get_stats(self) -> dict:
+        """Возвращает счетчики буфера записи и текущую длину очереди."""
+        return {
+            "accepted": self.stats.accepted,
+            "written": self.stats.written,
+            "dropped": self.stats.dropped,
+            "flushes": self.stats.flushes,
+            "queued": self.queue.qsize(),
+        }
+
+    async def _run(self) -> None:
+        """Собирает пакеты из очереди и записывает их, пока не получит признак остановки."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            record = await self.queue.get()
+            if record is None:
+                break
+            batch = [record]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.flush_size:
+                # Сначала забираем все, что уже лежит в очереди, и ждем только при пустой очереди.
+                if self.queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        record = await asyncio.wait_for(self.queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                else:
+                    record = self.queue.get_nowait()
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            await self._flush(batch)
+
+    async def _flush(
+            self,
+            batch: list[PomodoroSessionRecord]
+    ) -> None:
+        """
+        Записывает пакет строк.
+
+        Если задача была удалена, пока ее сессии ждали в очереди, COPY отклоняет весь пакет.
+        В этом случае сессии удаленных задач отбрасываются, а остальные записываются повторно.
+        :param batch: Строки сессий.
+        """
+        try:
+            try:
+                await self.repository.copy_sessions(batch)
+            except ForeignKeyViolationError:
+                existing_task_ids = await self.repository.get_existing_task_ids(
+                        list({record[0] for record in batch})
+                )
+                valid_records = [record for record in batch if record[0] in existing_task_ids]
+                self.stats.dropped += len(batch) - len(valid_records)
+                batch = valid_records
+                if batch:
+                    await self.repository.copy_sessions(batch)
+        except Exception:
+            logger.exception("Failed to write %s pomodoro sessions", len(batch))
+            self.stats.dropped += len(batch)
+            return
+        self.stats.written += len(batch)
+        self.stats.flushes += 1
+
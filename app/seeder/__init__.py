@@ -0,0 +1 @@
+"""Генерация и загрузка тестовых данных (python -m app.seeder)."""
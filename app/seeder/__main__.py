@@ -0,0 +1,44 @@
+"""
+Заполнение базы данных тестовыми данными для нагрузочного тестирования.
+
+ВНИМАНИЕ: удаляет всех пользователей, категории, задачи и связанные с ними данные.
+
+Запуск:
+    python -m app.seeder --users 1000000 --categories 200 --tasks 10000000 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+
+from app.seeder.generators import SeedConfig
+from app.seeder.loader import seed
+
+
+def main() -> None:
+    """Разбирает аргументы командной строки и запускает заполнение."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="строк в одном COPY")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="процессов генерации и загрузки")
+    parser.add_argument("--skew", type=float, default=0.8, help="показатель закона Ципфа, 0 - равномерно")
+    parser.add_argument("--days", type=int, default=365, help="глубина дат создания задач")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = SeedConfig(
+            users=args.users,
+            categories=args.categories,
+            tasks=args.tasks,
+            batch_size=args.batch_size,
+            skew=args.skew,
+            days=args.days,
+            seed=args.seed,
+    )
+    asyncio.run(seed(config, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Генерация тестовых данных пакетами.
+
+Значения генерируются столбцами вызовами random.choices(..., k=n) и затем собираются в строки для COPY.
+random.choices выполняет цикл на Python внутри модуля random (векторной генерации без numpy нет): пакет
+из ста тысяч задач генерируется примерно за 0,2 с, а пакеты генерируются параллельно в процессах загрузки.
+Faker используется только для небольшого словаря имен, поскольку вызов Faker на каждую строку на миллионах строк
+занимает десятки минут.
+
+Распределения близки к реальным:
+- количество задач на пользователя и популярность категорий подчиняются закону Ципфа
+ (пользователь или категория с меньшим идентификатором встречается чаще);
+- у большинства задач немного помидоров;
+- даты создания равномерно распределены по последним days дням.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
+
+from faker import Faker
+
+# Распределение количества помидоров в задаче: 1..16, чаще всего 1-4
+POMODORO_COUNTS = list(range(1, 17))
+POMODORO_COUNT_WEIGHTS = [1 / count for count in POMODORO_COUNTS]
+
+USER_COLUMNS = ("id", "username", "password", "email", "active", "created_at", "updated_at")
+CATEGORY_COLUMNS = ("id", "name", "type", "created_at", "updated_at")
+TASK_COLUMNS = ("id", "name", "pomodoro_count", "category_id", "user_id", "created_at", "updated_at")
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """
+    Параметры генерации.
+
+    Атрибуты:
+    users (int): Количество пользователей.
+    categories (int): Количество категорий.
+    tasks (int): Количество задач.
+    batch_size (int): Количество строк в одном пакете (одном COPY).
+    skew (float): Показатель закона Ципфа (0 - равномерное распределение).
+    days (int): Глубина дат создания задач в днях.
+    seed (int): Начальное значение генератора случайных чисел.
+    """
+
+    users: int
+    categories: int
+    tasks: int
+    batch_size: int = 50_000
+    skew: float = 0.8
+    days: int = 365
+    seed: int = 0
+
+
+@lru_cache
+def zipf_cum_weights(
+        size: int,
+        skew: float
+) -> list[float]:
+    """
+    Возвращает накопленные веса распределения Ципфа для random.choices.
+
+    Вычисляется один раз на процесс для каждой пары параметров.
+    :param size: Количество значений.
+    :param skew: Показатель распределения.
+    :return: Накопленные веса значений 1..size.
+    """
+    return list(accumulate(1 / rank ** skew for rank in range(1, size + 1)))
+
+
+@lru_cache
+def name_pool(seed: int) -> tuple[str, ...]:
+    """
+    Возвращает словарь имен задач и категорий.
+
+    :param seed: Начальное значение генератора Faker.
+    :return: Имена.
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    return tuple(fake.unique.catch_phrase() for _ in range(1000))
+
+
+def batch_random(
+        config: SeedConfig,
+        table: str,
+        start_id: int
+) -> random.Random:
+    """
+    Возвращает генератор случайных чисел пакета.
+
+    Генератор зависит только от параметров пакета, поэтому результат не зависит от количества процессов.
+    :param config: Параметры генерации.
+    :param table: Имя таблицы.
+    :param start_id: Первый идентификатор пакета.
+    :return: Генератор случайных чисел.
+    """
+    # Воспроизводимые тестовые данные, криптостойкость не нужна
+    return random.Random(f"{config.seed}:{table}:{start_id}")  # noqa: S311
+
+
+def generate_users(
+        config: SeedConfig,
+        start_id: int,
+        end_id: int,
+        password_hash: bytes,
+        now: datetime
+) -> list[tuple]:
+    """
+    Генерирует пользователей с идентификаторами [start_id, end_id).
+
+    У всех пользователей один и тот же хэш пароля: bcrypt на миллионах строк занял бы часы.
+    :param config: Параметры генерации.
+    :param start_id: Первый идентификатор.
+    :param end_id: Идентификатор, следующий за последним.
+    :param password_hash: Хэш пароля.
+    :param now: Время создания записей.
+    :return: Строки в порядке столбцов USER_COLUMNS.
+    """
+    rng = batch_random(config, "user_profile", start_id)
+    active = rng.choices((True, False), weights=(9, 1), k=end_id - start_id)
+    return [
+        (user_id, f"user{user_id}", password_hash, f"user{user_id}@example.com", is_active, now, now)
+        for user_id, is_active in zip(range(start_id, end_id), active, strict=True)
+    ]
+
+
+def generate_categories(
+        config: SeedConfig,
+        now: datetime
+) -> list[tuple]:
+    """
+    Генерирует все категории.
+
+    :param config: Параметры генерации.
+    :param now: Время создания записей.
+    :return: Строки в порядке столбцов CATEGORY_COLUMNS.
+    """
+    names = name_pool(config.seed)
+    return [
+        (category_id, f"{names[category_id % len(names)]} {category_id}", None, now, now)
+        for category_id in range(1, config.categories + 1)
+    ]
+
+
+def generate_tasks(
+        config: SeedConfig,
+        start_id: int,
+        end_id: int,
+        now: datetime
+) -> list[tuple]:
+    """
+    Генерирует задачи с идентификаторами [start_id, end_id).
+
+    Имя задачи содержит ее идентификатор, поэтому пара (name, user_id) уникальна, как того требует name_idx.
+    :param config: Параметры генерации.
+    :param start_id: Первый идентификатор.
+    :param end_id: Идентификатор, следующий за последним.
+    :param now: Время отсчета дат создания.
+    :return: Строки в порядке столбцов TASK_COLUMNS.
+    """
+    rng = batch_random(config, "tasks", start_id)
+    size = end_id - start_id
+    names = name_pool(config.seed)
+    user_ids = rng.choices(
+            range(1, config.users + 1),
+            cum_weights=zipf_cum_weights(config.users, config.skew),
+            k=size,
+    )
+    category_ids = rng.choices(
+            range(1, config.categories + 1),
+            cum_weights=zipf_cum_weights(config.categories, config.skew),
+            k=size,
+    )
+    pomodoro_counts = rng.choices(POMODORO_COUNTS, weights=POMODORO_COUNT_WEIGHTS, k=size)
+    name_indexes = rng.choices(range(len(names)), k=size)
+    span = config.days * 24 * 60 * 60
+    created_ats = [now - timedelta(seconds=rng.random() * span) for _ in range(size)]
+    return [
+        (task_id, f"{names[name_index]} #{task_id}", pomodoro_count, category_id, user_id, created_at, created_at)
+        for task_id, name_index, pomodoro_count, category_id, user_id, created_at in zip(
+                range(start_id, end_id), name_indexes, pomodoro_counts, category_ids, user_ids, created_ats,
+                strict=True,
+        )
+    ]
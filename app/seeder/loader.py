@@ -0,0 +1,205 @@
+"""
+Загрузка тестовых данных в PostgreSQL через COPY.
+
+Каждый пакет генерируется и записывается независимо (своим соединением asyncpg и своим COPY),
+поэтому пакеты одной таблицы могут выполняться параллельно в нескольких процессах.
+Идентификаторы задаются явно, после загрузки последовательности сдвигаются за максимальный идентификатор.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.analytics.repository import AnalyticsRepository
+from app.container import Container
+from app.seeder.generators import (
+    SeedConfig,
+    USER_COLUMNS,
+    CATEGORY_COLUMNS,
+    TASK_COLUMNS,
+    generate_users,
+    generate_categories,
+    generate_tasks,
+)
+from app.settings.main_settings import Settings
+
+settings = Settings()
+
+# Пароль всех сгенерированных пользователей (тестовые данные, не учетные данные)
+SEED_USER_PASSWORD = "password"  # noqa: S105
+
+
+@dataclass(frozen=True)
+class SeedBatch:
+    """
+    Пакет строк одной таблицы.
+
+    Атрибуты:
+    table (str): Имя таблицы.
+    start_id (int): Первый идентификатор.
+    end_id (int): Идентификатор, следующий за последним.
+    config (SeedConfig): Параметры генерации.
+    password_hash (bytes): Хэш пароля пользователей.
+    now (datetime): Время отсчета дат создания.
+    """
+
+    table: str
+    start_id: int
+    end_id: int
+    config: SeedConfig
+    password_hash: bytes
+    now: datetime
+
+
+def get_asyncpg_dsn() -> str:
+    """Возвращает строку подключения к PostgreSQL в формате asyncpg (без имени драйвера SQLAlchemy)."""
+    return make_url(settings.async_database_dsn).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def split_batches(
+        table: str,
+        count: int,
+        config: SeedConfig,
+        password_hash: bytes,
+        now: datetime
+) -> list[SeedBatch]:
+    """
+    Разбивает идентификаторы 1..count на пакеты по config.batch_size.
+
+    :param table: Имя таблицы.
+    :param count: Количество строк.
+    :param config: Параметры генерации.
+    :param password_hash: Хэш пароля пользователей.
+    :param now: Время отсчета дат создания.
+    :return: Пакеты.
+    """
+    return [
+        SeedBatch(table, start_id, min(start_id + config.batch_size, count + 1), config, password_hash, now)
+        for start_id in range(1, count + 1, config.batch_size)
+    ]
+
+
+async def copy_batch(batch: SeedBatch) -> int:
+    """
+    Генерирует пакет и записывает его одним COPY.
+
+    :param batch: Пакет.
+    :return: Количество записанных строк.
+    """
+    if batch.table == "user_profile":
+        columns = USER_COLUMNS
+        records = generate_users(batch.config, batch.start_id, batch.end_id, batch.password_hash, batch.now)
+    elif batch.table == "category":
+        columns = CATEGORY_COLUMNS
+        records = generate_categories(batch.config, batch.now)
+    else:
+        columns = TASK_COLUMNS
+        records = generate_tasks(batch.config, batch.start_id, batch.end_id, batch.now)
+    connection = await asyncpg.connect(get_asyncpg_dsn())
+    try:
+        # Тестовые данные можно потерять при сбое сервера, поэтому не ждем записи WAL на диск
+        await connection.execute("SET synchronous_commit = off")
+        await connection.copy_records_to_table(batch.table, records=records, columns=columns)
+    finally:
+        await connection.close()
+    return len(records)
+
+
+def copy_batch_in_process(batch: SeedBatch) -> int:
+    """
+    Точка входа пакета в процессе пула: у каждого процесса свой event loop и свои соединения.
+
+    :param batch: Пакет.
+    :return: Количество записанных строк.
+    """
+    return asyncio.run(copy_batch(batch))
+
+
+async def copy_batches(
+        batches: list[SeedBatch],
+        workers: int
+) -> int:
+    """
+    Записывает пакеты последовательно или параллельно в workers процессах.
+
+    :param batches: Пакеты.
+    :param workers: Количество процессов (1 - без пула, в текущем процессе).
+    :return: Количество записанных строк.
+    """
+    if workers <= 1:
+        return sum([await copy_batch(batch) for batch in batches])
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = await asyncio.gather(
+                *(loop.run_in_executor(pool, copy_batch_in_process, batch) for batch in batches)
+        )
+    return sum(counts)
+
+
+async def seed(
+        config: SeedConfig,
+        workers: int
+) -> None:
+    """
+    Полностью заменяет пользователей, категории и задачи сгенерированными данными.
+
+    Описание:
+    - Очищает user_profile, category, tasks и все ссылающиеся на них таблицы (TRUNCATE ... CASCADE).
+    - Загружает пользователей и категории, затем задачи (задачи ссылаются на них внешними ключами).
+     Пароль пользователей хэшируется со стоимостью bcrypt, которую приложение выберет при тех же настройках,
+     поэтому хэши не перехэшируются при первом входе.
+    - Сдвигает последовательности идентификаторов, пересчитывает сводные таблицы аналитики и статистику планировщика.
+    - Сбрасывает кэши задач, профилей пользователей и категорий в Redis и в памяти работающих воркеров:
+     идентификаторы использованы заново, и закэшированные данные старых строк относились бы к новым.
+
+    :param config: Параметры генерации.
+    :param workers: Количество процессов.
+    """
+    now = datetime.now()
+    container = Container.create(settings)
+    try:
+        container.password_hasher.calibrate()
+        password_hash = container.password_hasher.hash(SEED_USER_PASSWORD)
+        connection = await asyncpg.connect(get_asyncpg_dsn())
+        try:
+            await connection.execute("TRUNCATE user_profile, category, tasks RESTART IDENTITY CASCADE")
+
+            phases = [
+                ("user_profile", split_batches("user_profile", config.users, config, password_hash, now)),
+                ("category", [SeedBatch("category", 1, config.categories + 1, config, password_hash, now)]),
+                ("tasks", split_batches("tasks", config.tasks, config, password_hash, now)),
+            ]
+            for table, batches in phases:
+                started_at = time.perf_counter()
+                count = await copy_batches(batches, workers)
+                elapsed = time.perf_counter() - started_at
+                rate = count / max(elapsed, 1e-9)
+                print(f"{table}: {count} rows in {elapsed:.1f} s ({rate:.0f} rows/s)")  # noqa: T201
+
+            for table, _ in phases:
+                await connection.execute(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), max(id)) FROM {table}"
+                )
+        finally:
+            await connection.close()
+
+        await container.task_cache_repository.invalidate_all()
+        await container.user_cache_repository.invalidate_all()
+        await container.category_cache_repository.invalidate()
+
+        started_at = time.perf_counter()
+        await AnalyticsRepository(container.session_factory).rebuild_task_stats()
+        print(f"analytics rollups rebuilt in {time.perf_counter() - started_at:.1f} s")  # noqa: T201
+
+        connection = await asyncpg.connect(get_asyncpg_dsn())
+        try:
+            await connection.execute("ANALYZE")
+        finally:
+            await connection.close()
+    finally:
+        await container.aclose()
@@ -31,13 +31,22 @@ class AuthJWT(BaseModel):
 
     :param private_key_path: Путь к файлу с приватным ключом для подписания токенов.
     :param public_key_path: Путь к файлу с публичным ключом для проверки подписи токенов.
-    :param algorithm: Алгоритм шифрования для JWT-токенов (по умолчанию "RS256").
+    :param algorithm: Алгоритм подписи RSA-ключами (по умолчанию "RS256"). Для ключей Ed25519 и EC алгоритм
+     определяется ключом (EdDSA, ES256).
     :param access_token_expire_minutes: Время жизни токена доступа в минутах (по умолчанию 3).
+    :param previous_public_key_paths: Открытые ключи, которыми еще проверяются токены после смены ключа подписи
+     (отсутствующие файлы пропускаются).
+    :param keys_reload_interval: Интервал проверки файлов ключей на изменение в секундах.
+    :param keys_unknown_kid_check_interval: Минимальный интервал внеочередной проверки файлов ключей
+     из-за токена с неизвестным kid в секундах.
     """
 
     private_key_path: Annotated[Path, Field(validate_default=True)] = BASE_DIR / "cert" / "jwt-private.pem"
     public_key_path: Annotated[Path, Field(validate_default=True)] = BASE_DIR / "cert" / "jwt-public.pem"
     algorithm: str = "RS256"
+    previous_public_key_paths: list[Path] = [BASE_DIR / "cert" / "jwt-public-previous.pem"]
+    keys_reload_interval: float = 5.0
+    keys_unknown_kid_check_interval: float = 1.0
 
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 30
@@ -35,11 +35,81 @@ class Settings(BaseSettings):
     redis_host: str = Field(..., alias="REDIS_HOST")
     redis_port: int = Field(..., alias="REDIS_PORT")
     redis_db: int = Field(..., alias="REDIS_DB")
+    # Общий пул соединений Redis: максимальное количество соединений и время ожидания свободного соединения,
+    # таймауты чтения и подключения, интервал проверки простаивающего соединения (PING перед использованием)
+    # в секундах, повтор команды при таймауте и количество повторов с экспоненциальной паузой
+    redis_max_connections: int = Field(50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: float = Field(2.0, alias="REDIS_POOL_TIMEOUT")
+    redis_socket_timeout: float = Field(2.0, alias="REDIS_SOCKET_TIMEOUT")
+    redis_socket_connect_timeout: float = Field(2.0, alias="REDIS_SOCKET_CONNECT_TIMEOUT")
+    redis_health_check_interval: float = Field(30, alias="REDIS_HEALTH_CHECK_INTERVAL")
+    redis_retry_on_timeout: bool = Field(True, alias="REDIS_RETRY_ON_TIMEOUT")
+    redis_retries: int = Field(3, alias="REDIS_RETRIES")
 
     jwt_secret_key: SecretStr = Field(..., alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(..., alias="JWT_ALGORITHM")
     jwt_token_lifetime: int = Field(..., alias="jwt_token_lifetime")
 
+    # Размер страницы для keyset-пагинации задач по умолчанию и максимально допустимый
+    tasks_page_size: int = Field(50, alias="TASKS_PAGE_SIZE")
+    tasks_page_max_size: int = Field(500, alias="TASKS_PAGE_MAX_SIZE")
+    # Количество строк, читаемых серверным курсором и отдаваемых одним блоком при выгрузке задач
+    tasks_export_chunk_size: int = Field(1000, alias="TASKS_EXPORT_CHUNK_SIZE")
+    # Максимальное количество задач в одном запросе массового создания.
+    # Все задачи вставляются одним INSERT, а PostgreSQL допускает не более 32767 параметров (6 на задачу)
+    tasks_bulk_max_size: int = Field(500, alias="TASKS_BULK_MAX_SIZE")
+    # Максимальное количество задач в одном запросе массового удаления/переименования
+    # и количество задач в одном SQL-запросе, на которые разбивается такой запрос
+    tasks_bulk_change_max_size: int = Field(10000, alias="TASKS_BULK_CHANGE_MAX_SIZE")
+    tasks_bulk_chunk_size: int = Field(1000, alias="TASKS_BULK_CHUNK_SIZE")
+    # Количество результатов поиска задач по умолчанию и максимально допустимое
+    tasks_search_limit: int = Field(20, alias="TASKS_SEARCH_LIMIT")
+    tasks_search_max_limit: int = Field(100, alias="TASKS_SEARCH_MAX_LIMIT")
+    # Время жизни кэша задач в секундах. Актуальность обеспечивается поколениями ключей, а не TTL
+    tasks_cache_ttl: int = Field(6 * 60 * 60, alias="TASKS_CACHE_TTL")
+    # Размер и время жизни записей in-process кэша задач, расположенного перед Redis
+    tasks_local_cache_size: int = Field(1024, alias="TASKS_LOCAL_CACHE_SIZE")
+    tasks_local_cache_ttl: float = Field(30, alias="TASKS_LOCAL_CACHE_TTL")
+    # Формат хранения списков задач в Redis: "json" или "msgpack" (требует пакета msgpack)
+    tasks_cache_codec: str = Field("json", alias="TASKS_CACHE_CODEC")
+
+    # Время жизни in-process кэша категорий в секундах. Актуальность обеспечивается инвалидацией при изменении
+    # категорий, TTL лишь ограничивает время жизни устаревших данных, если сообщение инвалидации потеряно
+    categories_cache_ttl: float = Field(300, alias="CATEGORIES_CACHE_TTL")
+
+    # In-process кэш профилей пользователей, которые загружаются на каждом запросе с токеном: максимальное
+    # количество профилей и время жизни записи в секундах. Изменения профиля сбрасывают кэш явно,
+    # TTL лишь ограничивает время жизни устаревших данных, если сообщение инвалидации потеряно
+    users_cache_size: int = Field(10_000, alias="USERS_CACHE_SIZE")
+    users_cache_ttl: float = Field(30, alias="USERS_CACHE_TTL")
+
+    # Максимальное количество сессий помидоров в одном запросе на запись
+    pomodoro_sessions_batch_max_size: int = Field(1000, alias="POMODORO_SESSIONS_BATCH_MAX_SIZE")
+    # Буфер сессий перед записью в PostgreSQL: емкость очереди (при переполнении запрос получает 503),
+    # количество строк в одном COPY и максимальное время ожидания неполного пакета в секундах
+    pomodoro_sessions_queue_size: int = Field(100_000, alias="POMODORO_SESSIONS_QUEUE_SIZE")
+    pomodoro_sessions_flush_size: int = Field(5000, alias="POMODORO_SESSIONS_FLUSH_SIZE")
+    pomodoro_sessions_flush_interval: float = Field(1.0, alias="POMODORO_SESSIONS_FLUSH_INTERVAL")
+
+    # Кэш проверенных JWT: максимальное количество токенов и время жизни записи в секундах.
+    # Запись живет не дольше срока действия токена, а ttl ограничивает время, в течение которого
+    # другие воркеры принимают токен, отозванный в одном из воркеров
+    jwt_verified_cache_size: int = Field(10_000, alias="JWT_VERIFIED_CACHE_SIZE")
+    jwt_verified_cache_ttl: float = Field(300, alias="JWT_VERIFIED_CACHE_TTL")
+
+    # Пул потоков для хэширования паролей bcrypt и подписи JWT: количество потоков и количество вызовов,
+    # ожидающих свободного потока. Когда очередь заполнена, вход и регистрация сразу получают 503
+    crypto_executor_workers: int = Field(4, alias="CRYPTO_EXECUTOR_WORKERS")
+    crypto_executor_queue_size: int = Field(64, alias="CRYPTO_EXECUTOR_QUEUE_SIZE")
+
+    # Стоимость bcrypt подбирается при запуске так, чтобы хэширование пароля занимало не больше
+    # BCRYPT_TARGET_SECONDS, в пределах от BCRYPT_MIN_ROUNDS до BCRYPT_MAX_ROUNDS. BCRYPT_ROUNDS задает стоимость
+    # явно, без замера: так все воркеры и серверы используют одинаковую стоимость
+    bcrypt_target_seconds: float = Field(0.25, alias="BCRYPT_TARGET_SECONDS")
+    bcrypt_min_rounds: int = Field(10, alias="BCRYPT_MIN_ROUNDS")
+    bcrypt_max_rounds: int = Field(16, alias="BCRYPT_MAX_ROUNDS")
+    bcrypt_rounds: int | None = Field(None, alias="BCRYPT_ROUNDS")
+
     auth_jwt: AuthJWT = AuthJWT()
 
     # Свойства, которые генерируют URL-адреса подключения к PostgreSQL с использованием разных драйверов
@@ -1,7 +1,14 @@
 from app.tasks.models import TaskModel, CategoryModel
 from app.tasks.repository.cache_repository import TaskCacheRepository
 from app.tasks.repository.repository import TaskRepository
-from app.tasks.schemas import TaskSchema, TaskCreateSchema, CategorySchema
+from app.tasks.schemas import (
+    TaskSchema,
+    TaskCreateSchema,
+    CategorySchema,
+    CategoryCreateSchema,
+    TaskPageSchema,
+    TaskBulkOutcomeSchema,
+)
 from app.tasks.service import TaskService
 
 __all__ = [
@@ -11,6 +18,9 @@ __all__ = [
     "CategoryModel",
     "TaskCreateSchema",
     "CategorySchema",
+    "CategoryCreateSchema",
     "TaskSchema",
+    "TaskPageSchema",
+    "TaskBulkOutcomeSchema",
     "TaskService",
 ]
@@ -2,13 +2,15 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from starlette.status import HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST, HTTP_409_CONFLICT
 
-from app.dependencies import get_tasks_service, get_request_user_id, UserGetterFromToken
-from app.exceptions import TaskNotFoundError
+from app.categories import CategoryService
+from app.dependencies import get_tasks_service, get_category_service, get_request_user_id, UserGetterFromToken
+from app.exceptions import TaskNotFoundError, InvalidCursorError, CategoryNotFoundError, TaskNameConflictError
 from app.settings.main_settings import Settings
-from app.tasks import TaskSchema, TaskCreateSchema, TaskService
+from app.tasks import TaskSchema, TaskCreateSchema, TaskService, TaskPageSchema, TaskBulkOutcomeSchema
 from app.users.users_profile import UserSchema
 
 settings = Settings()
@@ -22,22 +24,63 @@ router = APIRouter(
 )
 
 
-@router.get("/all", response_model=list[TaskSchema])
+@router.get("/all", response_model=TaskPageSchema)
 async def get_tasks(
         task_service: Annotated[TaskService, Depends(get_tasks_service)],
-) -> list[TaskSchema] | None:
+        limit: Annotated[int, Query(ge=1, le=settings.tasks_page_max_size)] = settings.tasks_page_size,
+        cursor: str | None = None,
+) -> TaskPageSchema:
     """
-    Получение всех задач.
+    Получение страницы задач.
 
     Описание:
-    - Выполняет запрос на выборку всех задач из базы данных.
-    - Возвращает список моделей TaskModel.
+    - Выполняет keyset-выборку задач, отсортированных по идентификатору.
+    - Для получения следующей страницы нужно передать next_cursor из предыдущего ответа.
+
+    Аргументы:
+    - limit: Размер страницы.
+    - cursor: Курсор следующей страницы.
+
+    Возвращает:
+    - Страницу задач и курсор следующей страницы (None, если страница последняя).
+    """
+    try:
+        page = await task_service.get_tasks(limit, cursor)
+    except InvalidCursorError as error:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=error.detail)
+    return page
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        user_id: Annotated[int, Depends(get_request_user_id)],
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка задач авторизованного пользователя в формате NDJSON.
+
+    Описание:
+    - Задачи читаются из базы серверным курсором и отдаются клиенту по мере получения.
+    - Каждая строка ответа - отдельная задача в формате JSON.
+    - Выгружаются только задачи пользователя из токена доступа.
+    """
+    return StreamingResponse(
+            task_service.export_tasks(settings.tasks_export_chunk_size, user_id),
+            media_type="application/x-ndjson",
+    )
+
+
+@router.get("/cache/stats", dependencies=[Depends(get_request_user_id)])
+async def get_tasks_cache_stats(
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+) -> dict:
+    """
+    Статистика кэша задач. Доступна только с токеном доступа активного пользователя.
 
     Возвращает:
-    - Список моделей TaskModel.
+    - Количество попаданий и промахов in-process кэша (local) и Redis (redis) текущего воркера.
     """
-    all_tasks = await task_service.get_tasks()
-    return all_tasks
+    return task_service.get_cache_stats()
 
 
 @router.post("/", response_model=TaskSchema)
@@ -57,6 +100,33 @@ async def create_task(
     return task
 
 
+@router.post("/bulk", response_model=list[TaskSchema])
+async def create_tasks(
+        body: Annotated[list[TaskCreateSchema], Body(min_length=1, max_length=settings.tasks_bulk_max_size)],
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> list[TaskSchema]:
+    """
+    Массовое создание задач.
+
+    Описание:
+    - Создает все задачи одним запросом в одной транзакции.
+    - Размер пакета ограничен настройкой TASKS_BULK_MAX_SIZE.
+    - Имена задач должны быть уникальны в запросе и среди задач пользователя, иначе ответ 409
+     и ни одна задача не создается.
+
+    :param body: Список задач.
+    :param task_service: Сервис работы с задачами.
+    :param user: Авторизованный пользователь.
+    :return: Созданные задачи.
+    """
+    try:
+        tasks = await task_service.create_tasks(body, user.id)
+    except TaskNameConflictError as error:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=error.detail)
+    return tasks
+
+
 @router.get("/name/{task_name}", response_model=TaskSchema)
 async def get_task_by_name(
         task_name: str,
@@ -83,6 +153,79 @@ async def get_task_by_name(
     return task
 
 
+@router.get("/search", response_model=list[TaskSchema])
+async def search_tasks(
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        q: Annotated[str, Query(min_length=3, max_length=255)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+        limit: Annotated[int, Query(ge=1, le=settings.tasks_search_max_limit)] = settings.tasks_search_limit,
+) -> list[TaskSchema]:
+    """
+    Поиск задач авторизованного пользователя по имени.
+
+    Описание:
+    - Находит задачи, имя которых содержит строку поиска или похожее на нее слово (опечатки, другие окончания).
+    - Поиск выполняется по триграммному индексу, поэтому строка поиска должна содержать не менее трех символов.
+
+    Аргументы:
+    - q: Строка поиска.
+    - limit: Максимальное количество результатов.
+
+    Возвращает:
+    - Найденные задачи: сначала начинающиеся со строки поиска, затем по убыванию похожести.
+    """
+    tasks = await task_service.search_user_tasks(user.id, q, limit)
+    return tasks
+
+
+@router.get("/category/{category_id}", response_model=list[TaskSchema])
+async def get_tasks_by_category_id(
+        category_id: int,
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+) -> list[TaskSchema]:
+    """
+    Получение задач категории.
+
+    Аргументы:
+    - category_id: Идентификатор категории.
+
+    Возвращает:
+    - Задачи категории, отсортированные по идентификатору.
+    """
+    try:
+        category = await category_service.get_category(category_id)
+    except CategoryNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    return await task_service.get_tasks_by_category_ids([category.id])
+
+
+@router.get("/category/name/{category_name}", response_model=list[TaskSchema])
+async def get_tasks_by_category_name(
+        category_name: str,
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        category_service: Annotated[CategoryService, Depends(get_category_service)],
+) -> list[TaskSchema]:
+    """
+    Получение задач по имени категории.
+
+    Описание:
+    - Имя преобразуется в идентификаторы категорий по справочнику в памяти процесса,
+     после чего задачи выбираются одним запросом по индексу на category_id.
+
+    Аргументы:
+    - category_name: Имя категории.
+
+    Возвращает:
+    - Задачи всех категорий с этим именем, отсортированные по идентификатору.
+    """
+    try:
+        category_ids = await category_service.get_category_ids_by_name(category_name)
+    except CategoryNotFoundError as error:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=error.detail)
+    return await task_service.get_tasks_by_category_ids(category_ids)
+
+
 @router.get("/id/{task_id}", response_model=TaskSchema)
 async def get_task_by_id(
         task_id: int,
@@ -139,6 +282,51 @@ async def get_user_tasks(
     return task
 
 
+@router.patch("/bulk", response_model=list[TaskBulkOutcomeSchema])
+async def update_task_names(
+        body: Annotated[dict[int, str], Body(min_length=1, max_length=settings.tasks_bulk_change_max_size)],
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> list[TaskBulkOutcomeSchema]:
+    """
+    Массовое переименование задач.
+
+    Описание:
+    - Принимает новые имена задач по их идентификаторам.
+    - Переименовывает только задачи авторизованного пользователя.
+    - Новые имена должны быть уникальны в запросе и не заняты другими задачами пользователя, иначе ответ 409
+     и ни одна задача не переименовывается.
+
+    Возвращает:
+    - Результат по каждой задаче: "updated" с обновленной задачей или "not_found".
+    """
+    try:
+        outcomes = await task_service.update_task_names(body, user.id, settings.tasks_bulk_chunk_size)
+    except TaskNameConflictError as error:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=error.detail)
+    return outcomes
+
+
+@router.post("/bulk/delete", response_model=list[TaskBulkOutcomeSchema])
+async def delete_tasks(
+        body: Annotated[list[int], Body(min_length=1, max_length=settings.tasks_bulk_change_max_size)],
+        task_service: Annotated[TaskService, Depends(get_tasks_service)],
+        user: Annotated[UserSchema, Depends(UserGetterFromToken(settings.auth_jwt.access_token_type))],
+) -> list[TaskBulkOutcomeSchema]:
+    """
+    Массовое удаление задач.
+
+    Описание:
+    - Принимает список идентификаторов задач.
+    - Удаляет только задачи авторизованного пользователя.
+
+    Возвращает:
+    - Результат по каждой задаче: "deleted" или "not_found".
+    """
+    outcomes = await task_service.delete_tasks(body, user.id, settings.tasks_bulk_chunk_size)
+    return outcomes
+
+
 @router.patch("/{task_id}", response_model=TaskSchema)
 async def _update_task_name(
         task_id: int,
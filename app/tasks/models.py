@@ -72,4 +72,18 @@ class TaskModel(Base):
                 "user_id",
                 unique=True
         ),
+        # Индекс для выборки задач по категориям
+        Index(
+                "tasks_category_idx",
+                "category_id",
+        ),
+        # Триграммный индекс для нечеткого поиска по имени в задачах одного пользователя.
+        # Требует расширений pg_trgm (gin_trgm_ops) и btree_gin (user_id в GIN-индексе), см. README.
+        Index(
+                "tasks_user_name_trgm_idx",
+                "user_id",
+                "name",
+                postgresql_using="gin",
+                postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
@@ -0,0 +1,46 @@
+"""
+Keyset-пагинация задач.
+
+Курсор - это непрозрачная для клиента строка (urlsafe base64 от JSON),
+внутри которой хранится идентификатор последней отданной задачи.
+Следующая страница выбирается условием `id > :last_id ORDER BY id LIMIT :limit`,
+поэтому запрос всегда идет по индексу первичного ключа и не зависит от номера страницы.
+"""
+
+import base64
+import binascii
+import json
+
+from app.exceptions import InvalidCursorError
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Кодирует идентификатор последней задачи страницы в курсор.
+
+    :param last_id: Идентификатор последней задачи на странице.
+    :return: Непрозрачный курсор.
+    """
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """
+    Декодирует курсор в идентификатор последней задачи предыдущей страницы.
+
+    :param cursor: Курсор, полученный клиентом в поле next_cursor.
+    :return: Идентификатор задачи или None, если курсор не передан (первая страница).
+    :raises InvalidCursorError: Если курсор не удалось разобрать.
+    """
+    if not cursor:
+        return None
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        last_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorError
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError
+    return last_id
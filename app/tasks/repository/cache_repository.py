@@ -1,160 +1,458 @@
-import json
-
 from redis import asyncio as Redis  # noqa: N812
 
-from app.tasks.schemas import TaskSchema
+from app.infrastructure.cache.memory import MemoryCache, CacheStats
+from app.tasks.repository.codecs import TaskListCodec, JsonTaskListCodec
+from app.tasks.repository.local_cache import TASKS_INVALIDATION_CHANNEL
+from app.tasks.schemas import TaskSchema, TaskPageSchema
+
+
+# Заполняет хэш задач пользователя, если поколение не изменилось с момента чтения из базы.
+# KEYS: поколение пользователя, хэш задач. ARGV: ожидаемое поколение, TTL, id1, задача1, id2, задача2, ...
+FILL_USER_TASKS_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DEL', KEYS[2])
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+# Увеличивает поколения, обновляет поле хэша задач пользователя (если хэш заполнен) и публикует инвалидацию.
+# KEYS: поколение пользователя, поколение общего списка, хэш задач. ARGV: id, задача, канал, id пользователя.
+SET_USER_TASK_SCRIPT = """
+redis.call('INCR', KEYS[1])
+redis.call('INCR', KEYS[2])
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    redis.call('HSET', KEYS[3], ARGV[1], ARGV[2])
+end
+redis.call('PUBLISH', ARGV[3], ARGV[4])
+"""
 
 
 class TaskCacheRepository:
     """
     Класс для работы с кэшем задач в Redis.
 
+    Схема ключей:
+    - "tasks:v3:gen:all" - поколение кэша общего списка задач.
+    - "tasks:v3:gen:user:{user_id}" - поколение кэша задач пользователя.
+    - "tasks:v3:pages:g{generation}:{codec}" - хэш страниц общего списка задач.
+    - "tasks:v3:user:{user_id}:{codec}" - хэш задач пользователя: поле - идентификатор задачи,
+     значение - задача в формате codec.
+
+    Любое изменение задач увеличивает счетчики поколений. Страницы общего списка читаются по ключу
+    нового поколения, а данные старых поколений удаляются Redis по истечении TTL.
+    Хэш задач пользователя обновляется на месте: создание, изменение и удаление задачи затрагивают одно поле,
+    а поколение пользователя защищает от записи в кэш данных, прочитанных из базы до изменения.
+    Поэтому TTL не влияет на актуальность данных и может быть большим.
+
+    Перед Redis может располагаться in-process кэш (L1), в котором хранятся как поколения,
+    так и уже разобранные данные. Инвалидация L1 в других воркерах выполняется через pub/sub.
+
     Атрибуты:
     redis (Redis): Объект подключения к Redis.
+    ttl (int): Время жизни закэшированных данных в секундах.
+    local_cache (MemoryCache | None): In-process кэш, расположенный перед Redis.
+    redis_stats (CacheStats): Счетчики попаданий и промахов данных в Redis.
+    codec (TaskListCodec): Формат хранения списков задач.
 
     Методы:
-    get_tasks(self) -> list[TaskSchema] | None: Получает список задач из Redis.
-    set_tasks(self, tasks: list[TaskSchema]) -> None: Сохраняет список задач в Redis.
+    get_tasks_generation(self) -> int: Получает поколение кэша общего списка задач.
+    get_user_tasks_generation(self, user_id: int) -> int: Получает поколение кэша задач пользователя.
+    get_tasks_page(self, generation: int, after_id: int | None, limit: int) -> TaskPageSchema | None:
+     Получает страницу задач из Redis.
+    set_tasks_page(self, generation: int, after_id: int | None, limit: int, page: TaskPageSchema) -> None:
+     Сохраняет страницу задач.
+    get_user_tasks(self, user_id: int, generation: int) -> list[TaskSchema] | None: Получает задачи пользователя.
+    set_user_tasks(self, user_id: int, generation: int, tasks: list[TaskSchema]) -> None:
+     Сохраняет задачи пользователя.
+    set_user_task(self, task: TaskSchema) -> None: Сохраняет созданную или измененную задачу.
+    delete_user_task(self, user_id: int, task_id: int) -> None: Удаляет задачу из кэша.
+    invalidate_user_tasks(self, user_id: int) -> None: Сбрасывает кэш задач пользователя и общего списка.
+    invalidate_all(self) -> None: Сбрасывает кэш задач всех пользователей.
+    drop_local_user_tasks(self, user_id: int) -> None: Удаляет поколения пользователя и общего списка из L1.
+    handle_invalidation_message(self, message: bytes) -> None: Обрабатывает сообщение канала инвалидации.
+    get_stats(self) -> dict: Возвращает счетчики попаданий и промахов по уровням кэша.
     """
 
+    # Префикс всех ключей кэша задач. Версия позволяет сменить формат данных без очистки Redis.
+    key_prefix = "tasks:v3"
+
     def __init__(
             self,
-            redis_session: Redis
+            redis_session: Redis,
+            ttl: int = 60,
+            local_cache: MemoryCache | None = None,
+            redis_stats: CacheStats | None = None,
+            codec: TaskListCodec | None = None
     ):
         self.redis = redis_session
+        self.ttl = ttl
+        self.local_cache = local_cache
+        self.redis_stats = redis_stats or CacheStats()
+        self.codec = codec or JsonTaskListCodec()
 
-    async def get_tasks(
+    async def get_tasks_generation(
             self
-    ) -> list[TaskSchema] | None:
+    ) -> int:
+        """Получает поколение кэша общего списка задач."""
+        return await self._get_generation(self._all_generation_key())
+
+    async def get_user_tasks_generation(
+            self,
+            user_id: int
+    ) -> int:
+        """
+        Получает поколение кэша задач пользователя.
+
+        :param user_id: Идентификатор пользователя.
         """
-        Получает список задач из Redis.
+        return await self._get_generation(self._user_generation_key(user_id))
+
+    async def get_tasks_page(
+            self,
+            generation: int,
+            after_id: int | None,
+            limit: int
+    ) -> TaskPageSchema | None:
+        """
+        Получает страницу задач из Redis.
 
         Описание:
-        - Использует Redis pipeline для выполнения нескольких команд.
-        - Запрашивает весь список задач, хранящихся в ключе "tasks" (диапазон от 0 до -1 означает "все элементы").
-        - Преобразует каждый элемент из сохраненного JSON-формата в объект TaskSchema.
+        - Все закэшированные страницы одного поколения хранятся в одном хэше.
+         Поле "{after_id}:{limit}" содержит задачи страницы, поле "{after_id}:{limit}:next" - курсор
+         следующей страницы (отсутствует у последней страницы). Оба поля читаются одной командой HMGET.
+
+        Аргументы:
+        - generation: Поколение кэша общего списка задач.
+        - after_id: Идентификатор последней задачи предыдущей страницы (None для первой страницы).
+        - limit: Размер страницы.
 
         Возвращает:
-        - Список объектов TaskSchema, если данные найдены.
-        - None, если список пуст или ключ отсутствует.
+        - Объект TaskPageSchema, если страница найдена в кэше.
+        - None, если страницы нет в кэше.
         """
-        if not self.redis.exists("tasks"):
-            return None
-
-        async with self.redis.pipeline() as pipe:
-            # Получить список задач из Redis
+        pages_key = self._pages_key(generation)
+        page_field = self._page_field(after_id, limit)
+        if (page := self._get_local((pages_key, page_field))) is not None:
+            return page
 
-            await pipe.lrange("tasks", 0, -1)
-            # Выполнить команды в pipeline
-            response = await pipe.execute()
-            # pipe.execute возвращает байтовое представление объектов,
-            # поэтому нужно преобразовать в строки, потом уже в json и только после этого в Модель
-            tasks = [
-                TaskSchema.model_validate(json.loads(x.decode("utf8")))
-                for x in response[0]
-            ]
-            return tasks
+        cached_items, next_cursor = await self.redis.hmget(pages_key, page_field, f"{page_field}:next")
+        if cached_items is None:
+            self.redis_stats.misses += 1
+            return None
+        self.redis_stats.hits += 1
+        page = TaskPageSchema(
+                items=self.codec.decode(cached_items),
+                next_cursor=next_cursor.decode() if next_cursor else None,
+        )
+        self._set_local((pages_key, page_field), page)
+        return page
 
-    async def set_tasks(
+    async def set_tasks_page(
             self,
-            tasks: list[TaskSchema]
+            generation: int,
+            after_id: int | None,
+            limit: int,
+            page: TaskPageSchema
     ) -> None:
         """
-        Сохраняет список задач в Redis.
+        Сохраняет страницу задач в Redis.
 
         Описание:
-        - Удаляет текущий список задач (если он существует) в ключе "tasks".
-        - Добавляет новый список задач, сериализованный в формат JSON.
-        - Использует Redis pipeline для выполнения операций атомарно.
+        - Записывает страницу в хэш страниц указанного поколения.
+        - Время жизни выставляется только при создании хэша (EXPIRE ... NX).
 
         Аргументы:
-        - tasks: Список объектов TaskSchema, которые нужно сохранить.
+        - generation: Поколение кэша, полученное до чтения данных из базы.
+        - after_id: Идентификатор последней задачи предыдущей страницы (None для первой страницы).
+        - limit: Размер страницы.
+        - page: Страница задач.
         """
-        # Сериализовать задачи в JSON для хранения в Redis
-        tasks_json = [x.json() for x in tasks]
+        pages_key = self._pages_key(generation)
+        page_field = self._page_field(after_id, limit)
+        page_mapping = {page_field: self.codec.encode(page.items)}
+        if page.next_cursor:
+            page_mapping[f"{page_field}:next"] = page.next_cursor
         async with self.redis.pipeline() as pipe:
-            # Удалить старые задачи, если они существуют
-            await pipe.delete("tasks")
-            # Добавить новый список задач в Redis (в виде JSON-строк)
-            await pipe.lpush("tasks", *tasks_json)
+            await pipe.hset(pages_key, mapping=page_mapping)
             # Указываю время жизни
-            await pipe.expire("tasks", 60)
+            await pipe.expire(pages_key, self.ttl, nx=True)
             # Выполнить команды в pipeline
             await pipe.execute()
-
-    async def delete_task(
-            self,
-            task_id: int
-    ) -> None:
-        """
-        Удаляет задачу с указанным идентификатором из списка задач.
-
-        :param task_id: Идентификатор задачи, которую нужно удалить.
-        :raises TaskNotFoundError: Если задача с указанным идентификатором не найдена.
-        """
-        tasks = await self.get_tasks()
-        if tasks:
-            new_tasks = [task for task in tasks if task.id != task_id]
-            if new_tasks:
-                async with self.redis.pipeline() as pipe:
-                    # Добавить новый список задач в Redis (в виде JSON-строк)
-                    await pipe.lpush("tasks", *new_tasks)
-                    # Указываю время жизни
-                    await pipe.expire("tasks", 60)
-                    # Выполнить команды в pipeline
-                    await pipe.execute()
+        self._set_local((pages_key, page_field), page)
 
     async def get_user_tasks(
             self,
-            user_id: int
+            user_id: int,
+            generation: int
     ) -> list[TaskSchema] | None:
         """
         Возвращает список задач пользователя.
 
+        Описание:
+        - Читает хэш задач пользователя одной командой HGETALL.
+        - Задачи сортируются по идентификатору и разбираются одним вызовом codec.decode_many.
+
         :param user_id: Идентификатор пользователя.
-        :raises TaskNotFoundError: Если задача с указанным идентификатором не найдена.
+        :param generation: Поколение кэша задач пользователя (используется как ключ L1).
+        :return: Список задач или None, если в кэше их нет.
         """
-        if not self.redis.exists(user_id):
-            return None
-
-        async with self.redis.pipeline() as pipe:
-            # Получить список задач из Redis
-
-            await pipe.lrange(user_id, 0, -1)
-            # Выполнить команды в pipeline
-            response = await pipe.execute()
-            # pipe.execute возвращает байтовое представление объектов,
-            # поэтому нужно преобразовать в строки, потом уже в json и только после этого в Модель
-            tasks = [
-                TaskSchema.model_validate(json.loads(x.decode("utf8")))
-                for x in response[0]
-            ]
+        user_tasks_key = self._user_tasks_key(user_id)
+        if (tasks := self._get_local((user_tasks_key, generation))) is not None:
             return tasks
 
+        cached_tasks = await self.redis.hgetall(user_tasks_key)
+        if not cached_tasks:
+            self.redis_stats.misses += 1
+            return None
+        self.redis_stats.hits += 1
+        tasks = self.codec.decode_many(
+                [cached_tasks[task_id] for task_id in sorted(cached_tasks, key=int)]
+        )
+        self._set_local((user_tasks_key, generation), tasks)
+        return tasks
+
     async def set_user_tasks(
             self,
             user_id: int,
+            generation: int,
             tasks: list[TaskSchema]
     ) -> None:
         """
-        Сохраняет список задач в Redis.
+        Сохраняет список задач пользователя в Redis.
 
         Описание:
-        - Удаляет текущий список задач (если он существует) в ключе "tasks".
-        - Добавляет новый список задач, сериализованный в формат JSON.
-        - Использует Redis pipeline для выполнения операций атомарно.
+        - Перезаписывает хэш задач пользователя (поле - идентификатор задачи).
+        - Запись выполняется Lua-скриптом только если поколение не изменилось с момента чтения из базы:
+         иначе задачи могли измениться во время выборки, и в кэш попали бы устаревшие данные.
 
         Аргументы:
+        - user_id: Идентификатор пользователя.
+        - generation: Поколение кэша, полученное до чтения данных из базы.
         - tasks: Список объектов TaskSchema, которые нужно сохранить.
         """
-        # Сериализовать задачи в JSON для хранения в Redis
-        tasks_json = [x.json() for x in tasks]
-        async with self.redis.pipeline() as pipe:
-            # Удалить старые задачи, если они существуют
-            await pipe.delete(user_id)
-            # Добавить новый список задач в Redis (в виде JSON-строк)
-            await pipe.lpush(user_id, *tasks_json)
-            # Указываю время жизни
-            await pipe.expire(user_id, 60)
-            # Выполнить команды в pipeline
+        if not tasks:
+            return
+        fields = []
+        for task in tasks:
+            fields.extend((task.id, self.codec.encode_one(task)))
+        user_tasks_key = self._user_tasks_key(user_id)
+        stored = await self.redis.eval(
+                FILL_USER_TASKS_SCRIPT,
+                2,
+                self._user_generation_key(user_id),
+                user_tasks_key,
+                generation,
+                self.ttl,
+                *fields,
+        )
+        if stored:
+            self._set_local((user_tasks_key, generation), tasks)
+
+    async def set_user_task(
+            self,
+            task: TaskSchema
+    ) -> None:
+        """
+        Сохраняет созданную или измененную задачу в хэш задач пользователя.
+
+        Описание:
+        - Увеличивает поколения задач пользователя и общего списка.
+        - Если хэш задач пользователя есть в кэше, обновляет в нем одно поле (HSET).
+         Если хэша нет, он будет целиком заполнен из базы при следующем чтении.
+        - Публикует идентификатор пользователя в канал инвалидации L1.
+        - Все шаги выполняются одним Lua-скриптом атомарно.
+
+        :param task: Созданная или измененная задача.
+        """
+        await self.redis.eval(
+                SET_USER_TASK_SCRIPT,
+                3,
+                self._user_generation_key(task.user_id),
+                self._all_generation_key(),
+                self._user_tasks_key(task.user_id),
+                task.id,
+                self.codec.encode_one(task),
+                TASKS_INVALIDATION_CHANNEL,
+                task.user_id,
+        )
+        self.drop_local_user_tasks(task.user_id)
+
+    async def delete_user_task(
+            self,
+            user_id: int,
+            task_id: int
+    ) -> None:
+        """
+        Удаляет задачу из хэша задач пользователя.
+
+        Описание:
+        - Увеличивает поколения задач пользователя и общего списка,
+         удаляет одно поле хэша (HDEL) и публикует сообщение инвалидации L1 - атомарно в MULTI/EXEC.
+
+        :param user_id: Идентификатор владельца задачи.
+        :param task_id: Идентификатор задачи.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            await pipe.incr(self._user_generation_key(user_id))
+            await pipe.incr(self._all_generation_key())
+            await pipe.hdel(self._user_tasks_key(user_id), task_id)
+            await pipe.publish(TASKS_INVALIDATION_CHANNEL, str(user_id))
             await pipe.execute()
+        self.drop_local_user_tasks(user_id)
+
+    async def invalidate_user_tasks(
+            self,
+            user_id: int
+    ) -> None:
+        """
+        Полностью сбрасывает кэш задач пользователя и общего списка задач.
+
+        Описание:
+        - Атомарно (MULTI/EXEC) увеличивает поколение задач пользователя и поколение общего списка
+         и удаляет хэш задач пользователя.
+        - Публикует идентификатор пользователя в канал инвалидации, чтобы остальные воркеры сбросили L1.
+
+        :param user_id: Идентификатор пользователя, задачи которого изменились.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            await pipe.incr(self._user_generation_key(user_id))
+            await pipe.incr(self._all_generation_key())
+            await pipe.delete(self._user_tasks_key(user_id))
+            await pipe.publish(TASKS_INVALIDATION_CHANNEL, str(user_id))
+            await pipe.execute()
+        self.drop_local_user_tasks(user_id)
+
+    async def invalidate_all(self) -> None:
+        """
+        Сбрасывает кэш задач всех пользователей, например после перезаписи таблицы задач (seeder).
+
+        Описание:
+        - Увеличивает все счетчики поколений, чтобы данные, прочитанные из базы до сброса, не были записаны в кэш,
+         и удаляет хэши задач пользователей и страниц общего списка. Ключи перебираются SCAN,
+         чтобы не блокировать Redis.
+        - Очищает L1 и публикует пустое сообщение в канал инвалидации, чтобы остальные воркеры очистили L1 целиком.
+        """
+        generation_prefix = f"{self.key_prefix}:gen:".encode()
+        generation_keys = {self._all_generation_key().encode()}
+        data_keys = []
+        async for key in self.redis.scan_iter(match=f"{self.key_prefix}:*", count=1000):
+            (generation_keys.add if key.startswith(generation_prefix) else data_keys.append)(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in generation_keys:
+                await pipe.incr(key)
+            if data_keys:
+                await pipe.unlink(*data_keys)
+            await pipe.publish(TASKS_INVALIDATION_CHANNEL, b"")
+            await pipe.execute()
+        if self.local_cache is not None:
+            self.local_cache.clear()
+
+    def drop_local_user_tasks(
+            self,
+            user_id: int
+    ) -> None:
+        """
+        Удаляет из L1 поколения задач пользователя и общего списка задач.
+
+        Данные старых поколений удалять не нужно: после сброса поколения они больше не читаются
+        и будут вытеснены по LRU или TTL.
+
+        :param user_id: Идентификатор пользователя, задачи которого изменились.
+        """
+        if self.local_cache is not None:
+            self.local_cache.delete(self._user_generation_key(user_id), self._all_generation_key())
+
+    def handle_invalidation_message(
+            self,
+            message: bytes
+    ) -> None:
+        """
+        Обрабатывает сообщение канала инвалидации.
+
+        :param message: Идентификатор пользователя, задачи которого изменились. Пустое сообщение
+         (invalidate_all) очищает L1 целиком.
+        """
+        if not message:
+            if self.local_cache is not None:
+                self.local_cache.clear()
+            return
+        self.drop_local_user_tasks(int(message))
+
+    def get_stats(self) -> dict:
+        """Возвращает счетчики попаданий и промахов по уровням кэша."""
+        stats = {"redis": self.redis_stats.as_dict()}
+        if self.local_cache is not None:
+            stats["local"] = {**self.local_cache.stats.as_dict(), "size": len(self.local_cache)}
+        return stats
+
+    async def _get_generation(
+            self,
+            generation_key: str
+    ) -> int:
+        """Получает значение счетчика поколения (0, если счетчик еще не создан)."""
+        if (generation := self._get_local(generation_key)) is not None:
+            return generation
+        # epoch запоминается до обращения к Redis: если во время чтения пришла инвалидация,
+        # прочитанное поколение может быть устаревшим и не должно попасть в L1.
+        epoch = self.local_cache.epoch if self.local_cache is not None else None
+        generation = await self.redis.get(generation_key)
+        generation = int(generation) if generation else 0
+        self._set_local(generation_key, generation, epoch)
+        return generation
+
+    def _get_local(
+            self,
+            key: str | tuple
+    ) -> object | None:
+        """Получает значение из L1, если он используется."""
+        if self.local_cache is None:
+            return None
+        return self.local_cache.get(key)
+
+    def _set_local(
+            self,
+            key: str | tuple,
+            value: object,
+            epoch: int | None = None
+    ) -> None:
+        """Сохраняет значение в L1, если он используется."""
+        if self.local_cache is not None:
+            self.local_cache.set(key, value, epoch=epoch)
+
+    def _all_generation_key(self) -> str:
+        """Формирует ключ поколения общего списка задач."""
+        return f"{self.key_prefix}:gen:all"
+
+    def _user_generation_key(
+            self,
+            user_id: int
+    ) -> str:
+        """Формирует ключ поколения задач пользователя."""
+        return f"{self.key_prefix}:gen:user:{user_id}"
+
+    def _pages_key(
+            self,
+            generation: int
+    ) -> str:
+        """Формирует ключ хэша страниц общего списка задач."""
+        return f"{self.key_prefix}:pages:g{generation}:{self.codec.name}"
+
+    def _user_tasks_key(
+            self,
+            user_id: int
+    ) -> str:
+        """Формирует ключ хэша задач пользователя."""
+        return f"{self.key_prefix}:user:{user_id}:{self.codec.name}"
+
+    @staticmethod
+    def _page_field(
+            after_id: int | None,
+            limit: int
+    ) -> str:
+        """Формирует имя поля хэша для страницы задач."""
+        return f"{after_id or 0}:{limit}"
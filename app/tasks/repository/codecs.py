@@ -0,0 +1,133 @@
+"""
+Форматы хранения списков задач в кэше.
+
+Список задач записывается в Redis одним значением (или отдельными полями хэша) и разбирается одним вызовом
+TypeAdapter(list[TaskSchema]), а не отдельными json.loads + model_validate на каждый элемент.
+
+- JsonTaskListCodec - JSON-массив задач.
+- MsgpackTaskListCodec - msgpack со столбцами задач: имена полей хранятся один раз на весь список.
+ Требует установленного пакета msgpack.
+"""
+
+from typing import Protocol
+
+from pydantic import TypeAdapter
+
+from app.tasks.schemas import TaskSchema
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack - необязательная зависимость
+    msgpack = None
+
+task_list_adapter = TypeAdapter(list[TaskSchema])
+
+
+class TaskListCodec(Protocol):
+    """
+    Формат хранения списка задач.
+
+    Атрибуты:
+    name (str): Имя формата. Входит в ключи кэша, чтобы воркеры с разными форматами не читали чужие данные.
+
+    Методы:
+    encode(self, tasks: list[TaskSchema]) -> bytes: Сериализует список задач.
+    decode(self, data: bytes) -> list[TaskSchema]: Разбирает список задач.
+    encode_one(self, task: TaskSchema) -> bytes: Сериализует одну задачу.
+    decode_many(self, values: list[bytes]) -> list[TaskSchema]: Разбирает задачи, сериализованные по одной.
+    """
+
+    name: str
+
+    def encode(self, tasks: list[TaskSchema]) -> bytes:
+        """Сериализует список задач."""
+
+    def decode(self, data: bytes) -> list[TaskSchema]:
+        """Разбирает список задач."""
+
+    def encode_one(self, task: TaskSchema) -> bytes:
+        """Сериализует одну задачу."""
+
+    def decode_many(self, values: list[bytes]) -> list[TaskSchema]:
+        """Разбирает задачи, сериализованные по одной."""
+
+
+class JsonTaskListCodec:
+    """Список задач в виде одного JSON-массива."""
+
+    name = "json"
+
+    def encode(self, tasks: list[TaskSchema]) -> bytes:
+        """Сериализует список задач в JSON-массив."""
+        return task_list_adapter.dump_json(tasks)
+
+    def decode(self, data: bytes) -> list[TaskSchema]:
+        """Разбирает JSON-массив задач за один вызов pydantic-core."""
+        return task_list_adapter.validate_json(data)
+
+    def encode_one(self, task: TaskSchema) -> bytes:
+        """Сериализует одну задачу в JSON-объект."""
+        return task.model_dump_json().encode()
+
+    def decode_many(self, values: list[bytes]) -> list[TaskSchema]:
+        """Склеивает JSON-объекты задач в один массив и разбирает его за один вызов pydantic-core."""
+        return self.decode(b"[" + b",".join(values) + b"]")
+
+
+class MsgpackTaskListCodec:
+    """
+    Список задач в виде msgpack-структуры [имена полей, столбец 1, столбец 2, ...].
+
+    Столбцовое хранение избавляет от повторения имен полей в каждой задаче,
+    поэтому значение получается заметно компактнее JSON.
+    """
+
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed, use TASKS_CACHE_CODEC=json or install msgpack")
+        self.fields = tuple(TaskSchema.model_fields)
+
+    def encode(self, tasks: list[TaskSchema]) -> bytes:
+        """Сериализует список задач в столбцы msgpack."""
+        rows = task_list_adapter.dump_python(tasks)
+        columns = [[row[field] for row in rows] for field in self.fields]
+        return msgpack.packb([self.fields, *columns])
+
+    def decode(self, data: bytes) -> list[TaskSchema]:
+        """Разбирает столбцы msgpack и валидирует список задач за один вызов pydantic-core."""
+        fields, *columns = msgpack.unpackb(data)
+        return task_list_adapter.validate_python(
+                [dict(zip(fields, row, strict=True)) for row in zip(*columns, strict=True)]
+        )
+
+    def encode_one(self, task: TaskSchema) -> bytes:
+        """Сериализует одну задачу в msgpack-массив значений полей в порядке self.fields."""
+        row = task.model_dump()
+        return msgpack.packb([row[field] for field in self.fields])
+
+    def decode_many(self, values: list[bytes]) -> list[TaskSchema]:
+        """Разбирает задачи и валидирует их за один вызов pydantic-core."""
+        return task_list_adapter.validate_python(
+                [dict(zip(self.fields, msgpack.unpackb(value), strict=True)) for value in values]
+        )
+
+
+TASK_LIST_CODECS: dict[str, type[TaskListCodec]] = {
+    JsonTaskListCodec.name: JsonTaskListCodec,
+    MsgpackTaskListCodec.name: MsgpackTaskListCodec,
+}
+
+
+def get_task_list_codec(name: str) -> TaskListCodec:
+    """
+    Возвращает формат хранения списка задач по имени.
+
+    :param name: Имя формата ("json" или "msgpack").
+    :return: Экземпляр формата.
+    :raises ValueError: Если формат с таким именем не поддерживается.
+    """
+    if name not in TASK_LIST_CODECS:
+        raise ValueError(f"Unknown task cache codec: {name}")
+    return TASK_LIST_CODECS[name]()
@@ -0,0 +1,14 @@
+"""
+Кэширование задач в памяти процесса (воркера).
+
+L1-кэш задач (MemoryCache), объединение одновременных загрузок задач из базы при промахе кэша (SingleFlight)
+и формат хранения списков задач в Redis создаются из настроек один раз на процесс
+в контейнере приложения (app.container.Container.create).
+
+Инвалидация между воркерами выполняется через Redis pub/sub канал TASKS_INVALIDATION_CHANNEL:
+TaskCacheRepository.invalidate_user_tasks публикует в него идентификатор пользователя,
+а подписчик каждого воркера удаляет из L1 закэшированные поколения этого пользователя и общего списка.
+Пустое сообщение (TaskCacheRepository.invalidate_all) очищает L1 целиком.
+"""
+
+TASKS_INVALIDATION_CHANNEL = "tasks:v3:invalidate"
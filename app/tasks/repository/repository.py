@@ -1,11 +1,30 @@
-from typing import TypeVar, Sequence, Callable
-
-from faker import Faker
-from sqlalchemy import select, update, delete, insert, and_
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import TypeVar
+from uuid import uuid4
+
+from sqlalchemy import (
+    select,
+    update,
+    delete,
+    insert,
+    and_,
+    or_,
+    any_,
+    bindparam,
+    values,
+    column,
+    func,
+    literal,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.tasks.models import TaskModel, CategoryModel
+from app.analytics.rollup import apply_task_stats
+from app.exceptions import TaskNameConflictError
+from app.tasks.models import TaskModel
 from app.tasks.schemas import TaskCreateSchema
 
 T = TypeVar(
@@ -17,19 +36,30 @@ class TaskRepository:
     """
     Класс для работы с задачами в базе данных.
 
+    Методы, создающие и удаляющие задачи, в той же транзакции обновляют сводные таблицы аналитики
+    (app.analytics.rollup). Переименование на аналитику не влияет.
+
     Атрибуты:
     session_factory (Callable[[T], AsyncSession]): Фабрика асинхронных сессий.
 
     Методы:
-    create_task(self, task_data: TaskSchema) -> None: Создает новую задачу.
-    get_tasks(self) -> Sequence[TaskModel]: Получает список всех задач.
-    update_task_name(self, task_id: int, new_name: str) -> type[TaskModel] | None: Обновляет имя задачи.
+    create_task(self, task_data: TaskCreateSchema, user_id: int) -> TaskModel: Создает новую задачу.
+    create_tasks(self, tasks_data: list[TaskCreateSchema], user_id: int) -> Sequence[TaskModel]:
+     Создает задачи одним запросом.
+    get_tasks_page(self, limit: int, after_id: int | None = None) -> Sequence[TaskModel]: Получает страницу задач.
+    stream_tasks(self, user_id: int | None = None, chunk_size: int = 1000) -> AsyncIterator[TaskModel]:
+     Потоково выбирает задачи через серверный курсор.
+    update_task_name(self, task_id: int, new_name: str, user_id: int) -> TaskModel | None: Обновляет имя задачи.
     get_task_by_name(self, name: str) -> TaskModel | None: Получает задачу по имени.
+    search_user_tasks(self, user_id: int, query: str, limit: int) -> Sequence[TaskModel]:
+     Ищет задачи пользователя по имени.
     get_task_by_id(self, task_id: int) -> TaskModel | None: Получает задачу по идентификатору.
-    delete_task(self, task_id: int) -> None: Удаляет задачу.
-    get_task_by_category_id(self, category_id: int) -> Sequence[TaskModel]: Получает задачи по идентификатору категории.
-    get_task_by_category_name(self, category_name: str) -> Sequence[TaskModel]: Получает задачи по имени категории.
-    insert_fake_data(self, num_tasks: int = 20) -> None: Вставляет фиктивные данные в базу данных.
+    delete_task(self, task_id: int) -> int | None: Удаляет задачу.
+    delete_tasks(self, task_ids: list[int], user_id: int, chunk_size: int) -> list[int]: Удаляет задачи пакетами.
+    update_task_names(self, new_names: dict[int, str], user_id: int, chunk_size: int) -> Sequence[TaskModel]:
+     Переименовывает задачи пакетами.
+    get_tasks_by_category_ids(self, category_ids: Sequence[int]) -> Sequence[TaskModel]:
+     Получает задачи по идентификаторам категорий.
     """
 
     def __init__(
@@ -38,35 +68,98 @@ class TaskRepository:
     ):
         self.session_factory = session_factory
 
-    async def get_tasks(
-            self
+    async def get_tasks_page(
+            self,
+            limit: int,
+            after_id: int | None = None
     ) -> Sequence[TaskModel]:
         """
-        Получает список всех задач.
+        Получает страницу задач с использованием keyset-пагинации.
 
         Описание:
-        - Выполняет запрос на выборку всех задач из базы данных.
-        - Возвращает список моделей TaskModel.
+        - Выбирает задачи с идентификатором больше after_id, отсортированные по идентификатору.
+        - Запрос обслуживается индексом первичного ключа, поэтому стоимость не зависит от глубины страницы.
+
+        Аргументы:
+        - limit: Максимальное количество задач на странице.
+        - after_id: Идентификатор последней задачи предыдущей страницы (None для первой страницы).
 
         Возвращает:
         - Список моделей TaskModel.
         """
+        query = (
+            select(
+                    TaskModel
+            )
+            .order_by(
+                    TaskModel.id
+            )
+            .limit(
+                    limit
+            )
+        )
+        if after_id is not None:
+            query = query.where(
+                    TaskModel.id > after_id
+            )
         async with self.session_factory() as session:
             query_result = await session.execute(
-                    select(
-                            TaskModel
-                    )
+                    query
             )
             tasks = query_result.scalars().all()
         return tasks
 
+    async def stream_tasks(
+            self,
+            user_id: int | None = None,
+            chunk_size: int = 1000
+    ) -> AsyncIterator[TaskModel]:
+        """
+        Потоково выбирает задачи через серверный курсор.
+
+        Описание:
+        - Использует AsyncSession.stream_scalars: asyncpg читает строки с сервера порциями по chunk_size,
+         поэтому потребление памяти не зависит от размера таблицы, а первая строка доступна сразу.
+
+        Аргументы:
+        - user_id: Идентификатор пользователя (None - все задачи).
+        - chunk_size: Количество строк, получаемых с сервера за одно обращение.
+
+        Возвращает:
+        - Асинхронный итератор моделей TaskModel, отсортированных по идентификатору.
+        """
+        query = (
+            select(
+                    TaskModel
+            )
+            .order_by(
+                    TaskModel.id
+            )
+            .execution_options(
+                    yield_per=chunk_size
+            )
+        )
+        if user_id is not None:
+            query = query.where(
+                    TaskModel.user_id == user_id
+            )
+        async with self.session_factory() as session:
+            tasks = await session.stream_scalars(
+                    query
+            )
+            async for task in tasks:
+                yield task
+
     async def create_task(
             self,
             task_data: TaskCreateSchema,
             user_id: int
-    ) -> int:
+    ) -> TaskModel:
         """
         Создание задачи.
+
+        Созданная строка возвращается тем же запросом (INSERT ... RETURNING), без повторной выборки.
+        Сводные таблицы аналитики обновляются в той же транзакции.
         :param task_data: Объект задачи.
         :param user_id: Идентификатор пользователя.
         :return: Созданная задача.
@@ -76,19 +169,66 @@ class TaskRepository:
                     TaskModel
             )
             .values(
-                    **task_data.dict(),
+                    **task_data.model_dump(),
                     user_id=user_id
             )
             .returning(
-                    TaskModel.id
+                    TaskModel
             )
         )
         async with self.session_factory() as session:
-            task_id = (await session.execute(
+            task = (await session.execute(
                     query
-            )).scalar_one_or_none()
+            )).scalar_one()
+            await apply_task_stats(session, [task], 1)
             await session.commit()
-            return task_id
+            return task
+
+    async def create_tasks(
+            self,
+            tasks_data: list[TaskCreateSchema],
+            user_id: int
+    ) -> Sequence[TaskModel]:
+        """
+        Массовое создание задач.
+
+        Описание:
+        - Вставляет все задачи одним многострочным INSERT ... VALUES (...), (...) RETURNING
+         в одной транзакции: либо создаются все задачи, либо ни одной.
+        - Сводные таблицы аналитики обновляются в той же транзакции одним запросом на таблицу.
+
+        Аргументы:
+        - tasks_data: Список объектов задач.
+        - user_id: Идентификатор пользователя.
+
+        Возвращает:
+        - Созданные задачи в порядке передачи.
+
+        Исключения:
+        - TaskNameConflictError: Если у пользователя уже есть задача с одним из имен.
+        """
+        query = (
+            insert(
+                    TaskModel
+            )
+            .values(
+                    [{**task_data.model_dump(), "user_id": user_id} for task_data in tasks_data]
+            )
+            .returning(
+                    TaskModel
+            )
+        )
+        async with self.session_factory() as session:
+            try:
+                tasks = (await session.execute(
+                        query
+                )).scalars().all()
+                await apply_task_stats(session, tasks, 1)
+                await session.commit()
+            except IntegrityError:
+                await self._raise_name_conflict([task_data.name for task_data in tasks_data], user_id)
+                raise
+            return tasks
 
     async def update_task_name(
             self,
@@ -101,38 +241,38 @@ class TaskRepository:
 
         Описание:
         - Обновляет имя задачи в базе данных.
-        - Возвращает обновленную задачу.
+        - Возвращает обновленную задачу тем же запросом (UPDATE ... RETURNING), без повторной выборки.
 
         Аргументы:
         - task_id: Идентификатор задачи.
         - new_name: Новое имя задачи.
+        - user_id: Идентификатор владельца задачи.
 
         Возвращает:
         - Обновленную задачу в формате TaskModel, если задача найдена.
-        - None, если задача не найдена.
+        - None, если задача не найдена или принадлежит другому пользователю.
         """
-        async with self.session_factory() as session:
-            query = (
-                update(
-                        TaskModel
-                ).values(
-                        name=new_name,
-                        user_id=user_id
-                ).where(
-                        and_(
-                                TaskModel.id == task_id,
-                                TaskModel.user_id == user_id
-                        )
-                )
+        query = (
+            update(
+                    TaskModel
+            ).values(
+                    name=new_name
+            ).where(
+                    and_(
+                            TaskModel.id == task_id,
+                            TaskModel.user_id == user_id
+                    )
+            ).returning(
+                    TaskModel
+            ).execution_options(
+                    synchronize_session=False
             )
-            await session.execute(
+        )
+        async with self.session_factory() as session:
+            task = (await session.execute(
                     query
-            )
+            )).scalar_one_or_none()
             await session.commit()
-            task = await session.get(
-                    TaskModel,
-                    task_id
-            )
             return task
 
     async def get_task_by_name(
@@ -166,6 +306,58 @@ class TaskRepository:
 
         return task
 
+    async def search_user_tasks(
+            self,
+            user_id: int,
+            query: str,
+            limit: int
+    ) -> Sequence[TaskModel]:
+        """
+        Нечеткий поиск задач пользователя по имени.
+
+        Описание:
+        - Находит задачи, имя которых содержит query как подстроку (ILIKE '%query%')
+         или содержит слово, похожее на query (оператор pg_trgm query <% name).
+        - Оба условия обслуживаются триграммным GIN-индексом tasks_user_name_trgm_idx
+         вместе с условием на пользователя, поэтому таблица задач не сканируется.
+        - Сначала идут имена, начинающиеся с query, затем остальные по убыванию word_similarity.
+
+        Аргументы:
+        - user_id: Идентификатор пользователя.
+        - query: Строка поиска (для использования индекса - не короче трех символов).
+        - limit: Максимальное количество результатов.
+
+        Возвращает:
+        - Найденные задачи в порядке релевантности.
+        """
+        escaped_query = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        search_query = (
+            select(
+                    TaskModel
+            )
+            .where(
+                    TaskModel.user_id == user_id,
+                    or_(
+                            TaskModel.name.ilike(f"%{escaped_query}%", escape="\\"),
+                            literal(query).op("<%")(TaskModel.name),
+                    )
+            )
+            .order_by(
+                    TaskModel.name.ilike(f"{escaped_query}%", escape="\\").desc(),
+                    func.word_similarity(query, TaskModel.name).desc(),
+                    TaskModel.id
+            )
+            .limit(
+                    limit
+            )
+        )
+        async with self.session_factory() as session:
+            query_result = await session.execute(
+                    search_query
+            )
+            tasks = query_result.scalars().all()
+        return tasks
+
     async def get_task_by_id(
             self,
             task_id: int
@@ -205,7 +397,7 @@ class TaskRepository:
         :return: Список задач.
         """
         async with self.session_factory() as session:
-            query = select(TaskModel).where(TaskModel.user_id == user_id)
+            query = select(TaskModel).where(TaskModel.user_id == user_id).order_by(TaskModel.id)
             query_result = await session.execute(query)
             user_tasks = query_result.scalars().all()
             return user_tasks
@@ -213,15 +405,19 @@ class TaskRepository:
     async def delete_task(
             self,
             task_id: int
-    ) -> int:
+    ) -> int | None:
         """
         Удаление задачи.
 
         Описание:
         - Удаляет задачу из базы данных.
+        - Вычитает задачу из сводных таблиц аналитики в той же транзакции.
 
         Аргументы:
         - task_id: Идентификатор задачи.
+
+        Возвращает:
+        - Идентификатор владельца удаленной задачи или None, если задача не найдена.
         """
         async with self.session_factory() as session:
             result = await session.execute(
@@ -229,147 +425,234 @@ class TaskRepository:
                             TaskModel
                     ).where(
                             TaskModel.id == task_id
+                    ).returning(
+                            TaskModel.user_id,
+                            TaskModel.category_id,
+                            TaskModel.pomodoro_count,
+                            TaskModel.created_at
                     )
             )
+            deleted_task = result.one_or_none()
+            if deleted_task is None:
+                return None
+            await apply_task_stats(session, [deleted_task], -1)
             await session.commit()
-            return result.rowcount
+            return deleted_task.user_id
 
-    async def get_task_by_category_id(
+    async def delete_tasks(
             self,
-            category_id: int
-    ) -> Sequence[TaskModel]:
+            task_ids: list[int],
+            user_id: int,
+            chunk_size: int
+    ) -> list[int]:
         """
-        Получение задач по идентификатору категории.
+        Массовое удаление задач пользователя.
 
         Описание:
-        - Выполняет запрос на выборку задач по идентификатору категории.
-        - Возвращает список моделей TaskModel.
+        - Удаляет задачи пакетами по chunk_size запросом DELETE ... WHERE id = ANY(:ids) AND user_id = :user_id.
+         Список идентификаторов передается одним параметром-массивом.
+        - Все пакеты выполняются в одной транзакции, сводные таблицы аналитики обновляются
+         в ней же одним запросом на таблицу после всех пакетов.
 
         Аргументы:
-        - category_id: Идентификатор категории.
+        - task_ids: Идентификаторы задач.
+        - user_id: Идентификатор владельца задач.
+        - chunk_size: Количество задач в одном запросе.
 
         Возвращает:
-        - Список моделей TaskModel.
+        - Идентификаторы удаленных задач.
         """
+        deleted_tasks = []
         async with self.session_factory() as session:
-            query_result = await session.execute(
-                    select(
+            for start in range(0, len(task_ids), chunk_size):
+                chunk = task_ids[start:start + chunk_size]
+                query = (
+                    delete(
                             TaskModel
                     )
-                    .options(
-                            selectinload(
-                                    TaskModel.category
-                            )
-                    )
                     .where(
-                            TaskModel.category_id == category_id
+                            TaskModel.id == any_(bindparam("ids", chunk, type_=ARRAY(Integer))),
+                            TaskModel.user_id == user_id
                     )
-            )
-            tasks = query_result.scalars().all()
-        return tasks
+                    .returning(
+                            TaskModel.id,
+                            TaskModel.user_id,
+                            TaskModel.category_id,
+                            TaskModel.pomodoro_count,
+                            TaskModel.created_at
+                    )
+                )
+                deleted_tasks.extend((await session.execute(query)).all())
+            await apply_task_stats(session, deleted_tasks, -1)
+            await session.commit()
+        return [deleted_task.id for deleted_task in deleted_tasks]
 
-    async def get_task_by_category_name(
+    async def update_task_names(
             self,
-            category_name: str
+            new_names: dict[int, str],
+            user_id: int,
+            chunk_size: int
     ) -> Sequence[TaskModel]:
         """
-        Получение задач по имени категории.
+        Массовое переименование задач пользователя.
 
         Описание:
-        - Выполняет запрос на выборку задач по имени категории.
-        - Возвращает список моделей TaskModel.
+        - Обновляет задачи пакетами по chunk_size запросом
+         UPDATE tasks SET name = new_names.name FROM (VALUES ...) AS new_names (id, name) ... RETURNING.
+        - Все пакеты выполняются в одной транзакции.
+        - Конфликт имен определяется по состоянию после переименования: имя, которое освобождает другая задача
+         того же запроса (например, обмен A -> B, B -> A), свободно. Уникальный индекс name_idx проверяется
+         построчно, поэтому такой запрос нарушает его посреди UPDATE; в этом случае переименование повторяется
+         в новой транзакции в два шага - сначала задачам присваиваются временные уникальные имена.
 
         Аргументы:
-        - category_name: Имя категории.
+        - new_names: Новые имена задач по их идентификаторам.
+        - user_id: Идентификатор владельца задач.
+        - chunk_size: Количество задач в одном запросе.
 
         Возвращает:
-        - Список моделей TaskModel.
+        - Обновленные задачи.
+
+        Исключения:
+        - TaskNameConflictError: Если одно из новых имен занято задачей пользователя, не входящей в запрос.
+         В этом случае ни одна задача не переименовывается.
         """
+        new_names_items = list(new_names.items())
+        names = [name for _, name in new_names_items]
+        try:
+            return await self._rename_tasks(new_names_items, user_id, chunk_size, with_placeholders=False)
+        except IntegrityError:
+            await self._raise_name_conflict(names, user_id, list(new_names))
+        try:
+            return await self._rename_tasks(new_names_items, user_id, chunk_size, with_placeholders=True)
+        except IntegrityError:
+            await self._raise_name_conflict(names, user_id, list(new_names))
+            raise
+
+    async def _rename_tasks(
+            self,
+            new_names_items: list[tuple[int, str]],
+            user_id: int,
+            chunk_size: int,
+            with_placeholders: bool
+    ) -> Sequence[TaskModel]:
+        """
+        Переименовывает задачи пакетами в одной транзакции.
+
+        Аргументы:
+        - new_names_items: Пары (идентификатор задачи, новое имя).
+        - user_id: Идентификатор владельца задач.
+        - chunk_size: Количество задач в одном запросе.
+        - with_placeholders: Сначала присвоить задачам временные уникальные имена, чтобы имена, которые
+         освобождаются внутри запроса, не нарушали уникальный индекс до конца переименования.
+
+        Возвращает:
+        - Обновленные задачи.
+        """
+        steps = [new_names_items]
+        if with_placeholders:
+            steps.insert(0, [(task_id, f"rename:{uuid4()}") for task_id, _ in new_names_items])
         async with self.session_factory() as session:
-            query = (
-                select(
-                        TaskModel
-                )
-                .options(
-                        selectinload(
-                                TaskModel.category
+            for items in steps:
+                updated_tasks = []
+                for start in range(0, len(items), chunk_size):
+                    chunk = items[start:start + chunk_size]
+                    new_names_values = values(
+                            column("id", Integer),
+                            column("name", String),
+                            name="new_names",
+                    ).data(
+                            chunk
+                    )
+                    query = (
+                        update(
+                                TaskModel
                         )
-                )
-                .where(
-                        TaskModel.category.has(
-                                CategoryModel.name == category_name
+                        .where(
+                                TaskModel.id == new_names_values.c.id,
+                                TaskModel.user_id == user_id
                         )
-                )
-            )
-            query_result = await session.execute(
-                    query
-            )
-            tasks = query_result.scalars().all()
-        return tasks
+                        .values(
+                                name=new_names_values.c.name
+                        )
+                        .returning(
+                                TaskModel
+                        )
+                        .execution_options(
+                                synchronize_session=False
+                        )
+                    )
+                    updated_tasks.extend((await session.execute(query)).scalars().all())
+            await session.commit()
+        return updated_tasks
 
-    async def insert_fake_data(
+    async def get_tasks_by_category_ids(
             self,
-            num_tasks: int = 20
-    ) -> None:
+            category_ids: Sequence[int]
+    ) -> Sequence[TaskModel]:
         """
-        Вставляет фиктивные данные в базу данных.
+        Получение задач по идентификаторам категорий.
 
         Описание:
-        - Удаляет все задачи и категории из базы данных.
-        - Создает фиктивные категории и задачи.
-        - Добавляет задачи в базу данных.
+        - Выполняет один запрос по индексу tasks_category_idx. Имя категории преобразуется в идентификаторы
+         заранее, по справочнику категорий в памяти процесса, поэтому соединение с category не нужно.
 
         Аргументы:
-        - num_tasks: Количество фиктивных задач для вставки (по умолчанию 20).
+        - category_ids: Идентификаторы категорий.
+
+        Возвращает:
+        - Список моделей TaskModel, отсортированных по идентификатору.
         """
-        fake = Faker()
         async with self.session_factory() as session:
-            await session.execute(
-                    delete(
+            query_result = await session.execute(
+                    select(
                             TaskModel
                     )
-            )
-            await session.execute(
-                    delete(
-                            CategoryModel
+                    .where(
+                            TaskModel.category_id == any_(
+                                    bindparam("category_ids", list(category_ids), type_=ARRAY(Integer))
+                            )
+                    )
+                    .order_by(
+                            TaskModel.id
                     )
             )
-            await session.commit()
+            tasks = query_result.scalars().all()
+        return tasks
 
-            category_ids = []
-            for _ in range(
-                    5
-            ):
-                category = CategoryModel(
-                        name=fake.job()
-                )
-                session.add(
-                        category
-                )
-                await session.flush()
-                category_ids.append(
-                        category.id
-                )
-            await session.commit()
+    async def _raise_name_conflict(
+            self,
+            names: list[str],
+            user_id: int,
+            renamed_task_ids: Sequence[int] = ()
+    ) -> None:
+        """
+        Проверяет после ошибки целостности, заняты ли имена задачами пользователя (уникальный индекс name_idx).
 
-            for _ in range(
-                    num_tasks
-            ):
-                try:
-                    task = TaskModel(
-                            name=fake.company(),
-                            pomodoro_count=fake.random_int(
-                                    min=5,
-                                    max=15
-                            ),
-                            category_id=fake.random_element(
-                                    elements=category_ids
-                            ),
-                    )
-                    session.add(
-                            task
+        Ошибку могло вызвать и другое ограничение (например, внешний ключ категории), поэтому имена проверяются
+        отдельным запросом в новой сессии: транзакция с ошибкой уже отменена.
+
+        Аргументы:
+        - names: Имена задач из запроса.
+        - user_id: Идентификатор пользователя.
+        - renamed_task_ids: Идентификаторы переименовываемых задач. Их текущие имена освобождаются,
+         поэтому они не считаются занятыми.
+
+        Исключения:
+        - TaskNameConflictError: Если хотя бы одно имя занято.
+        """
+        conditions = [TaskModel.user_id == user_id, TaskModel.name.in_(names)]
+        if renamed_task_ids:
+            conditions.append(TaskModel.id.not_in(renamed_task_ids))
+        async with self.session_factory() as session:
+            existing_name = (await session.execute(
+                    select(
+                            TaskModel.name
+                    ).where(
+                            *conditions
+                    ).limit(
+                            1
                     )
-                except Exception:  # noqa: S112
-                    continue
-            await session.commit()
-            await session.close()
+            )).scalar_one_or_none()
+        if existing_name is not None:
+            raise TaskNameConflictError
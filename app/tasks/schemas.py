@@ -1,4 +1,6 @@
-from pydantic import BaseModel, field_validator, model_validator
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 
 class TaskCreateSchema(BaseModel):
@@ -66,14 +68,57 @@ class TaskSchema(TaskCreateSchema):
         from_attributes = True
 
 
-class CategorySchema(BaseModel):
+class TaskPageSchema(BaseModel):
     """
-    Модель категории.
+    Страница задач при keyset-пагинации.
+
+    Атрибуты:
+    items (list[TaskSchema]): Задачи текущей страницы, отсортированные по идентификатору.
+    next_cursor (str | None): Курсор следующей страницы или None, если страница последняя.
+    """
+
+    items: list[TaskSchema]
+    next_cursor: str | None = None
+
+
+class TaskBulkOutcomeSchema(BaseModel):
+    """
+    Результат массовой операции для одной задачи.
+
+    Атрибуты:
+    id (int): Идентификатор задачи.
+    status (str): "deleted", "updated" или "not_found" (задача не существует или принадлежит другому пользователю).
+    task (TaskSchema | None): Обновленная задача (только для переименования).
+    """
+
+    id: int
+    status: Literal["deleted", "updated", "not_found"]
+    task: TaskSchema | None = None
+
+
+class CategoryCreateSchema(BaseModel):
+    """
+    Схема для создания и изменения категории.
 
     Атрибуты:
-    category_id (int): Идентификатор категории.
     name (str): Имя категории.
+    type (str | None): Тип категории.
     """
 
-    category_id: int
     name: str
+    type: str | None = None
+
+
+class CategorySchema(CategoryCreateSchema):
+    """
+    Модель категории.
+
+    Атрибуты:
+    id (int): Идентификатор категории.
+    name (str): Имя категории.
+    type (str | None): Тип категории.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
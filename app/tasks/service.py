@@ -1,7 +1,17 @@
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
 
-from app.exceptions import TaskNotFoundError
-from app.tasks import TaskCacheRepository, TaskRepository, TaskSchema, TaskCreateSchema
+from app.exceptions import TaskNameConflictError, TaskNotFoundError
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.tasks import (
+    TaskCacheRepository,
+    TaskRepository,
+    TaskSchema,
+    TaskCreateSchema,
+    TaskPageSchema,
+    TaskBulkOutcomeSchema,
+)
+from app.tasks.pagination import decode_cursor, encode_cursor
 
 
 @dataclass
@@ -14,37 +24,108 @@ class TaskService:
      который используется для работы с задачами в базе данных.
     task_cache_repository (TaskCacheRepository): Экземпляр класса TaskCacheRepository,
      который используется для работы с кэшем задач в Redis.
+    task_loads (SingleFlight): Объединяет одновременные загрузки одних и тех же данных при промахе кэша.
+     Чтобы объединение работало между запросами, экземпляр должен быть общим для процесса.
 
     Методы:
-    get_tasks(self) -> list[TaskSchema] | None: Получает список задач.
+    get_tasks(self, limit: int, cursor: str | None = None) -> TaskPageSchema: Получает страницу задач.
+    export_tasks(self, chunk_size: int, user_id: int | None = None) -> AsyncIterator[bytes]: Выгружает задачи в NDJSON.
     """
 
     task_repository: TaskRepository
     task_cache_repository: TaskCacheRepository
+    task_loads: SingleFlight = field(default_factory=SingleFlight)
 
     async def get_tasks(
-            self
-    ) -> list[TaskSchema] | None:
+            self,
+            limit: int,
+            cursor: str | None = None
+    ) -> TaskPageSchema:
         """
-        Получает список задач.
+        Получает страницу задач.
 
         Описание:
-        - Пытается получить список задач из кэша.
-        - Если список задач не найден в кэше, получает список задач из базы данных.
-        - Сохраняет список задач в кэш.
+        - Декодирует курсор в идентификатор последней задачи предыдущей страницы.
+        - Пытается получить страницу из кэша текущего поколения.
+        - Если страницы нет в кэше, загружает ее из базы данных и сохраняет в кэш.
+         Одновременные промахи по одной и той же странице выполняют одну общую загрузку.
+
+        :param limit: Размер страницы.
+        :param cursor: Курсор, полученный на предыдущей странице.
+        :raise InvalidCursorError: Если курсор некорректен.
+        :return: Страница задач.
+        """
+        after_id = decode_cursor(cursor)
+        # Поколение читается до обращения к базе: если задачи изменятся во время выборки,
+        # страница запишется в уже устаревшее поколение и не будет прочитана.
+        generation = await self.task_cache_repository.get_tasks_generation()
+        if page := await self.task_cache_repository.get_tasks_page(generation, after_id, limit):
+            return page
+
+        return await self.task_loads.do(
+                ("tasks_page", generation, after_id, limit),
+                lambda: self._load_tasks_page(generation, after_id, limit),
+        )
+
+    async def _load_tasks_page(
+            self,
+            generation: int,
+            after_id: int | None,
+            limit: int
+    ) -> TaskPageSchema:
+        """
+        Загружает страницу задач из базы данных и сохраняет ее в кэш.
+
+        Из базы выбирается limit + 1 задач: лишняя задача нужна только для того,
+        чтобы понять, есть ли следующая страница.
+
+        :param generation: Поколение кэша общего списка задач.
+        :param after_id: Идентификатор последней задачи предыдущей страницы.
+        :param limit: Размер страницы.
+        :return: Страница задач.
+        """
+        tasks = await self.task_repository.get_tasks_page(limit + 1, after_id)
+        items = [TaskSchema.model_validate(task) for task in tasks[:limit]]
+        next_cursor = encode_cursor(items[-1].id) if len(tasks) > limit else None
+        page = TaskPageSchema(items=items, next_cursor=next_cursor)
+        await self.task_cache_repository.set_tasks_page(generation, after_id, limit, page)
+        return page
+
+    async def export_tasks(
+            self,
+            chunk_size: int,
+            user_id: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгружает задачи в формате NDJSON.
+
+        Описание:
+        - Читает задачи из базы данных серверным курсором.
+        - Каждая задача сериализуется в отдельную строку JSON.
+        - Строки отдаются блоками по chunk_size, чтобы не отправлять клиенту каждую строку отдельным фрагментом.
+
+        :param chunk_size: Количество задач в одном блоке ответа.
+        :param user_id: Идентификатор пользователя (None - все задачи).
+        :return: Асинхронный итератор блоков NDJSON.
+        """
+        lines = []
+        async for task in self.task_repository.stream_tasks(user_id, chunk_size):
+            lines.append(TaskSchema.model_validate(task).model_dump_json())
+            if len(lines) >= chunk_size:
+                yield ("\n".join(lines) + "\n").encode()
+                lines.clear()
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
 
-        Возвращает:
-        - Список задач в формате TaskSchema, если задачи найдены.
-        - None, если список задач пуст или ключ отсутствует.
+    def get_cache_stats(
+            self
+    ) -> dict:
         """
-        if all_tasks := await self.task_cache_repository.get_tasks():
-            pass
-        else:
-            all_tasks = await self.task_repository.get_tasks()
-            tasks_schema = [TaskSchema.model_validate(task) for task in all_tasks]
-            await self.task_cache_repository.set_tasks(tasks_schema)
+        Возвращает счетчики попаданий и промахов кэша задач по уровням.
 
-        return all_tasks
+        :return: Словарь со статистикой in-process кэша и Redis.
+        """
+        return self.task_cache_repository.get_stats()
 
     async def create_task(
             self,
@@ -57,9 +138,31 @@ class TaskService:
         :param user_id: Идентификатор пользователя.
         :return: Информация о задаче.
         """
-        task_id = await self.task_repository.create_task(body, user_id)
-        task = await self.task_repository.get_task_by_id(task_id)
-        return TaskSchema.model_validate(task)
+        task = TaskSchema.model_validate(await self.task_repository.create_task(body, user_id))
+        await self.task_cache_repository.set_user_task(task)
+        return task
+
+    async def create_tasks(
+            self,
+            bodies: list[TaskCreateSchema],
+            user_id: int
+    ) -> list[TaskSchema]:
+        """
+        Создает задачи одним запросом к базе данных.
+
+        Кэш задач пользователя сбрасывается один раз на весь пакет.
+        :param bodies: Список объектов TaskCreateSchema.
+        :param user_id: Идентификатор пользователя.
+        :raise TaskNameConflictError: Если имена в запросе повторяются или у пользователя уже есть задача
+         с одним из имен. Задачи без имени не конфликтуют: уникальный индекс name_idx не сравнивает NULL.
+        :return: Созданные задачи.
+        """
+        names = [body.name for body in bodies if body.name is not None]
+        if len(set(names)) != len(names):
+            raise TaskNameConflictError
+        tasks = await self.task_repository.create_tasks(bodies, user_id)
+        await self.task_cache_repository.invalidate_user_tasks(user_id)
+        return [TaskSchema.model_validate(task) for task in tasks]
 
     async def update_task_name(
             self,
@@ -78,7 +181,9 @@ class TaskService:
         updated_task = await self.task_repository.update_task_name(task_id, name, user_id)
         if not updated_task:
             raise TaskNotFoundError
-        return TaskSchema.model_validate(updated_task)
+        task = TaskSchema.model_validate(updated_task)
+        await self.task_cache_repository.set_user_task(task)
+        return task
 
     async def delete_task(
             self,
@@ -89,10 +194,64 @@ class TaskService:
         :param task_id: Идентификатор задачи
         :raise TaskNotFoundError: Если задачи для обновления не существует.
         """
-        updated_task = await self.task_repository.delete_task(task_id)
-        await self.task_cache_repository.delete_task(task_id)
-        if not updated_task:
+        owner_id = await self.task_repository.delete_task(task_id)
+        if owner_id is None:
             raise TaskNotFoundError
+        await self.task_cache_repository.delete_user_task(owner_id, task_id)
+
+    async def delete_tasks(
+            self,
+            task_ids: list[int],
+            user_id: int,
+            chunk_size: int
+    ) -> list[TaskBulkOutcomeSchema]:
+        """
+        Удаляет задачи пользователя пакетами.
+
+        Кэш задач пользователя сбрасывается один раз на весь запрос.
+        :param task_ids: Идентификаторы задач.
+        :param user_id: Идентификатор пользователя.
+        :param chunk_size: Количество задач в одном SQL-запросе.
+        :return: Результат по каждой задаче.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        deleted_ids = set(await self.task_repository.delete_tasks(task_ids, user_id, chunk_size))
+        if deleted_ids:
+            await self.task_cache_repository.invalidate_user_tasks(user_id)
+        return [
+            TaskBulkOutcomeSchema(id=task_id, status="deleted" if task_id in deleted_ids else "not_found")
+            for task_id in task_ids
+        ]
+
+    async def update_task_names(
+            self,
+            new_names: dict[int, str],
+            user_id: int,
+            chunk_size: int
+    ) -> list[TaskBulkOutcomeSchema]:
+        """
+        Переименовывает задачи пользователя пакетами.
+
+        Кэш задач пользователя сбрасывается один раз на весь запрос.
+        :param new_names: Новые имена задач по их идентификаторам.
+        :param user_id: Идентификатор пользователя.
+        :param chunk_size: Количество задач в одном SQL-запросе.
+        :raise TaskNameConflictError: Если новые имена в запросе повторяются или одно из них занято задачей
+         пользователя, не входящей в запрос. Обмен имен между задачами запроса допускается.
+        :return: Результат по каждой задаче.
+        """
+        if len(set(new_names.values())) != len(new_names):
+            raise TaskNameConflictError
+        updated_tasks = await self.task_repository.update_task_names(new_names, user_id, chunk_size)
+        if updated_tasks:
+            await self.task_cache_repository.invalidate_user_tasks(user_id)
+        updated = {task.id: TaskSchema.model_validate(task) for task in updated_tasks}
+        return [
+            TaskBulkOutcomeSchema(id=task_id, status="updated", task=updated[task_id])
+            if task_id in updated
+            else TaskBulkOutcomeSchema(id=task_id, status="not_found")
+            for task_id in new_names
+        ]
 
     async def get_task_by_id(
             self,
@@ -122,6 +281,34 @@ class TaskService:
             raise TaskNotFoundError
         return TaskSchema.model_validate(task)
 
+    async def search_user_tasks(
+            self,
+            user_id: int,
+            query: str,
+            limit: int
+    ) -> list[TaskSchema]:
+        """
+        Ищет задачи пользователя по имени: подстрока, префикс или похожее слово.
+        :param user_id: Идентификатор пользователя.
+        :param query: Строка поиска.
+        :param limit: Максимальное количество результатов.
+        :return: Найденные задачи в порядке релевантности.
+        """
+        tasks = await self.task_repository.search_user_tasks(user_id, query, limit)
+        return [TaskSchema.model_validate(task) for task in tasks]
+
+    async def get_tasks_by_category_ids(
+            self,
+            category_ids: Sequence[int]
+    ) -> list[TaskSchema]:
+        """
+        Возвращает задачи указанных категорий.
+        :param category_ids: Идентификаторы категорий (см. CategoryService.get_category_ids_by_name).
+        :return: Задачи, отсортированные по идентификатору.
+        """
+        tasks = await self.task_repository.get_tasks_by_category_ids(category_ids)
+        return [TaskSchema.model_validate(task) for task in tasks]
+
     async def get_tasks_by_current_user(
             self,
             user_id: int,
@@ -147,12 +334,30 @@ class TaskService:
         :raise TaskNotFoundError: Если задачи для обновления не существует.
         :return: Задачи пользователя.
         """
-        if user_tasks := await self.task_cache_repository.get_user_tasks(user_id):
-            pass
-        else:
-            if user_tasks := await self.task_repository.get_user_tasks(user_id):
-                tasks_schema = [TaskSchema.model_validate(task) for task in user_tasks]
-                await self.task_cache_repository.set_user_tasks(user_id, tasks_schema)
-            raise TaskNotFoundError
+        generation = await self.task_cache_repository.get_user_tasks_generation(user_id)
+        if user_tasks := await self.task_cache_repository.get_user_tasks(user_id, generation):
+            return user_tasks
 
+        return await self.task_loads.do(
+                ("user_tasks", user_id, generation),
+                lambda: self._load_user_tasks(user_id, generation),
+        )
+
+    async def _load_user_tasks(
+            self,
+            user_id: int,
+            generation: int
+    ) -> list[TaskSchema]:
+        """
+        Загружает задачи пользователя из базы данных и сохраняет их в кэш.
+
+        :param user_id: Идентификатор пользователя.
+        :param generation: Поколение кэша задач пользователя.
+        :raise TaskNotFoundError: Если у пользователя нет задач.
+        :return: Задачи пользователя.
+        """
+        if not (tasks := await self.task_repository.get_user_tasks(user_id)):
+            raise TaskNotFoundError
+        user_tasks = [TaskSchema.model_validate(task) for task in tasks]
+        await self.task_cache_repository.set_user_tasks(user_id, generation, user_tasks)
         return user_tasks
@@ -1,11 +1,20 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Form
+from fastapi import APIRouter, Depends, Form, HTTPException
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
 
-from app.dependencies import get_auth_service, UserGetterFromToken, get_token_payload
+from app.dependencies import (
+    get_auth_service,
+    get_request_user_id,
+    get_token_payload,
+    get_token_service,
+    UserGetterFromToken,
+)
+from app.exceptions import ExecutorSaturatedError
 from app.settings.main_settings import Settings
 from app.users.auth import AuthService
 from app.users.auth.token.schemas import TokenResponseInfo
+from app.users.auth.token.service import TokenService
 from app.users.users_profile import UserSchema
 
 settings = Settings()
@@ -22,33 +31,84 @@ async def auth_user_jwt(
         username: str = Form(...),
         password: str = Form(...),
 ) -> TokenResponseInfo:
-    valid_user = await auth_service.validate_user(username, password)
-    user_tokens = await auth_service.user_login(valid_user)
+    """
+    Вход пользователя по имени и паролю.
+
+    Возвращает:
+    - Токены доступа и обновления. Если пул потоков для проверки пароля перегружен, ответ 503 с Retry-After.
+    """
+    try:
+        valid_user = await auth_service.validate_user(username, password)
+        user_tokens = await auth_service.user_login(valid_user)
+    except ExecutorSaturatedError as error:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=error.detail, headers={"Retry-After": "1"})
     return user_tokens
 
 
-#
 @router.post(
         "/refresh",
         response_model=TokenResponseInfo,
         response_model_exclude_none=True
 )
-def refresh_user_jwt(
+async def refresh_user_jwt(
         auth_service: Annotated[AuthService, Depends(get_auth_service)],
         user: UserSchema = Depends(UserGetterFromToken(settings.auth_jwt.refresh_token_type)),
-):
-    access_token = auth_service.create_access_token(user)
+) -> TokenResponseInfo:
+    """
+    Выпуск нового токена доступа по токену обновления.
+
+    Возвращает:
+    - Токен доступа. Токен подписывается в пуле потоков; если пул перегружен, ответ 503 с Retry-After.
+    """
+    try:
+        access_token = await auth_service.crypto_executor.run(auth_service.create_access_token, user)
+    except ExecutorSaturatedError as error:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=error.detail, headers={"Retry-After": "1"})
     return TokenResponseInfo(
             access_token=access_token,
     )
 
 
 @router.get("/me")
-def get_info_about_me(
+async def get_info_about_me(
         payload: dict = Depends(get_token_payload),
         user: UserSchema = Depends(UserGetterFromToken(settings.auth_jwt.access_token_type)),
-):
+) -> dict:
+    """
+    Данные текущего пользователя.
+
+    Возвращает:
+    - Профиль пользователя из токена доступа и время выпуска токена (logged_in).
+    """
     return {
         **user.dict(),
         "logged_in": payload["iat"],
     }
+
+
+@router.get("/token-cache/stats", dependencies=[Depends(get_request_user_id)])
+async def get_token_cache_stats(
+        token_service: Annotated[TokenService, Depends(get_token_service)],
+) -> dict:
+    """
+    Статистика кэша проверенных токенов. Доступна только с токеном доступа активного пользователя.
+
+    Возвращает:
+    - Количество попаданий и промахов, долю попаданий и количество записей в кэше текущего воркера.
+    """
+    return token_service.get_verified_cache_stats()
+
+
+@router.get("/crypto-executor/stats", dependencies=[Depends(get_request_user_id)])
+async def get_crypto_executor_stats(
+        auth_service: Annotated[AuthService, Depends(get_auth_service)],
+) -> dict:
+    """
+    Статистика пула потоков для хэширования паролей и подписи токенов. Доступна только с токеном доступа
+    активного пользователя.
+
+    Возвращает:
+    - Количество потоков, выполняемых и ожидающих вызовов, количество принятых, завершенных
+     и отклоненных (ответ 503) вызовов, среднее и максимальное время ожидания и выполнения в миллисекундах.
+    """
+    return auth_service.crypto_executor.get_stats()
@@ -0,0 +1,166 @@
+"""
+Хэширование паролей bcrypt с подобранной под оборудование стоимостью.
+
+Стоимость bcrypt (rounds) задает количество итераций 2^rounds: каждая единица удваивает время хэширования.
+Стоимость записывается в сам хэш ($2b$<rounds>$...), поэтому хэши с разной стоимостью проверяются одинаково.
+
+При запуске приложения calibrate замеряет хэширование с минимальной стоимостью и выбирает наибольшую стоимость,
+при которой расчетное время хэширования не превышает целевого. Если стоимость задана в настройках явно,
+замер не выполняется: при нескольких воркерах и серверах так исключается ситуация, когда воркеры выбрали
+разную стоимость и перехэшируют пароли друг за другом.
+
+После успешного входа пароль, хэш которого имеет другую стоимость, перехэшируется (needs_rehash),
+поэтому стоимость можно изменить без сброса паролей: хэши обновляются по мере входа пользователей.
+"""
+
+import logging
+import time
+
+import bcrypt
+
+from app.settings.main_settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Пароль, на котором замеряется время хэширования. Время bcrypt не зависит от пароля
+CALIBRATION_PASSWORD = b"calibration-password"
+
+
+def get_bcrypt_rounds(hashed_password: bytes) -> int | None:
+    """
+    Возвращает стоимость, записанную в хэше bcrypt.
+
+    :param hashed_password: Хэш вида $2b$12$<соль и хэш>.
+    :return: Стоимость или None, если хэш имеет другой формат.
+    """
+    parts = hashed_password.split(b"$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def calibrate_bcrypt_rounds(
+        target_seconds: float,
+        min_rounds: int,
+        max_rounds: int,
+        samples: int = 3
+) -> int:
+    """
+    Подбирает стоимость bcrypt, при которой хэширование занимает не больше target_seconds.
+
+    Замеряется хэширование с минимальной стоимостью (лучшее время из samples замеров), а время для большей
+    стоимости рассчитывается удвоением: так калибровка занимает samples хэширований с минимальной стоимостью,
+    а не несколько хэширований с целевым временем.
+
+    :param target_seconds: Целевое время хэширования одного пароля в секундах.
+    :param min_rounds: Минимальная стоимость. Возвращается, даже если она медленнее целевого времени.
+    :param max_rounds: Максимальная стоимость.
+    :param samples: Количество замеров.
+    :return: Стоимость bcrypt.
+    """
+    elapsed = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(CALIBRATION_PASSWORD, bcrypt.gensalt(rounds=min_rounds))
+        elapsed.append(time.perf_counter() - started_at)
+    seconds = min(elapsed)
+    rounds = min_rounds
+    while rounds < max_rounds and seconds * 2 <= target_seconds:
+        seconds *= 2
+        rounds += 1
+    return rounds
+
+
+class PasswordHasher:
+    """
+    Хэширует и проверяет пароли bcrypt.
+
+    Атрибуты:
+    rounds (int): Текущая стоимость bcrypt новых хэшей.
+    target_seconds (float): Целевое время хэширования для калибровки.
+    min_rounds (int): Минимальная стоимость.
+    max_rounds (int): Максимальная стоимость.
+    fixed_rounds (int | None): Стоимость из настроек. Если задана, калибровка не выполняется.
+
+    Методы:
+    hash(self, password: str) -> bytes: Хэширует пароль с текущей стоимостью.
+    verify(self, password: str, hashed_password: bytes) -> bool: Проверяет пароль.
+    needs_rehash(self, hashed_password: bytes) -> bool: Проверяет, отличается ли стоимость хэша от текущей.
+    calibrate(self) -> int: Подбирает и устанавливает стоимость.
+    """
+
+    def __init__(
+            self,
+            target_seconds: float,
+            min_rounds: int,
+            max_rounds: int,
+            fixed_rounds: int | None = None
+    ):
+        self.target_seconds = target_seconds
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.fixed_rounds = fixed_rounds
+        # До калибровки используется стоимость по умолчанию bcrypt
+        self.rounds = fixed_rounds or 12
+
+    def hash(self, password: str) -> bytes:
+        """
+        Хэширует пароль с текущей стоимостью.
+
+        :param password: Оригинальный пароль.
+        :return: Хэш пароля.
+        """
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=self.rounds))
+
+    @staticmethod
+    def verify(
+            password: str,
+            hashed_password: bytes
+    ) -> bool:
+        """
+        Проверяет пароль. Стоимость берется из хэша.
+
+        :param password: Оригинальный пароль.
+        :param hashed_password: Хэш пароля.
+        :return: True, если пароль совпадает с хэшем.
+        """
+        return bcrypt.checkpw(password.encode(), hashed_password)
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """Проверяет, отличается ли стоимость хэша от текущей стоимости."""
+        return get_bcrypt_rounds(hashed_password) != self.rounds
+
+    def calibrate(self) -> int:
+        """
+        Подбирает стоимость под целевое время хэширования и использует ее для новых хэшей.
+
+        :return: Установленная стоимость.
+        """
+        if self.fixed_rounds is not None:
+            self.rounds = self.fixed_rounds
+        else:
+            self.rounds = calibrate_bcrypt_rounds(self.target_seconds, self.min_rounds, self.max_rounds)
+        logger.info(
+                "bcrypt cost set to %s (target %.3f s, %s)",
+                self.rounds,
+                self.target_seconds,
+                "fixed" if self.fixed_rounds is not None else "calibrated",
+        )
+        return self.rounds
+
+
+def create_password_hasher(settings: Settings) -> PasswordHasher:
+    """
+    Создает хэшер паролей с параметрами bcrypt из настроек.
+
+    Стоимость новых хэшей устанавливается вызовом calibrate: приложение вызывает его в lifespan,
+    скрипты (seeder, бенчмарки) - перед хэшированием, чтобы их хэши не перехэшировались при входе.
+    :param settings: Настройки приложения.
+    :return: Хэшер паролей.
+    """
+    return PasswordHasher(
+            target_seconds=settings.bcrypt_target_seconds,
+            min_rounds=settings.bcrypt_min_rounds,
+            max_rounds=settings.bcrypt_max_rounds,
+            fixed_rounds=settings.bcrypt_rounds,
+    )
@@ -1,17 +1,26 @@
+import asyncio
+import logging
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-import bcrypt
-
+from app.exceptions import ExecutorSaturatedError
+from app.infrastructure.executor import BoundedExecutor
 from app.settings.main_settings import Settings
 from app.users.auth.exceptions import UnauthorisedError, UserIsNotActiveError
+from app.users.auth.password import PasswordHasher
 from app.users.auth.token.schemas import TokenResponseInfo
 from app.users.users_profile import UserSchema
 
 if TYPE_CHECKING:
     from app.users.auth.token.service import TokenService
     from app.users.users_profile import UserRepository
+    from app.users.users_profile.cache_repository import UserCacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Выполняемые фоновые перехэширования паролей. Ссылки хранятся, чтобы задачи не удалил сборщик мусора
+_rehash_tasks: set[asyncio.Task] = set()
 
 
 @dataclass
@@ -23,10 +32,17 @@ class AuthService:
     user_repository (UserRepository): Экземпляр класса UserRepository, который используется
      для работы с пользователями в базе данных.
     settings (Settings): Экземпляр класса Settings, который содержит настройки приложения.
+    crypto_executor (BoundedExecutor): Пул потоков, в котором хэшируются пароли и подписываются токены,
+     чтобы не блокировать event loop.
+    password_hasher (PasswordHasher): Хэшер паролей bcrypt с подобранной при запуске стоимостью.
+    user_cache_repository (UserCacheRepository | None): Кэш профилей пользователей, сбрасываемый
+     после перехэширования пароля.
 
     Методы:
     user_login(self, username: str, password: str) -> UserLoginSchema | None: Пытается выполнить вход пользователя
      с указанными данными.
+    create_tokens(self, user: UserSchema) -> TokenResponseInfo: Создает токены доступа и обновления в пуле потоков.
+    create_password_hash(self, password: str) -> bytes: Хэширует пароль в пуле потоков.
     _validate_user(self, user: UserProfile, password: str) -> None: Проверяет, что пользователь существует
      и пароль верный.
     generate_access_token(self, user_id: int) -> str: Генерирует токен доступа для пользователя.
@@ -35,16 +51,48 @@ class AuthService:
     user_repository: "UserRepository"
     settings: Settings
     token_service: "TokenService"
+    crypto_executor: BoundedExecutor
+    password_hasher: PasswordHasher
+    user_cache_repository: "UserCacheRepository | None" = None
 
     async def user_login(
             self,
             user: UserSchema
     ) -> TokenResponseInfo | None:
+        return await self.create_tokens(user)
+
+    async def create_tokens(
+            self,
+            user: UserSchema
+    ) -> TokenResponseInfo:
+        """
+        Создает токены доступа и обновления. Токены подписываются в пуле потоков одним вызовом.
+
+        :param user: Объект пользователя, для которого создаются токены.
+        :raises ExecutorSaturatedError: Если очередь пула потоков заполнена.
+        :return: Токены доступа и обновления.
+        """
+        access_token, refresh_token = await self.crypto_executor.run(
+                lambda: (self.create_access_token(user), self.create_refresh_token(user))
+        )
         return TokenResponseInfo(
-                access_token=self.create_access_token(user),
-                refresh_token=self.create_refresh_token(user)
+                access_token=access_token,
+                refresh_token=refresh_token
         )
 
+    async def create_password_hash(
+            self,
+            password: str
+    ) -> bytes:
+        """
+        Хэширует пароль в пуле потоков.
+
+        :param password: Оригинальный пароль.
+        :raises ExecutorSaturatedError: Если очередь пула потоков заполнена.
+        :return: Хэшированный пароль.
+        """
+        return await self.crypto_executor.run(self.password_hasher.hash, password)
+
     async def validate_user(
             self,
             username: str,
@@ -53,20 +101,49 @@ class AuthService:
         """
         Проверяет корректность имени пользователя и пароля.
 
+        Если стоимость bcrypt хэша пароля отличается от текущей, после успешной проверки пароль
+        перехэшируется в фоне: ответ на вход не ждет хэширования.
         :param username: Имя пользователя из формы.
         :param password: Пароль из формы.
         :return: Данные пользователя при успешной проверке.
         :raises UnauthorisedError: Если имя пользователя или пароль неверны.
         :raises UserIsNotActiveError: Если пользователь неактивен.
+        :raises ExecutorSaturatedError: Если очередь пула потоков, в котором проверяется пароль, заполнена.
         """
         if not (user := await self.user_repository.get_user_by_name(username)):
             raise UnauthorisedError
-        if not self.validate_password(password, user.password):
+        if not await self.crypto_executor.run(self.password_hasher.verify, password, user.password):
             raise UnauthorisedError
         if not user.active:
             raise UserIsNotActiveError
+        if self.password_hasher.needs_rehash(user.password):
+            task = asyncio.create_task(self._rehash_password(user.id, password))
+            _rehash_tasks.add(task)
+            task.add_done_callback(_rehash_tasks.discard)
         return UserSchema.model_validate(user)
 
+    async def _rehash_password(
+            self,
+            user_id: int,
+            password: str
+    ) -> None:
+        """
+        Хэширует пароль с текущей стоимостью bcrypt и сохраняет новый хэш.
+
+        Если пул потоков перегружен, перехэширование пропускается и будет выполнено при следующем входе.
+        :param user_id: Идентификатор пользователя.
+        :param password: Пароль, прошедший проверку.
+        """
+        try:
+            password_hash = await self.crypto_executor.run(self.password_hasher.hash, password)
+            await self.user_repository.update_password(user_id, password_hash)
+            if self.user_cache_repository is not None:
+                await self.user_cache_repository.invalidate(user_id)
+        except ExecutorSaturatedError:
+            logger.debug("Crypto executor is saturated, password rehash for user %s postponed", user_id)
+        except Exception:
+            logger.exception("Failed to rehash password for user %s", user_id)
+
     def create_access_token(self, user: UserSchema) -> str:
         """
         Создает JWT-токен доступа для указанного пользователя.
@@ -102,20 +179,18 @@ class AuthService:
                 expire_timedelta=timedelta(days=self.settings.auth_jwt.refresh_token_expire_days)
         )
 
-    @staticmethod
-    def hash_password(password: str) -> bytes:
+    def hash_password(self, password: str) -> bytes:
         """
-        Хэширует пароль с использованием алгоритма bcrypt.
+        Хэширует пароль с использованием алгоритма bcrypt и текущей стоимостью хэшера сервиса.
 
+        Хэширование выполняется в текущем потоке; обработчики запросов используют create_password_hash.
         :param password: Оригинальный пароль в виде строки.
         :return: Хэшированный пароль в виде байтов.
         """
-        salt = bcrypt.gensalt()
-        pwd_bytes = password.encode()
-        return bcrypt.hashpw(pwd_bytes, salt)
+        return self.password_hasher.hash(password)
 
-    @staticmethod
     def validate_password(
+            self,
             password: str,
             hashed_password: bytes
     ) -> bool:
@@ -126,7 +201,7 @@ class AuthService:
         :param hashed_password: Хэшированный пароль.
         :return: True, если пароли совпадают, иначе False.
         """
-        return bcrypt.checkpw(
-                password.encode(),
+        return self.password_hasher.verify(
+                password,
                 hashed_password
         )
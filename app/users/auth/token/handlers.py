@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from app.dependencies import get_token_service
+from app.users.auth.token.service import TokenService
+
+# Время, на которое клиенты могут закэшировать JWKS. Токен с неизвестным kid клиент должен
+# проверить, перезапросив JWKS, поэтому большое значение не мешает смене ключа.
+JWKS_CACHE_MAX_AGE = 300
+
+router = APIRouter(
+        tags=["auth"],
+)
+
+
+@router.get("/.well-known/jwks.json")
+async def get_jwks(
+        response: Response,
+        token_service: Annotated[TokenService, Depends(get_token_service)],
+) -> dict:
+    """
+    Открытые ключи проверки подписи JWT.
+
+    Описание:
+    - Возвращает текущий ключ подписи и ключи, которыми еще проверяются токены после смены ключа (RFC 7517).
+    - Ключ токена определяется по kid из заголовка токена.
+    """
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_CACHE_MAX_AGE}"
+    return token_service.key_manager.get_jwks()
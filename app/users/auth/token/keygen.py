@@ -0,0 +1,130 @@
+"""
+Генерация ключей подписи JWT.
+
+Поддерживаемые алгоритмы: EdDSA (Ed25519), ES256 (EC P-256) и RS256 (RSA). С флагом --rotate текущий открытый
+ключ сначала копируется в файл предыдущего ключа, поэтому токены, подписанные им, продолжают проверяться
+(в том числе при переходе на другой алгоритм). Файлы заменяются атомарно: приложение перечитывает ключи
+при изменении файлов и не должно увидеть записанный не полностью файл.
+
+Модуль запускается как скрипт, а не через python -m app...: импорт пакета app загружает настройки,
+которые требуют существующих файлов ключей.
+
+Запуск:
+    python app/users/auth/token/keygen.py --algorithm EdDSA
+    python app/users/auth/token/keygen.py --algorithm EdDSA --rotate
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+CERT_DIR = Path(__file__).resolve().parents[3] / "cert"
+
+KEY_ALGORITHMS = ("EdDSA", "ES256", "RS256")
+
+
+def generate_private_key(
+        algorithm: str,
+        rsa_key_size: int = 2048
+) -> PrivateKeyTypes:
+    """
+    Генерирует приватный ключ для алгоритма подписи.
+
+    :param algorithm: Алгоритм подписи: EdDSA, ES256 или RS256.
+    :param rsa_key_size: Размер RSA-ключа в битах.
+    :raises ValueError: Если алгоритм не поддерживается.
+    :return: Объект приватного ключа cryptography.
+    """
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=rsa_key_size)
+    raise ValueError(f"Unsupported JWT key algorithm {algorithm}")
+
+
+def write_file_atomically(
+        path: Path,
+        data: bytes,
+        mode: int = 0o644
+) -> None:
+    """
+    Записывает файл целиком во временный файл в том же каталоге и заменяет им исходный.
+
+    :param path: Путь к файлу.
+    :param data: Содержимое.
+    :param mode: Права доступа к файлу.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.chmod(temporary_path, mode)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def write_key_pair(
+        private_key: PrivateKeyTypes,
+        private_key_path: Path,
+        public_key_path: Path
+) -> None:
+    """
+    Записывает приватный ключ (PKCS#8) и открытый ключ (SubjectPublicKeyInfo) в PEM-файлы.
+
+    :param private_key: Объект приватного ключа cryptography.
+    :param private_key_path: Путь к файлу приватного ключа.
+    :param public_key_path: Путь к файлу открытого ключа.
+    """
+    write_file_atomically(
+            public_key_path,
+            private_key.public_key().public_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+    )
+    write_file_atomically(
+            private_key_path,
+            private_key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.PKCS8,
+                    serialization.NoEncryption(),
+            ),
+            mode=0o600,
+    )
+
+
+def main() -> None:
+    """Генерирует пару ключей и, с --rotate, сохраняет текущий открытый ключ как предыдущий."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithm", choices=KEY_ALGORITHMS, default="EdDSA", help="Алгоритм подписи")
+    parser.add_argument("--rsa-key-size", type=int, default=2048, help="Размер RSA-ключа в битах")
+    parser.add_argument("--rotate", action="store_true", help="Сохранить текущий открытый ключ как предыдущий")
+    parser.add_argument("--private-key", type=Path, default=CERT_DIR / "jwt-private.pem")
+    parser.add_argument("--public-key", type=Path, default=CERT_DIR / "jwt-public.pem")
+    parser.add_argument("--previous-public-key", type=Path, default=CERT_DIR / "jwt-public-previous.pem")
+    args = parser.parse_args()
+
+    if args.rotate:
+        if not args.public_key.exists():
+            parser.error(f"{args.public_key} does not exist, nothing to rotate")
+        write_file_atomically(args.previous_public_key, args.public_key.read_bytes())
+        print(f"Current public key saved to {args.previous_public_key}")  # noqa: T201
+    elif args.private_key.exists():
+        parser.error(f"{args.private_key} already exists, use --rotate to replace it")
+
+    write_key_pair(generate_private_key(args.algorithm, args.rsa_key_size), args.private_key, args.public_key)
+    print(f"{args.algorithm} key pair written to {args.private_key} and {args.public_key}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
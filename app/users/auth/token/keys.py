@@ -0,0 +1,293 @@
+"""
+Ключи подписи и проверки JWT.
+
+Ключи читаются из файлов и разбираются в объекты cryptography один раз, а не на каждом запросе:
+PyJWT принимает готовые объекты ключей и не разбирает PEM повторно.
+
+Каждый ключ идентифицируется kid - отпечатком открытого ключа по RFC 7638. Токен подписывается текущим
+приватным ключом, и его kid записывается в заголовок токена. Проверка выбирает открытый ключ по kid из набора:
+открытый ключ текущего приватного ключа, public_key_path и previous_public_key_paths.
+
+Алгоритм подписи определяется типом ключа: Ed25519 - EdDSA, EC P-256 - ES256 (P-384 - ES384, P-521 - ES512),
+RSA - алгоритм из настройки algorithm. Токен проверяется алгоритмом своего ключа, поэтому при переходе
+на другой алгоритм токены, подписанные старым ключом, принимаются до истечения, как при обычной смене ключа.
+
+Ключ можно сменить без простоя (python app/users/auth/token/keygen.py --rotate выполняет шаги 1 и 2):
+1. Скопировать текущий открытый ключ в файл из previous_public_key_paths.
+2. Заменить файлы private_key_path и public_key_path новой парой ключей.
+3. После истечения всех токенов, подписанных старым ключом, удалить его из previous_public_key_paths.
+
+Файлы проверяются на изменение (по времени изменения и размеру) не чаще раза в keys_reload_interval секунд.
+Если пришел токен с неизвестным kid, его мог подписать воркер, который уже перечитал ключи, поэтому файлы
+проверяются внеочередно. kid задает клиент, поэтому внеочередная проверка выполняется только для kid в формате
+отпечатка (43 символа base64url) и не чаще раза в keys_unknown_kid_check_interval секунд: токены с произвольным
+kid не вызывают обращений к файловой системе на каждом запросе.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes, PublicKeyTypes
+
+from app.settings.auth_settings import AuthJWT
+
+logger = logging.getLogger(__name__)
+
+# Обязательные параметры JWK каждого типа ключа, по которым вычисляется отпечаток (RFC 7638)
+JWK_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+# Формат kid: отпечаток SHA-256 (RFC 7638) в base64url без выравнивания
+KID_PATTERN = re.compile(r"[A-Za-z0-9_-]{43}")
+
+# Алгоритмы подписи ключами EC по имени кривой
+EC_CURVE_ALGORITHMS = {
+    "secp256r1": "ES256",
+    "secp384r1": "ES384",
+    "secp521r1": "ES512",
+}
+
+
+def get_key_algorithm(
+        key: PublicKeyTypes,
+        rsa_algorithm: str
+) -> str:
+    """
+    Определяет алгоритм подписи по типу ключа.
+
+    :param key: Объект открытого ключа cryptography.
+    :param rsa_algorithm: Алгоритм подписи RSA-ключами (RS256, PS256 и т.п.).
+    :raises ValueError: Если тип ключа или кривая не поддерживаются.
+    :return: Имя алгоритма JWT.
+    """
+    if isinstance(key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    if isinstance(key, ec.EllipticCurvePublicKey):
+        if key.curve.name not in EC_CURVE_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT key curve {key.curve.name}")
+        return EC_CURVE_ALGORITHMS[key.curve.name]
+    if isinstance(key, rsa.RSAPublicKey):
+        return rsa_algorithm
+    raise ValueError(f"Unsupported JWT key type {type(key).__name__}")
+
+
+def get_jwk_thumbprint(jwk: dict) -> str:
+    """
+    Вычисляет отпечаток открытого ключа по RFC 7638.
+
+    :param jwk: Открытый ключ в формате JWK.
+    :return: Отпечаток SHA-256 в base64url без выравнивания.
+    """
+    members = {name: jwk[name] for name in JWK_THUMBPRINT_MEMBERS[jwk["kty"]]}
+    digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True)
+class JWTPublicKey:
+    """
+    Открытый ключ проверки подписи.
+
+    Атрибуты:
+    kid (str): Идентификатор ключа.
+    algorithm (str): Алгоритм подписи.
+    key (PublicKeyTypes): Объект открытого ключа cryptography.
+    jwk (dict): Открытый ключ в формате JWK (с kid, alg и use) для публикации в JWKS.
+    """
+
+    kid: str
+    algorithm: str
+    key: PublicKeyTypes
+    jwk: dict
+
+    @classmethod
+    def from_key(
+            cls,
+            key: PublicKeyTypes,
+            rsa_algorithm: str
+    ) -> "JWTPublicKey":
+        """
+        Создает открытый ключ, определяет его алгоритм и вычисляет kid.
+
+        :param key: Объект открытого ключа cryptography.
+        :param rsa_algorithm: Алгоритм подписи RSA-ключами.
+        :return: Открытый ключ.
+        """
+        algorithm = get_key_algorithm(key, rsa_algorithm)
+        jwk = jwt.get_algorithm_by_name(algorithm).to_jwk(key, as_dict=True)
+        kid = get_jwk_thumbprint(jwk)
+        return cls(kid, algorithm, key, {**jwk, "kid": kid, "alg": algorithm, "use": "sig"})
+
+
+@dataclass(frozen=True)
+class JWTKeySet:
+    """
+    Загруженные ключи.
+
+    Атрибуты:
+    signing_key (JWTPublicKey): Открытый ключ текущего ключа подписи (kid и алгоритм подписи).
+    private_key (PrivateKeyTypes): Объект приватного ключа подписи cryptography.
+    public_keys (dict[str, JWTPublicKey]): Открытые ключи проверки подписи по kid.
+    files_state (tuple): Время изменения и размер файлов ключей на момент загрузки.
+    """
+
+    signing_key: JWTPublicKey
+    private_key: PrivateKeyTypes
+    public_keys: dict[str, JWTPublicKey]
+    files_state: tuple
+
+
+class JWTKeyManager:
+    """
+    Хранит разобранные ключи JWT и перечитывает их при изменении файлов.
+
+    Атрибуты:
+    auth_jwt (AuthJWT): Настройки JWT: пути к файлам ключей, алгоритм и интервал проверки файлов.
+
+    Методы:
+    get_generation(self) -> int: Возвращает номер загрузки ключей.
+    get_signing_key(self) -> tuple[str, str, PrivateKeyTypes]: Возвращает kid, алгоритм и приватный ключ подписи.
+    get_public_key(self, kid: str | None, algorithm: str | None = None) -> JWTPublicKey | None:
+     Возвращает открытый ключ по kid.
+    get_jwks(self) -> dict: Возвращает открытые ключи в формате JWKS.
+    reload(self) -> None: Перечитывает ключи из файлов.
+    """
+
+    def __init__(
+            self,
+            auth_jwt: AuthJWT
+    ):
+        self.auth_jwt = auth_jwt
+        self._key_set: JWTKeySet | None = None
+        self._checked_at = 0.0
+        self._generation = 0
+
+    def get_generation(self) -> int:
+        """
+        Возвращает номер загрузки ключей.
+
+        Номер увеличивается при каждой загрузке ключей, поэтому по нему можно определить,
+        что результат проверки токена получен с текущим набором ключей.
+        """
+        self._get_key_set()
+        return self._generation
+
+    def get_signing_key(self) -> tuple[str, str, PrivateKeyTypes]:
+        """Возвращает kid, алгоритм и приватный ключ, которым подписываются новые токены."""
+        key_set = self._get_key_set()
+        return key_set.signing_key.kid, key_set.signing_key.algorithm, key_set.private_key
+
+    def get_public_key(
+            self,
+            kid: str | None,
+            algorithm: str | None = None
+    ) -> JWTPublicKey | None:
+        """
+        Возвращает открытый ключ проверки подписи.
+
+        :param kid: Идентификатор ключа из заголовка токена.
+        :param algorithm: Алгоритм из заголовка токена. Используется только для токенов без kid, выпущенных
+         до появления идентификаторов ключей: они проверяются текущим ключом подписи или, если он другого
+         алгоритма, первым ключом этого алгоритма.
+        :return: Открытый ключ или None, если подходящего ключа нет.
+        """
+        key_set = self._get_key_set()
+        if kid is None:
+            return next((key for key in key_set.public_keys.values() if key.algorithm == algorithm), None)
+        if not isinstance(kid, str):
+            return None
+        if (
+                kid not in key_set.public_keys
+                and KID_PATTERN.fullmatch(kid)
+                and time.monotonic() - self._checked_at >= self.auth_jwt.keys_unknown_kid_check_interval
+        ):
+            key_set = self._get_key_set(force_check=True)
+        return key_set.public_keys.get(kid)
+
+    def get_jwks(self) -> dict:
+        """Возвращает все открытые ключи проверки подписи в формате JWKS (RFC 7517)."""
+        return {"keys": [public_key.jwk for public_key in self._get_key_set().public_keys.values()]}
+
+    def reload(self) -> None:
+        """Перечитывает ключи из файлов."""
+        self._key_set = self._load()
+        self._checked_at = time.monotonic()
+        self._generation += 1
+
+    def _get_key_set(
+            self,
+            force_check: bool = False
+    ) -> JWTKeySet:
+        """
+        Возвращает загруженные ключи, при необходимости проверяя, не изменились ли файлы.
+
+        Если новые файлы не удалось прочитать (например, они записаны не полностью),
+        используются ранее загруженные ключи, а чтение повторяется при следующей проверке.
+        :param force_check: Проверить файлы независимо от времени предыдущей проверки.
+        :return: Ключи.
+        """
+        if self._key_set is None:
+            self.reload()
+            return self._key_set
+        now = time.monotonic()
+        if force_check or now - self._checked_at >= self.auth_jwt.keys_reload_interval:
+            self._checked_at = now
+            if self._get_files_state() != self._key_set.files_state:
+                try:
+                    self._key_set = self._load()
+                except Exception:
+                    logger.exception("Failed to reload JWT keys, keeping previously loaded keys")
+                else:
+                    self._generation += 1
+                    logger.info("JWT keys reloaded, signing key %s", self._key_set.signing_key.kid)
+        return self._key_set
+
+    def _get_paths(self) -> list[Path]:
+        """Возвращает пути ко всем файлам ключей."""
+        return [self.auth_jwt.private_key_path, self.auth_jwt.public_key_path, *self.auth_jwt.previous_public_key_paths]
+
+    def _get_files_state(self) -> tuple:
+        """Возвращает время изменения и размер файлов ключей (None для отсутствующих файлов)."""
+        state = []
+        for path in self._get_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                state.append(None)
+            else:
+                state.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(state)
+
+    def _load(self) -> JWTKeySet:
+        """
+        Читает и разбирает ключи.
+
+        Отсутствующие файлы предыдущих ключей пропускаются: их удаление завершает смену ключа.
+        :return: Ключи.
+        """
+        rsa_algorithm = self.auth_jwt.algorithm
+        files_state = self._get_files_state()
+        private_key = serialization.load_pem_private_key(self.auth_jwt.private_key_path.read_bytes(), password=None)
+        signing_key = JWTPublicKey.from_key(private_key.public_key(), rsa_algorithm)
+        public_keys = {signing_key.kid: signing_key}
+        for path in [self.auth_jwt.public_key_path, *self.auth_jwt.previous_public_key_paths]:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                logger.debug("JWT public key %s not found, skipping", path)
+                continue
+            public_key = JWTPublicKey.from_key(serialization.load_pem_public_key(data), rsa_algorithm)
+            public_keys.setdefault(public_key.kid, public_key)
+        return JWTKeySet(signing_key, private_key, public_keys, files_state)
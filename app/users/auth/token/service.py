@@ -6,13 +6,27 @@ from fastapi.security import OAuth2PasswordBearer
 
 from app.settings.main_settings import Settings
 from app.users.auth.exceptions import InvalidAuthTokenError
+from app.users.auth.token.keys import JWTKeyManager
+from app.users.auth.token.verified_cache import VerifiedTokenCache
 
 ouath2_bearer = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 @dataclass
 class TokenService:
+    """
+    Класс для создания и проверки JWT-токенов.
+
+    Атрибуты:
+    settings (Settings): Настройки приложения.
+    key_manager (JWTKeyManager): Ключи подписи и проверки. Разбираются один раз и перечитываются при изменении
+     файлов, поэтому экземпляр должен быть общим для процесса (его создает контейнер приложения).
+    verified_tokens (VerifiedTokenCache): Кэш проверенных токенов, общий для процесса.
+    """
+
     settings: Settings
+    key_manager: JWTKeyManager
+    verified_tokens: VerifiedTokenCache
 
     def create_jwt(
             self,
@@ -54,14 +68,19 @@ class TokenService:
         Создает JWT-токен на основе переданных данных.
 
         :param payload: Данные для кодирования в токен.
-        :param private_key: Приватный ключ для подписи токена.
-        :param algorithm: Алгоритм шифрования (по умолчанию задается в настройках).
+        :param private_key: Приватный ключ для подписи токена. По умолчанию - текущий ключ подписи,
+         его kid записывается в заголовок токена.
+        :param algorithm: Алгоритм подписи (по умолчанию - алгоритм текущего ключа подписи).
         :param expire_minutes: Время жизни токена в минутах (по умолчанию из настроек).
         :param expire_timedelta: Объект timedelta для задания времени жизни токена.
                                  Если не указан, используется `expire_minutes`.
         :return: Закодированный JWT-токен.
         """
-        private_key = private_key or self.settings.auth_jwt.private_key_path.read_text()
+        headers = None
+        if private_key is None:
+            kid, signing_algorithm, private_key = self.key_manager.get_signing_key()
+            algorithm = algorithm or signing_algorithm
+            headers = {"kid": kid}
         algorithm = algorithm or self.settings.auth_jwt.algorithm
         expire_minutes = expire_minutes or self.settings.auth_jwt.access_token_expire_minutes
 
@@ -72,7 +91,7 @@ class TokenService:
                 exp=now + expire_timedelta,
                 iat=now
         )
-        encoded = jwt.encode(to_encode, private_key, algorithm=algorithm)
+        encoded = jwt.encode(to_encode, private_key, algorithm=algorithm, headers=headers)
         return encoded
 
     def decode_jwt(
@@ -85,16 +104,46 @@ class TokenService:
         Декодирует JWT-токен.
 
         :param token: JWT-токен в виде строки или байтов.
-        :param public_key: Публичный ключ для проверки подписи токена.
-        :param algorithm: Алгоритм шифрования (по умолчанию задается в настройках).
+        :param public_key: Публичный ключ для проверки подписи токена. По умолчанию ключ выбирается по kid
+         из заголовка токена, а токен проверяется алгоритмом этого ключа.
+        :param algorithm: Алгоритм подписи (по умолчанию - алгоритм ключа или алгоритм из настроек).
         :return: Раскодированные данные токена.
-        :raises jwt.exceptions.InvalidTokenError: Если токен недействителен.
+        :raises jwt.exceptions.InvalidTokenError: Если токен недействителен или подписан неизвестным ключом.
         """
-        public_key = public_key or self.settings.auth_jwt.public_key_path.read_text()
+        if public_key is None:
+            header = jwt.get_unverified_header(token)
+            if (verification_key := self.key_manager.get_public_key(header.get("kid"), header.get("alg"))) is None:
+                raise jwt.InvalidTokenError(f"Unknown signing key {header.get('kid')}")
+            public_key = verification_key.key
+            algorithm = algorithm or verification_key.algorithm
         algorithm = algorithm or self.settings.auth_jwt.algorithm
         decoded = jwt.decode(token, public_key, algorithms=[algorithm])
         return decoded
 
+    def verify_jwt(
+            self,
+            token: str
+    ) -> dict:
+        """
+        Проверяет токен текущими ключами.
+
+        Повторная проверка того же токена берется из кэша проверенных токенов, пока токен не истечет
+        и не сменятся ключи.
+        :param token: JWT-токен.
+        :return: Раскодированные данные токена.
+        :raises jwt.exceptions.InvalidTokenError: Если токен недействителен или подписан неизвестным ключом.
+        """
+        generation = self.key_manager.get_generation()
+        if (payload := self.verified_tokens.get(token, generation)) is not None:
+            return payload
+        payload = self.decode_jwt(token)
+        self.verified_tokens.set(token, generation, payload)
+        return payload
+
+    def get_verified_cache_stats(self) -> dict:
+        """Возвращает счетчики попаданий и промахов кэша проверенных токенов текущего воркера."""
+        return self.verified_tokens.get_stats()
+
     def validate_token_type(
             self,
             payload: dict,
@@ -0,0 +1,119 @@
+"""
+Кэш проверенных JWT.
+
+Клиент предъявляет один и тот же токен доступа на каждом запросе, пока токен не истечет, а проверка подписи
+RS256 - одна из самых дорогих операций запроса. Поэтому результат проверки сохраняется в памяти процесса:
+повторный запрос с тем же токеном получает данные токена без проверки подписи.
+
+- Ключ записи - SHA-256 токена (сами токены в памяти не хранятся). Вместе с данными токена хранится поколение
+ ключей подписи: после смены или удаления ключа записи, проверенные старыми ключами, больше не используются.
+- Запись живет до exp токена, но не дольше ttl кэша.
+- Кэш заменяет только проверку подписи и срока действия. Проверки, которые выполняются после нее
+ (существует ли пользователь и т.п.), выполняются на каждом запросе.
+- Кэш не отзывает токены: подпись отозванного токена остается верной, и после удаления записи токен снова
+ пройдет проверку. Доступ неактивного пользователя запрещает проверка признака active профиля
+ (UserService.get_user_by_token_sub). revoke_user удаляет записи токенов пользователя, чтобы после изменения
+ его профиля (например, деактивации) токены прошли полную проверку. UserService вызывает revoke_user
+ для каждого сообщения канала инвалидации профилей, поэтому записи удаляются во всех воркерах.
+"""
+
+import hashlib
+import time
+
+from app.infrastructure.cache.memory import MemoryCache
+
+
+class VerifiedTokenCache:
+    """
+    Кэш данных проверенных токенов.
+
+    Атрибуты:
+    cache (MemoryCache): Кэш данных токенов (LRU с временем жизни записей).
+
+    Методы:
+    get(self, token: str, generation: int) -> dict | None: Возвращает данные проверенного токена.
+    set(self, token: str, generation: int, payload: dict) -> None: Сохраняет данные проверенного токена.
+    revoke(self, token: str) -> None: Удаляет токен из кэша.
+    revoke_user(self, user_id: int) -> int: Удаляет из кэша токены пользователя.
+    revoke_all(self) -> None: Очищает кэш.
+    get_stats(self) -> dict: Возвращает счетчики попаданий и промахов.
+    """
+
+    def __init__(
+            self,
+            cache: MemoryCache
+    ):
+        self.cache = cache
+
+    def get(
+            self,
+            token: str,
+            generation: int
+    ) -> dict | None:
+        """
+        Возвращает данные проверенного токена.
+
+        :param token: Токен.
+        :param generation: Поколение ключей подписи.
+        :return: Копия данных токена или None, если токен не проверялся, истек или проверен другими ключами.
+        """
+        if (entry := self.cache.get(self._digest(token))) is None:
+            return None
+        entry_generation, payload = entry
+        return dict(payload) if entry_generation == generation else None
+
+    def set(
+            self,
+            token: str,
+            generation: int,
+            payload: dict
+    ) -> None:
+        """
+        Сохраняет данные проверенного токена до его истечения.
+
+        :param token: Токен.
+        :param generation: Поколение ключей подписи, которыми проверен токен.
+        :param payload: Данные токена.
+        """
+        ttl = self.cache.ttl
+        if (expires_at := payload.get("exp")) is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self.cache.set(self._digest(token), (generation, dict(payload)), ttl=ttl)
+
+    def revoke(
+            self,
+            token: str
+    ) -> None:
+        """
+        Удаляет токен из кэша, чтобы следующий запрос с ним прошел полную проверку.
+
+        :param token: Токен.
+        """
+        self.cache.delete(self._digest(token))
+
+    def revoke_user(
+            self,
+            user_id: int
+    ) -> int:
+        """
+        Удаляет из кэша токены пользователя (с sub, равным user_id). Просматривает все записи кэша.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Количество удаленных записей.
+        """
+        sub = str(user_id)
+        return self.cache.delete_matching(lambda entry: entry[1].get("sub") == sub)
+
+    def revoke_all(self) -> None:
+        """Очищает кэш."""
+        self.cache.clear()
+
+    def get_stats(self) -> dict:
+        """Возвращает счетчики попаданий и промахов и количество записей."""
+        return {**self.cache.stats.as_dict(), "size": len(self.cache)}
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Возвращает SHA-256 токена."""
+        return hashlib.sha256(token.encode()).digest()
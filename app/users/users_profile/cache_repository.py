@@ -0,0 +1,102 @@
+"""Кэш профилей пользователей в памяти процесса с инвалидацией между воркерами через Redis pub/sub."""
+
+from redis import asyncio as Redis  # noqa: N812
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.users.users_profile.local_cache import USERS_INVALIDATION_CHANNEL
+from app.users.users_profile.schemas import UserSchema
+
+
+class UserCacheRepository:
+    """
+    Класс для работы с in-process кэшем профилей пользователей.
+
+    Профили хранятся в памяти каждого воркера и не дублируются в Redis:
+    Redis используется только для рассылки инвалидации между воркерами.
+
+    Атрибуты:
+    redis (Redis): Объект подключения к Redis.
+    local_cache (MemoryCache): In-process кэш профилей по идентификатору пользователя.
+
+    Методы:
+    get_user(self, user_id: int) -> UserSchema | None: Получает профиль из кэша.
+    get_epoch(self) -> int: Возвращает счетчик инвалидаций кэша.
+    set_user(self, user: UserSchema, epoch: int) -> None: Сохраняет профиль.
+    invalidate(self, user_id: int) -> None: Удаляет профиль во всех воркерах.
+    invalidate_all(self) -> None: Очищает кэш профилей во всех воркерах.
+    handle_invalidation_message(self, message: bytes) -> None: Обрабатывает сообщение канала инвалидации.
+    get_stats(self) -> dict: Возвращает счетчики попаданий и промахов.
+    """
+
+    def __init__(
+            self,
+            redis_session: Redis,
+            local_cache: MemoryCache
+    ):
+        self.redis = redis_session
+        self.local_cache = local_cache
+
+    def get_user(
+            self,
+            user_id: int
+    ) -> UserSchema | None:
+        """
+        Получает профиль пользователя из кэша.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Профиль или None, если его нет в кэше или он устарел.
+        """
+        return self.local_cache.get(user_id)
+
+    def get_epoch(self) -> int:
+        """Возвращает счетчик инвалидаций кэша. Его нужно запомнить до чтения пользователя из базы."""
+        return self.local_cache.epoch
+
+    def set_user(
+            self,
+            user: UserSchema,
+            epoch: int
+    ) -> None:
+        """
+        Сохраняет профиль, если с момента чтения пользователя из базы не было инвалидации.
+
+        :param user: Профиль пользователя.
+        :param epoch: Значение get_epoch до чтения пользователя из базы.
+        """
+        self.local_cache.set(user.id, user, epoch=epoch)
+
+    async def invalidate(
+            self,
+            user_id: int
+    ) -> None:
+        """
+        Удаляет профиль в текущем воркере и публикует инвалидацию для остальных.
+
+        :param user_id: Идентификатор пользователя.
+        """
+        self.local_cache.delete(user_id)
+        await self.redis.publish(USERS_INVALIDATION_CHANNEL, str(user_id))
+
+    async def invalidate_all(self) -> None:
+        """Очищает кэш в текущем воркере и публикует пустое сообщение, по которому остальные воркеры очищают кэш."""
+        self.local_cache.clear()
+        await self.redis.publish(USERS_INVALIDATION_CHANNEL, b"")
+
+    def handle_invalidation_message(
+            self,
+            message: bytes
+    ) -> None:
+        """
+        Обрабатывает сообщение канала инвалидации профилей.
+
+        :param message: Идентификатор пользователя, профиль которого изменился. Пустое сообщение
+         (invalidate_all) очищает кэш целиком.
+        """
+        if not message:
+            self.local_cache.clear()
+            return
+        self.local_cache.delete(int(message))
+
+    def get_stats(self) -> dict:
+        """Возвращает счетчики попаданий и промахов и количество записей."""
+        return {**self.local_cache.stats.as_dict(), "size": len(self.local_cache)}
@@ -1,10 +1,13 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.status import HTTP_204_NO_CONTENT, HTTP_503_SERVICE_UNAVAILABLE
 
-from app.dependencies import get_user_service
+from app.dependencies import get_request_user_id, get_user_service, get_user_cache_repository
+from app.exceptions import ExecutorSaturatedError
 from app.users.users_profile.schemas import UserSchema, UsersCreateSchema
 from app.users.auth.schemas import UserLoginSchema
+from app.users.users_profile.cache_repository import UserCacheRepository
 from app.users.users_profile.service import UserService
 
 router = APIRouter(
@@ -24,6 +27,7 @@ async def create_user(
     Описание:
     - Создает нового пользователя в базе данных.
     - Генерирует токен доступа для нового пользователя.
+    - Если пул потоков для хэширования паролей перегружен, возвращает 503 с заголовком Retry-After.
     - Возвращает данные пользователя в формате UserLoginSchema.
 
     Аргументы:
@@ -34,7 +38,41 @@ async def create_user(
     """
     try:
         create_user_result = await user_service.create_user(body.username, body.password)
+    except ExecutorSaturatedError as error:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=error.detail, headers={"Retry-After": "1"})
     except Exception as error:
         raise HTTPException(status_code=422, detail=str(error))
 
     return create_user_result
+
+
+@router.post("/me/deactivate", status_code=HTTP_204_NO_CONTENT)
+async def deactivate_current_user(
+    user_id: Annotated[int, Depends(get_request_user_id)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
+) -> None:
+    """
+    Деактивирует текущего пользователя.
+
+    Описание:
+    - Снимает признак активности пользователя из токена доступа.
+    - Сбрасывает профиль и проверенные токены пользователя во всех воркерах: следующие запросы
+     с его токенами доступа и обновления, а также вход по паролю получают 403.
+
+    Аргументы:
+    - user_id: Идентификатор пользователя из токена доступа.
+    """
+    await user_service.set_user_active(user_id, False)
+
+
+@router.get("/cache/stats", dependencies=[Depends(get_request_user_id)])
+async def get_user_cache_stats(
+    user_cache_repository: Annotated[UserCacheRepository, Depends(get_user_cache_repository)],
+) -> dict:
+    """
+    Статистика кэша профилей пользователей. Доступна только с токеном доступа активного пользователя.
+
+    Возвращает:
+    - Количество попаданий и промахов, долю попаданий и количество профилей в кэше текущего воркера.
+    """
+    return user_cache_repository.get_stats()
@@ -0,0 +1,13 @@
+"""
+Кэширование профилей пользователей в памяти процесса (воркера).
+
+In-process кэш профилей пользователей по идентификатору и объединение одновременных загрузок одного профиля
+из базы при промахе кэша создаются из настроек один раз на процесс в контейнере приложения
+(app.container.Container.create).
+
+Инвалидация между воркерами выполняется через Redis pub/sub канал USERS_INVALIDATION_CHANNEL:
+UserCacheRepository.invalidate публикует в него идентификатор пользователя, а подписчик каждого воркера
+удаляет профиль из кэша, а пустое сообщение (UserCacheRepository.invalidate_all) - все профили. Короткий TTL ограничивает время жизни устаревшего профиля, если сообщение потеряно.
+"""
+
+USERS_INVALIDATION_CHANNEL = "users:invalidate"
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import TypeVar, Callable
 
-from sqlalchemy import insert, select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.users.users_profile import UserProfile
@@ -21,6 +21,8 @@ class UserRepository:
     create_user(self, username: str, password: str) -> UserProfile: Создает нового пользователя.
     get_user(self, user_id: int) -> UserProfile | None: Получает пользователя по идентификатору.
     get_user_by_name(self, username: str) -> UserProfile | None: Получает пользователя по имени.
+    update_password(self, user_id: int, password: bytes) -> None: Заменяет хэш пароля пользователя.
+    set_user_active(self, user_id: int, active: bool) -> bool: Изменяет признак активности пользователя.
     """
 
     session_factory: Callable[[T], AsyncSession]
@@ -32,6 +34,20 @@ class UserRepository:
             email: str,
             active: bool = True,
     ) -> UserProfile:
+        """
+        Создает нового пользователя.
+
+        Созданная строка возвращается тем же запросом (INSERT ... RETURNING), без повторной выборки.
+
+        Аргументы:
+        - username: Имя пользователя.
+        - password: Хэш пароля.
+        - email: Электронная почта.
+        - active: Признак активности пользователя.
+
+        Возвращает:
+        - Созданного пользователя.
+        """
         stmnt = (
             insert(UserProfile)
             .values(
@@ -40,16 +56,14 @@ class UserRepository:
                     email=email,
                     active=active,
             )
-            .returning(UserProfile.id)
+            .returning(UserProfile)
         )
 
         async with self.session_factory() as session:
             query_result = await session.execute(stmnt)
-            new_user_id = query_result.scalars().first()
+            new_user = query_result.scalar_one()
             await session.commit()
-
-        new_user = await self.get_user(new_user_id)
-        return new_user
+            return new_user
 
     async def get_user(self, user_id: int) -> UserProfile | None:
         """
@@ -92,3 +106,41 @@ class UserRepository:
             query_result = await session.execute(query)
             user = query_result.scalar_one_or_none()
             return user
+
+    async def update_password(
+            self,
+            user_id: int,
+            password: bytes
+    ) -> None:
+        """
+        Заменяет хэш пароля пользователя.
+
+        Аргументы:
+        - user_id: Идентификатор пользователя.
+        - password: Новый хэш пароля.
+        """
+        stmnt = update(UserProfile).where(UserProfile.id == user_id).values(password=password)
+        async with self.session_factory() as session:
+            await session.execute(stmnt)
+            await session.commit()
+
+    async def set_user_active(
+            self,
+            user_id: int,
+            active: bool
+    ) -> bool:
+        """
+        Изменяет признак активности пользователя.
+
+        Аргументы:
+        - user_id: Идентификатор пользователя.
+        - active: Признак активности.
+
+        Возвращает:
+        - True, если пользователь найден, иначе False.
+        """
+        stmnt = update(UserProfile).where(UserProfile.id == user_id).values(active=active)
+        async with self.session_factory() as session:
+            query_result = await session.execute(stmnt)
+            await session.commit()
+            return bool(query_result.rowcount)
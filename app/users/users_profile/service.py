@@ -1,9 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from app.users.auth.exceptions import UserIsNotExistsError
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.users.auth.exceptions import UserIsNotActiveError, UserIsNotExistsError
 from app.users.auth.schemas import UserLoginSchema
 from app.users.users_profile import UserRepository, UserSchema
+from app.users.users_profile.cache_repository import UserCacheRepository
 
 if TYPE_CHECKING:
     from app.users.users_profile import UserProfile
@@ -20,13 +22,22 @@ class UserService:
      который используется для работы с пользователями в базе данных.
     token_service (AuthService): Экземпляр класса AuthService,
      который используется для работы с аутентификацией пользователей.
+    user_cache_repository (UserCacheRepository | None): Кэш профилей пользователей. Без него профиль
+     загружается из базы на каждом запросе.
+    user_loads (SingleFlight): Объединяет одновременные загрузки одного профиля при промахе кэша.
+     Чтобы объединение работало между запросами, экземпляр должен быть общим для процесса.
 
     Методы:
     create_user(self, username: str, password: str) -> UserLoginSchema: Создает нового пользователя.
+    get_user_by_token_sub(self, payload: dict) -> UserSchema: Получает пользователя по sub из токена.
+    set_user_active(self, user_id: int, active: bool) -> None: Активирует или деактивирует пользователя.
+    handle_invalidation_message(self, message: bytes) -> None: Обрабатывает сообщение канала инвалидации профилей.
     """
 
     user_repository: UserRepository
     auth_service: "AuthService"
+    user_cache_repository: UserCacheRepository | None = None
+    user_loads: SingleFlight = field(default_factory=SingleFlight)
 
     async def create_user(
             self,
@@ -36,27 +47,98 @@ class UserService:
     ) -> UserLoginSchema:
         new_user: UserProfile = await self.user_repository.create_user(
                 username,
-                self.auth_service.hash_password(password),
+                await self.auth_service.create_password_hash(password),
                 email
         )
         new_user: UserSchema = UserSchema.model_validate(new_user)
-        access_token = self.auth_service.create_access_token(new_user)
-        refresh_token = self.auth_service.create_refresh_token(new_user)
+        tokens = await self.auth_service.create_tokens(new_user)
         return UserLoginSchema(
                 id=new_user.id,
-                access_token=access_token,
-                refresh_token=refresh_token
+                access_token=tokens.access_token,
+                refresh_token=tokens.refresh_token
         )
 
     async def get_user_by_token_sub(self, payload: dict) -> UserSchema:
         """
         Функция для получения пользователя по sub (subject) из токена.
 
+        Профиль берется из кэша, при промахе загружается из базы данных и сохраняется в кэш.
+        Токен неактивного пользователя не принимается, даже если его подпись и срок действия верны.
         :param payload: Пейлоад токена.
         :return: Объект пользователя.
         :raises UserIsNotExistsError: Если пользователь не найден.
+        :raises UserIsNotActiveError: Если пользователь неактивен.
         """
         user_id = int(payload["sub"])
+        if self.user_cache_repository is None:
+            user = await self._load_user(user_id)
+        elif not (user := self.user_cache_repository.get_user(user_id)):
+            # epoch читается до обращения к базе: если профиль изменится во время выборки,
+            # устаревший профиль не будет сохранен в кэш.
+            epoch = self.user_cache_repository.get_epoch()
+            user = await self.user_loads.do(
+                    ("user", user_id, epoch),
+                    lambda: self._load_user(user_id, epoch),
+            )
+        if not user.active:
+            raise UserIsNotActiveError
+        return user
+
+    async def set_user_active(
+            self,
+            user_id: int,
+            active: bool
+    ) -> None:
+        """
+        Активирует или деактивирует пользователя и сбрасывает его профиль и проверенные токены во всех воркерах.
+
+        Профиль и токены удаляются в текущем воркере, а остальные воркеры удаляют их, получив сообщение
+        канала инвалидации профилей (handle_invalidation_message). После этого запросы с токенами
+        деактивированного пользователя загружают профиль из базы и отклоняются.
+
+        :param user_id: Идентификатор пользователя.
+        :param active: Признак активности.
+        :raises UserIsNotExistsError: Если пользователь не найден.
+        """
+        if not await self.user_repository.set_user_active(user_id, active):
+            raise UserIsNotExistsError
+        self.auth_service.token_service.verified_tokens.revoke_user(user_id)
+        if self.user_cache_repository is not None:
+            await self.user_cache_repository.invalidate(user_id)
+
+    def handle_invalidation_message(
+            self,
+            message: bytes
+    ) -> None:
+        """
+        Обрабатывает сообщение канала инвалидации профилей: удаляет профиль пользователя из кэша
+        и его токены из кэша проверенных токенов текущего воркера.
+
+        :param message: Идентификатор пользователя, профиль которого изменился. Пустое сообщение
+         (UserCacheRepository.invalidate_all) очищает оба кэша целиком.
+        """
+        self.user_cache_repository.handle_invalidation_message(message)
+        if not message:
+            self.auth_service.token_service.verified_tokens.revoke_all()
+            return
+        self.auth_service.token_service.verified_tokens.revoke_user(int(message))
+
+    async def _load_user(
+            self,
+            user_id: int,
+            epoch: int | None = None
+    ) -> UserSchema:
+        """
+        Загружает профиль пользователя из базы данных и, если передан epoch, сохраняет его в кэш.
+
+        :param user_id: Идентификатор пользователя.
+        :param epoch: Счетчик инвалидаций кэша до обращения к базе.
+        :return: Объект пользователя.
+        :raises UserIsNotExistsError: Если пользователь не найден.
+        """
         if not (current_user := await self.user_repository.get_user(user_id)):
             raise UserIsNotExistsError
-        return UserSchema.model_validate(current_user)
+        user = UserSchema.model_validate(current_user)
+        if epoch is not None:
+            self.user_cache_repository.set_user(user, epoch)
+        return user
@@ -0,0 +1 @@
+"""Бенчмарки горячих путей приложения и нагрузочный тест. Запускаются как модули: python -m benchmarks.<имя>."""
@@ -0,0 +1,235 @@
+"""
+Микробенчмарки функций, которые выполняются на каждом запросе.
+
+- token.encode_jwt, token.decode_jwt - подпись и проверка JWT (TokenService).
+- token.verify_jwt_cached - проверка повторно предъявленного токена (из кэша проверенных токенов).
+- auth.hash_password, auth.validate_password - bcrypt со стоимостью, которую выбирает приложение (PasswordHasher).
+- tasks.model_validate_orm - TaskSchema.model_validate на строках TaskModel, как в TaskService.
+- tasks.cache_decode_user_tasks - разбор задач пользователя из хэша Redis (TaskCacheRepository.get_user_tasks)
+ без L1 и без сети: Redis заменен словарем, поэтому замеряется только разбор.
+
+Каждый замер повторяется --repeat раз, в отчет попадает лучшее время одного вызова: оно меньше всего зависит
+от фоновой нагрузки машины. Результаты сравниваются с базовыми значениями из benchmarks/hot_paths_baseline.json;
+если замер медленнее базового больше чем на --threshold, команда завершается с кодом 1.
+Базовые значения зависят от машины, поэтому их нужно снимать (--update-baseline) там же, где выполняется сравнение.
+
+Запуск:
+    python -m benchmarks.bench_hot_paths
+    python -m benchmarks.bench_hot_paths --update-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.settings.main_settings import Settings
+from app.tasks.models import TaskModel
+from app.tasks.repository.cache_repository import TaskCacheRepository
+from app.tasks.schemas import TaskSchema
+from app.users.auth.password import create_password_hasher
+from app.users.auth.token.keys import JWTKeyManager
+from app.users.auth.token.service import TokenService
+from app.users.auth.token.verified_cache import VerifiedTokenCache
+
+BASELINE_PATH = Path(__file__).parent / "hot_paths_baseline.json"
+
+# Минимальная длительность одного повтора: короткие вызовы выполняются пачкой, чтобы погрешность таймера не влияла
+MIN_REPEAT_SECONDS = 0.2
+
+JWT_PAYLOAD = {"type": "access", "sub": "26", "username": "kapral_ae", "email": "aa@mm.com"}
+# Пароль, который хэшируется в замерах (тестовые данные, не учетные данные)
+PASSWORD = "password"  # noqa: S105
+TASKS_COUNT = 100
+
+
+class HashRedis:
+    """Хэши Redis в словаре процесса: достаточно для чтения задач пользователя без сети."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        """Возвращает все поля хэша."""
+        return self.hashes.get(key, {})
+
+
+def make_task_rows(count: int) -> list[TaskModel]:
+    """Создает строки задач в том виде, в котором их возвращает репозиторий."""
+    return [
+        TaskModel(id=i, name=f"Задача номер {i}", pomodoro_count=i % 15 + 1, category_id=i % 7 + 1, user_id=1)
+        for i in range(1, count + 1)
+    ]
+
+
+def build_cases() -> dict[str, Callable[[], object] | Callable[[], Awaitable[object]]]:
+    """
+    Подготавливает данные и возвращает замеряемые вызовы.
+
+    :return: Вызовы по именам; асинхронные вызовы выполняются в одном event loop.
+    """
+    settings = Settings()
+    token_service = TokenService(
+            settings=settings,
+            key_manager=JWTKeyManager(settings.auth_jwt),
+            verified_tokens=VerifiedTokenCache(
+                    MemoryCache(max_size=settings.jwt_verified_cache_size, ttl=settings.jwt_verified_cache_ttl)
+            ),
+    )
+    token = token_service.encode_jwt(JWT_PAYLOAD)
+    password_hasher = create_password_hasher(settings)
+    password_hasher.calibrate()
+    password_hash = password_hasher.hash(PASSWORD)
+
+    task_rows = make_task_rows(TASKS_COUNT)
+    tasks = [TaskSchema.model_validate(row) for row in task_rows]
+    cache_repository = TaskCacheRepository(HashRedis())
+    cache_repository.redis.hashes[cache_repository._user_tasks_key(1)] = {
+        str(task.id).encode(): cache_repository.codec.encode_one(task) for task in tasks
+    }
+
+    return {
+        "token.encode_jwt": lambda: token_service.encode_jwt(JWT_PAYLOAD),
+        "token.decode_jwt": lambda: token_service.decode_jwt(token),
+        "token.verify_jwt_cached": lambda: token_service.verify_jwt(token),
+        "auth.hash_password": lambda: password_hasher.hash(PASSWORD),
+        "auth.validate_password": lambda: password_hasher.verify(PASSWORD, password_hash),
+        "tasks.model_validate_orm": lambda: [TaskSchema.model_validate(row) for row in task_rows],
+        "tasks.cache_decode_user_tasks": lambda: cache_repository.get_user_tasks(1, 0),
+    }
+
+
+async def run_batch(
+        function: Callable,
+        is_async: bool,
+        number: int
+) -> float:
+    """
+    Выполняет вызов number раз подряд.
+
+    :param function: Замеряемый вызов.
+    :param is_async: Вызов возвращает корутину.
+    :param number: Количество вызовов.
+    :return: Длительность в секундах.
+    """
+    started_at = time.perf_counter()
+    if is_async:
+        for _ in range(number):
+            await function()
+    else:
+        for _ in range(number):
+            function()
+    return time.perf_counter() - started_at
+
+
+async def measure(
+        function: Callable,
+        repeat: int
+) -> float:
+    """
+    Замеряет время одного вызова.
+
+    Количество вызовов в повторе подбирается так, чтобы повтор длился не меньше MIN_REPEAT_SECONDS.
+    :param function: Замеряемый вызов.
+    :param repeat: Количество повторов.
+    :return: Лучшее время одного вызова в микросекундах.
+    """
+    # Первый вызов прогревает кэши и определяет, нужно ли ожидать результат
+    if is_async := asyncio.iscoroutine(result := function()):
+        await result
+    number = 1
+    while (elapsed := await run_batch(function, is_async, number)) < MIN_REPEAT_SECONDS:
+        number = max(number * 2, int(number * MIN_REPEAT_SECONDS / max(elapsed, 1e-9)))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        best = min(best, await run_batch(function, is_async, number) / number)
+    return best * 1_000_000
+
+
+def compare(
+        results: dict[str, float],
+        baseline: dict[str, float],
+        threshold: float
+) -> dict[str, dict]:
+    """
+    Сравнивает замеры с базовыми значениями.
+
+    :param results: Время одного вызова по именам в микросекундах.
+    :param baseline: Базовое время одного вызова по именам в микросекундах.
+    :param threshold: Допустимое относительное замедление (0.2 - на 20%).
+    :return: По каждому замеру: время, базовое время (None, если его нет), отношение к базовому и признак регрессии.
+    """
+    comparison = {}
+    for name, us_per_op in results.items():
+        baseline_us_per_op = baseline.get(name)
+        ratio = us_per_op / baseline_us_per_op if baseline_us_per_op else None
+        comparison[name] = {
+            "us_per_op": us_per_op,
+            "baseline_us_per_op": baseline_us_per_op,
+            "ratio": ratio,
+            "regressed": ratio is not None and ratio > 1 + threshold,
+        }
+    return comparison
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Читает базовые значения (пустой словарь, если файла нет)."""
+    if not path.exists():
+        return {}
+    return {name: case["us_per_op"] for name, case in json.loads(path.read_text())["cases"].items()}
+
+
+def save_baseline(
+        path: Path,
+        results: dict[str, float]
+) -> None:
+    """Сохраняет замеры как базовые значения вместе с описанием окружения."""
+    baseline = {
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "cases": {name: {"us_per_op": round(us_per_op, 3)} for name, us_per_op in sorted(results.items())},
+    }
+    path.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + "\n")
+
+
+def main() -> None:
+    """Запускает замеры, сравнивает их с базовыми значениями и выводит таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов каждого замера")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Допустимое замедление (0.2 - на 20%%)")
+    parser.add_argument("--filter", default="", help="Выполнить только замеры, имя которых содержит строку")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Файл базовых значений")
+    parser.add_argument("--update-baseline", action="store_true", help="Сохранить замеры как базовые значения")
+    parser.add_argument("--output", type=Path, help="Сохранить результаты сравнения в JSON")
+    args = parser.parse_args()
+
+    cases = {name: function for name, function in build_cases().items() if args.filter in name}
+    results = {name: asyncio.run(measure(function, args.repeat)) for name, function in cases.items()}
+
+    if args.update_baseline:
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+    comparison = compare(results, load_baseline(args.baseline), args.threshold)
+    if args.output:
+        args.output.write_text(json.dumps(comparison, indent=2) + "\n")
+
+    print(f"{'case':<32}{'us/op':>14}{'baseline':>14}{'ratio':>8}")  # noqa: T201
+    for name, case in comparison.items():
+        baseline = f"{case['baseline_us_per_op']:.3f}" if case["baseline_us_per_op"] else "-"
+        ratio = f"{case['ratio']:.2f}" if case["ratio"] is not None else "-"
+        mark = "  REGRESSED" if case["regressed"] else ""
+        print(f"{name:<32}{case['us_per_op']:>14.3f}{baseline:>14}{ratio:>8}{mark}")  # noqa: T201
+
+    if any(case["regressed"] for case in comparison.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
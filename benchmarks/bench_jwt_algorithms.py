@@ -0,0 +1,81 @@
+"""
+Сравнение алгоритмов подписи JWT: RS256, ES256 и EdDSA (Ed25519).
+
+Для каждого алгоритма генерируется пара ключей, и токены подписываются и проверяются через TokenService
+с JWTKeyManager, как в приложении. Кэш проверенных токенов не используется: замеряется полная проверка подписи.
+
+Запуск:
+    python -m benchmarks.bench_jwt_algorithms --repeat 5
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.settings.auth_settings import AuthJWT
+from app.settings.main_settings import Settings
+from app.users.auth.token.keygen import KEY_ALGORITHMS, generate_private_key, write_key_pair
+from app.users.auth.token.keys import JWTKeyManager
+from app.users.auth.token.service import TokenService
+from app.users.auth.token.verified_cache import VerifiedTokenCache
+from benchmarks.bench_hot_paths import JWT_PAYLOAD, measure
+
+
+def make_token_service(
+        algorithm: str,
+        cert_dir: Path
+) -> TokenService:
+    """Создает TokenService с новой парой ключей алгоритма algorithm."""
+    private_key_path, public_key_path = cert_dir / f"{algorithm}-private.pem", cert_dir / f"{algorithm}-public.pem"
+    write_key_pair(generate_private_key(algorithm), private_key_path, public_key_path)
+    auth_jwt = AuthJWT(private_key_path=private_key_path, public_key_path=public_key_path, previous_public_key_paths=[])
+    return TokenService(
+            settings=Settings(),
+            key_manager=JWTKeyManager(auth_jwt),
+            verified_tokens=VerifiedTokenCache(MemoryCache(max_size=0, ttl=0)),
+    )
+
+
+def bench_algorithm(
+        token_service: TokenService,
+        repeat: int
+) -> dict:
+    """Замеряет подпись и проверку токена."""
+    token = token_service.encode_jwt(JWT_PAYLOAD)
+    sign_us = asyncio.run(measure(lambda: token_service.encode_jwt(JWT_PAYLOAD), repeat))
+    verify_us = asyncio.run(measure(lambda: token_service.decode_jwt(token), repeat))
+    return {
+        "sign_us": sign_us,
+        "sign_per_s": 1_000_000 / sign_us,
+        "verify_us": verify_us,
+        "verify_per_s": 1_000_000 / verify_us,
+        "token_bytes": len(token),
+    }
+
+
+def main() -> None:
+    """Запускает замеры и выводит таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов каждого замера")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cert_dir:
+        results = {
+            algorithm: bench_algorithm(make_token_service(algorithm, Path(cert_dir)), args.repeat)
+            for algorithm in KEY_ALGORITHMS
+        }
+
+    print(  # noqa: T201
+            f"{'algorithm':<10}{'sign, us':>12}{'sign/s':>10}{'verify, us':>12}{'verify/s':>10}{'token, B':>10}"
+    )
+    for algorithm, result in results.items():
+        print(  # noqa: T201
+                f"{algorithm:<10}{result['sign_us']:>12.1f}{result['sign_per_s']:>10.0f}"
+                f"{result['verify_us']:>12.1f}{result['verify_per_s']:>10.0f}{result['token_bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
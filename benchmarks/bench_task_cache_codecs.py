@@ -0,0 +1,72 @@
+"""
+Сравнение форматов хранения списка задач в кэше.
+
+- legacy - прежний формат: список JSON-строк, каждая разбирается json.loads + TaskSchema.model_validate.
+- json, msgpack - форматы из app.tasks.repository.codecs, список разбирается одним вызовом TypeAdapter.
+
+Запуск:
+    python -m benchmarks.bench_task_cache_codecs --tasks 1000 --repeat 200
+"""
+
+import argparse
+import json
+import timeit
+
+from app.tasks.repository.codecs import JsonTaskListCodec, MsgpackTaskListCodec, msgpack
+from app.tasks.schemas import TaskSchema
+
+
+def make_tasks(count: int) -> list[TaskSchema]:
+    """Создает список задач для замеров."""
+    return [
+        TaskSchema(id=i, name=f"Задача номер {i}", pomodoro_count=i % 15 + 1, category_id=i % 7 + 1, user_id=i % 100)
+        for i in range(1, count + 1)
+    ]
+
+
+def bench_legacy(tasks: list[TaskSchema], repeat: int) -> dict:
+    """Замеряет прежний формат: отдельная JSON-строка на задачу."""
+    encoded = [task.model_dump_json().encode() for task in tasks]
+
+    def decode() -> list[TaskSchema]:
+        return [TaskSchema.model_validate(json.loads(x.decode("utf8"))) for x in encoded]
+
+    return {
+        "encode_ms": timeit.timeit(lambda: [task.model_dump_json() for task in tasks], number=repeat) / repeat * 1000,
+        "decode_ms": timeit.timeit(decode, number=repeat) / repeat * 1000,
+        "size_bytes": sum(len(x) for x in encoded),
+    }
+
+
+def bench_codec(codec: JsonTaskListCodec | MsgpackTaskListCodec, tasks: list[TaskSchema], repeat: int) -> dict:
+    """Замеряет формат из app.tasks.repository.codecs."""
+    encoded = codec.encode(tasks)
+    assert codec.decode(encoded) == tasks
+    return {
+        "encode_ms": timeit.timeit(lambda: codec.encode(tasks), number=repeat) / repeat * 1000,
+        "decode_ms": timeit.timeit(lambda: codec.decode(encoded), number=repeat) / repeat * 1000,
+        "size_bytes": len(encoded),
+    }
+
+
+def main() -> None:
+    """Запускает замеры и выводит таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000, help="Количество задач в списке")
+    parser.add_argument("--repeat", type=int, default=200, help="Количество повторов каждого замера")
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    results = {"legacy": bench_legacy(tasks, args.repeat), "json": bench_codec(JsonTaskListCodec(), tasks, args.repeat)}
+    if msgpack is not None:
+        results["msgpack"] = bench_codec(MsgpackTaskListCodec(), tasks, args.repeat)
+
+    print(f"{'format':<10}{'encode, ms':>12}{'decode, ms':>12}{'size, bytes':>14}")  # noqa: T201
+    for name, result in results.items():
+        print(  # noqa: T201
+                f"{name:<10}{result['encode_ms']:>12.3f}{result['decode_ms']:>12.3f}{result['size_bytes']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
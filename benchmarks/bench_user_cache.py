@@ -0,0 +1,118 @@
+"""
+Запросы к базе данных, которые экономит кэш профилей пользователей.
+
+Каждый запрос с токеном загружает профиль пользователя (UserGetterFromToken -> UserService.get_user_by_token_sub).
+Бенчмарк выполняет одинаковый поток запросов через UserService без кэша и с кэшем профилей и считает запросы
+к репозиторию пользователей. Репозиторий заменен заглушкой с задержкой --db-latency-ms, поэтому PostgreSQL
+не нужен, а время отражает экономию на обращениях к базе, а не скорость конкретного сервера.
+
+Запросы распределены равномерно между --users пользователями и выполняются пачками по --concurrency:
+одновременные промахи по одному пользователю объединяются в одну загрузку.
+
+Запуск:
+    python -m benchmarks.bench_user_cache --requests 10000 --users 100
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.settings.main_settings import Settings
+from app.users.users_profile.cache_repository import UserCacheRepository
+from app.users.users_profile.service import UserService
+
+
+class CountingUserRepository:
+    """Репозиторий пользователей в памяти, считающий запросы и имитирующий задержку базы данных."""
+
+    def __init__(
+            self,
+            latency: float
+    ):
+        self.latency = latency
+        self.queries = 0
+
+    async def get_user(self, user_id: int) -> SimpleNamespace:
+        """Возвращает строку пользователя после задержки."""
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        return SimpleNamespace(
+                id=user_id,
+                active=True,
+                username=f"user_{user_id}",
+                password=b"$2b$12$" + b"x" * 53,
+                email=None,
+        )
+
+
+async def run_requests(
+        user_service: UserService,
+        requests: int,
+        users: int,
+        concurrency: int
+) -> float:
+    """
+    Выполняет поток запросов профилей.
+
+    :return: Время выполнения в секундах.
+    """
+    started_at = time.perf_counter()
+    for offset in range(0, requests, concurrency):
+        await asyncio.gather(*(
+            user_service.get_user_by_token_sub({"sub": str(number % users + 1)})
+            for number in range(offset, min(offset + concurrency, requests))
+        ))
+    return time.perf_counter() - started_at
+
+
+def bench(
+        cached: bool,
+        args: argparse.Namespace
+) -> dict:
+    """Выполняет поток запросов через UserService с кэшем или без и возвращает количество запросов к базе."""
+    settings = Settings()
+    repository = CountingUserRepository(args.db_latency_ms / 1000)
+    user_cache_repository = None
+    if cached:
+        user_cache_repository = UserCacheRepository(
+                None,
+                MemoryCache(max_size=settings.users_cache_size, ttl=settings.users_cache_ttl),
+        )
+    user_service = UserService(
+            user_repository=repository,
+            auth_service=None,
+            user_cache_repository=user_cache_repository,
+    )
+    elapsed = asyncio.run(run_requests(user_service, args.requests, args.users, args.concurrency))
+    return {
+        "queries": repository.queries,
+        "queries_per_request": repository.queries / args.requests,
+        "us_per_request": elapsed / args.requests * 1_000_000,
+    }
+
+
+def main() -> None:
+    """Запускает поток запросов без кэша и с кэшем и выводит таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10_000, help="Количество запросов")
+    parser.add_argument("--users", type=int, default=100, help="Количество разных пользователей")
+    parser.add_argument("--concurrency", type=int, default=50, help="Количество одновременных запросов")
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="Задержка запроса к базе данных")
+    args = parser.parse_args()
+
+    results = {"no cache": bench(False, args), "cache": bench(True, args)}
+
+    print(f"{'':<10}{'queries':>10}{'queries/req':>14}{'us/req':>10}")  # noqa: T201
+    for name, result in results.items():
+        print(  # noqa: T201
+                f"{name:<10}{result['queries']:>10}{result['queries_per_request']:>14.4f}"
+                f"{result['us_per_request']:>10.1f}"
+        )
+    saved = results["no cache"]["queries"] - results["cache"]["queries"]
+    print(f"saved {saved} of {results['no cache']['queries']} queries")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Нагрузочный прогон приложения целиком.
+
+Запросы идут в настоящее приложение app.main.app через httpx.AsyncClient и ASGI-транспорт, без сети и uvicorn,
+поэтому замеряется стоимость обработчиков, зависимостей, базы данных и кэша. Lifespan приложения выполняется
+так же, как при обычном запуске (подписчики инвалидации, загрузка справочника категорий, запись помидоров).
+
+Каждый из --concurrency виртуальных пользователей регистрирует своего пользователя и в течение --duration секунд
+выполняет сценарии, выбранные случайно с весами --scenarios:
+- login - вход по логину и паролю (POST /auth/login);
+- create - создание задачи (POST /tasks/);
+- list - список задач пользователя (GET /tasks/users-tasks);
+- delete - удаление задачи, созданной этим виртуальным пользователем (DELETE /tasks/{id}).
+
+Нужен PostgreSQL с примененными миграциями (настройки DB_*). Redis - настоящий (настройки REDIS_*)
+или, с флагом --fakeredis, fakeredis в памяти процесса. Созданные пользователи остаются в базе.
+
+Отчет (JSON) содержит пропускную способность, задержки p50/p95/p99 и долю ошибок по каждому сценарию и в целом.
+Отчеты двух релизов, снятые с одинаковыми параметрами, можно сравнивать напрямую.
+
+Запуск:
+    python -m benchmarks.load_test --concurrency 50 --duration 30 --scenarios login=1,create=3,list=5,delete=1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+
+import httpx
+from fastapi import FastAPI
+
+SCENARIOS = ("login", "create", "list", "delete")
+
+# Ответы, которые считаются успешными: 404 у списка означает, что у пользователя еще нет задач
+EXPECTED_STATUSES = {
+    "login": {200},
+    "create": {200},
+    "list": {200, 404},
+    "delete": {204},
+}
+
+# Пароль виртуальных пользователей нагрузочного теста (тестовые данные, не учетные данные)
+LOAD_USER_PASSWORD = "load-test-password"  # noqa: S105
+
+
+@dataclass
+class ScenarioStats:
+    """
+    Результаты одного сценария.
+
+    Атрибуты:
+    latencies (list[float]): Задержки запросов в секундах.
+    errors (int): Количество неуспешных запросов.
+    statuses (Counter): Количество ответов по кодам (и по типам исключений транспорта).
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class VirtualUser:
+    """
+    Виртуальный пользователь.
+
+    Атрибуты:
+    username (str): Имя пользователя.
+    access_token (str): Токен доступа.
+    task_ids (list[int]): Идентификаторы созданных задач, которые еще не удалены.
+    """
+
+    username: str
+    access_token: str
+    task_ids: list[int] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Заголовки авторизации."""
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+
+def parse_scenarios(value: str) -> dict[str, float]:
+    """
+    Разбирает веса сценариев в формате "login=1,create=3".
+
+    :param value: Строка с весами.
+    :raise argparse.ArgumentTypeError: Если сценарий неизвестен или вес не положительный.
+    :return: Веса сценариев.
+    """
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Неизвестный сценарий {name!r}, доступны: {', '.join(SCENARIOS)}")
+        try:
+            weights[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Некорректный вес сценария {name!r}: {weight!r}")
+        if weights[name] <= 0:
+            raise argparse.ArgumentTypeError(f"Вес сценария {name!r} должен быть положительным")
+    return weights
+
+
+def percentile(
+        sorted_values: list[float],
+        q: float
+) -> float:
+    """
+    Возвращает перцентиль с линейной интерполяцией между соседними значениями.
+
+    :param sorted_values: Значения, отсортированные по возрастанию.
+    :param q: Перцентиль от 0 до 100.
+    :return: Значение перцентиля или 0 для пустого списка.
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(
+        stats: ScenarioStats,
+        elapsed: float
+) -> dict:
+    """
+    Сводит результаты сценария.
+
+    :param stats: Результаты сценария.
+    :param elapsed: Длительность прогона в секундах.
+    :return: Количество запросов, пропускная способность, доля ошибок и задержки в миллисекундах.
+    """
+    latencies = sorted(stats.latencies)
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": stats.errors,
+        "error_rate": stats.errors / requests if requests else 0.0,
+        "throughput_rps": requests / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": sum(latencies) / requests * 1000 if requests else 0.0,
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": latencies[-1] * 1000 if latencies else 0.0,
+        },
+        "statuses": {str(status): count for status, count in sorted(stats.statuses.items(), key=str)},
+    }
+
+
+def build_report(
+        results: dict[str, ScenarioStats],
+        elapsed: float,
+        config: dict
+) -> dict:
+    """
+    Собирает отчет прогона.
+
+    :param results: Результаты по сценариям.
+    :param elapsed: Длительность прогона в секундах.
+    :param config: Параметры прогона.
+    :return: Отчет: параметры, сводка по всем запросам и по каждому сценарию.
+    """
+    total = ScenarioStats()
+    for stats in results.values():
+        total.latencies.extend(stats.latencies)
+        total.errors += stats.errors
+        total.statuses.update(stats.statuses)
+    return {
+        "config": config,
+        "duration_s": elapsed,
+        "total": summarize(total, elapsed),
+        "scenarios": {name: summarize(stats, elapsed) for name, stats in results.items()},
+    }
+
+
+def load_app(fake_redis: bool) -> FastAPI:
+    """
+    Импортирует приложение.
+
+    С fake_redis подключения к Redis заменяются клиентами fakeredis с общим сервером в памяти, чтобы pub/sub
+    инвалидации работал между ними. Модули связывают имя get_redis_connection при импорте,
+    поэтому оно заменяется в каждом из них.
+    :param fake_redis: Использовать fakeredis вместо Redis.
+    :return: Приложение.
+    """
+    from app import container, main
+    from app.infrastructure import cache
+    from app.infrastructure.cache import accessor
+
+    if fake_redis:
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+
+        def get_fake_redis_connection(
+                connection_pool: object = None,
+                settings: object = None
+        ) -> fakeredis.FakeAsyncRedis:
+            return fakeredis.FakeAsyncRedis(server=server)
+
+        for module in (accessor, cache, container, main):
+            module.get_redis_connection = get_fake_redis_connection
+    return main.app
+
+
+async def timed_request(
+        client: httpx.AsyncClient,
+        stats: ScenarioStats,
+        scenario: str,
+        method: str,
+        url: str,
+        **kwargs
+) -> httpx.Response | None:
+    """
+    Выполняет запрос и записывает его задержку и результат.
+
+    :param client: HTTP-клиент.
+    :param stats: Результаты сценария.
+    :param scenario: Имя сценария.
+    :param method: HTTP-метод.
+    :param url: Путь.
+    :return: Ответ или None, если запрос завершился исключением.
+    """
+    started_at = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except Exception as error:
+        stats.latencies.append(time.perf_counter() - started_at)
+        stats.errors += 1
+        stats.statuses[type(error).__name__] += 1
+        return None
+    stats.latencies.append(time.perf_counter() - started_at)
+    stats.statuses[response.status_code] += 1
+    if response.status_code not in EXPECTED_STATUSES[scenario]:
+        stats.errors += 1
+    return response
+
+
+async def register_user(
+        client: httpx.AsyncClient,
+        username: str
+) -> VirtualUser:
+    """
+    Регистрирует пользователя для виртуального пользователя.
+
+    :param client: HTTP-клиент.
+    :param username: Имя пользователя.
+    :return: Виртуальный пользователь с токеном доступа.
+    """
+    response = await client.post("/users/", json={"username": username, "password": LOAD_USER_PASSWORD})
+    response.raise_for_status()
+    return VirtualUser(username, response.json()["access_token"])
+
+
+async def get_category_id(
+        client: httpx.AsyncClient,
+        user: VirtualUser
+) -> int:
+    """
+    Возвращает категорию для создаваемых задач, при отсутствии категорий создает ее.
+
+    :param client: HTTP-клиент.
+    :param user: Виртуальный пользователь, от имени которого создается категория.
+    :return: Идентификатор категории.
+    """
+    response = await client.get("/categories/")
+    response.raise_for_status()
+    if categories := response.json():
+        return categories[0]["id"]
+    response = await client.post("/categories/", json={"name": "load-test"}, headers=user.headers)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def run_virtual_user(
+        client: httpx.AsyncClient,
+        user: VirtualUser,
+        category_id: int,
+        weights: dict[str, float],
+        results: dict[str, ScenarioStats],
+        deadline: float,
+        rng: random.Random
+) -> None:
+    """
+    Выполняет сценарии до наступления deadline.
+
+    Удаление без созданных задач заменяется созданием, чтобы доля запросов сценариев не зависела от порядка.
+    :param client: HTTP-клиент.
+    :param user: Виртуальный пользователь.
+    :param category_id: Категория создаваемых задач.
+    :param weights: Веса сценариев.
+    :param results: Результаты по сценариям.
+    :param deadline: Время окончания по time.perf_counter.
+    :param rng: Генератор случайных чисел.
+    """
+    names = list(weights)
+    scenario_weights = list(weights.values())
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(names, weights=scenario_weights)[0]
+        if scenario == "delete" and not user.task_ids:
+            scenario = "create"
+        stats = results[scenario]
+        if scenario == "login":
+            await timed_request(
+                    client, stats, scenario, "POST", "/auth/login",
+                    data={"username": user.username, "password": LOAD_USER_PASSWORD},
+            )
+        elif scenario == "create":
+            response = await timed_request(
+                    client, stats, scenario, "POST", "/tasks/",
+                    json={"name": f"load {uuid.uuid4().hex}", "pomodoro_count": 1, "category_id": category_id},
+                    headers=user.headers,
+            )
+            if response is not None and response.status_code == 200:
+                user.task_ids.append(response.json()["id"])
+        elif scenario == "list":
+            await timed_request(client, stats, scenario, "GET", "/tasks/users-tasks", headers=user.headers)
+        else:
+            task_id = user.task_ids.pop(rng.randrange(len(user.task_ids)))
+            await timed_request(client, stats, scenario, "DELETE", f"/tasks/{task_id}", headers=user.headers)
+
+
+async def run(
+        app: FastAPI,
+        concurrency: int,
+        duration: float,
+        weights: dict[str, float],
+        seed: int
+) -> tuple[dict[str, ScenarioStats], float]:
+    """
+    Выполняет прогон внутри lifespan приложения.
+
+    :param app: Приложение.
+    :param concurrency: Количество виртуальных пользователей.
+    :param duration: Длительность прогона в секундах (без регистрации пользователей).
+    :param weights: Веса сценариев.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Результаты по сценариям и фактическая длительность прогона.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    # ASGITransport не выполняет lifespan, поэтому он запускается явно
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+            users = await asyncio.gather(
+                    *(register_user(client, f"load-{run_id}-{index}") for index in range(concurrency))
+            )
+            category_id = await get_category_id(client, users[0])
+            results = {name: ScenarioStats() for name in weights}
+            started_at = time.perf_counter()
+            await asyncio.gather(
+                    *(
+                        # Детерминированный выбор сценариев для воспроизводимости прогона, не криптография
+                        run_virtual_user(
+                                client, user, category_id, weights, results,
+                                started_at + duration, random.Random(f"{seed}:{index}"),  # noqa: S311
+                        )
+                        for index, user in enumerate(users)
+                    )
+            )
+            elapsed = time.perf_counter() - started_at
+    return results, elapsed
+
+
+def main() -> None:
+    """Запускает прогон и выводит или сохраняет отчет."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=10, help="Количество виртуальных пользователей")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность прогона в секундах")
+    parser.add_argument(
+            "--scenarios", type=parse_scenarios, default="login=1,create=3,list=5,delete=1",
+            help="Веса сценариев: login, create, list, delete",
+    )
+    parser.add_argument("--fakeredis", action="store_true", help="Использовать fakeredis вместо Redis")
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генератора случайных чисел")
+    parser.add_argument("--output", help="Файл отчета (по умолчанию отчет выводится в stdout)")
+    args = parser.parse_args()
+
+    app = load_app(args.fakeredis)
+    results, elapsed = asyncio.run(run(app, args.concurrency, args.duration, args.scenarios, args.seed))
+    report = build_report(
+            results,
+            elapsed,
+            {
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "scenarios": args.scenarios,
+                "redis": "fakeredis" if args.fakeredis else "redis",
+                "seed": args.seed,
+            },
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(rendered + "\n")
+    else:
+        print(rendered)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
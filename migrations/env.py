@@ -3,12 +3,21 @@ from logging.config import fileConfig
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 
+from app.analytics import UserTaskStatsModel, CategoryTaskStatsModel, DailyTaskStatsModel
 from app.infrastructure.database import Base
+from app.pomodoros import PomodoroSessionModel
 from app.settings.main_settings import Settings
 from app.tasks import TaskModel
 from app.users.users_profile import UserProfile
 
-__models__ = [TaskModel, UserProfile]
+__models__ = [
+    TaskModel,
+    UserProfile,
+    UserTaskStatsModel,
+    CategoryTaskStatsModel,
+    DailyTaskStatsModel,
+    PomodoroSessionModel,
+]
 settings = Settings()
 
 config = context.config
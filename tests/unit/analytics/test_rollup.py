@@ -0,0 +1,70 @@
+"""Тестирование инкрементального обновления сводных таблиц аналитики."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.analytics import UserTaskStatsModel, CategoryTaskStatsModel, DailyTaskStatsModel
+from app.analytics.rollup import collect_task_stats_deltas
+from app.tasks import TaskRepository, TaskCreateSchema, CategoryModel
+from app.users.users_profile import UserRepository
+from tests.unit.conftest import QueryCounter
+
+
+def test_collect_task_stats_deltas() -> None:
+    """Изменения суммируются по ключам каждой сводной таблицы."""
+    tasks = [
+        SimpleNamespace(user_id=1, category_id=1, pomodoro_count=2, created_at=datetime(2024, 5, 1, 10)),
+        SimpleNamespace(user_id=1, category_id=2, pomodoro_count=3, created_at=datetime(2024, 5, 1, 23)),
+        SimpleNamespace(user_id=1, category_id=1, pomodoro_count=4, created_at=datetime(2024, 5, 2, 8)),
+    ]
+
+    deltas = collect_task_stats_deltas(tasks, -1)
+
+    assert deltas[UserTaskStatsModel] == [{"user_id": 1, "tasks_count": -3, "pomodoro_count": -9}]
+    assert deltas[CategoryTaskStatsModel] == [
+        {"user_id": 1, "category_id": 1, "tasks_count": -2, "pomodoro_count": -6},
+        {"user_id": 1, "category_id": 2, "tasks_count": -1, "pomodoro_count": -3},
+    ]
+    assert [(row["day"].day, row["tasks_count"]) for row in deltas[DailyTaskStatsModel]] == [(1, -2), (2, -1)]
+
+
+def test_task_writes_maintain_rollups(session_factory: async_sessionmaker, query_counter: QueryCounter) -> None:
+    """Создание и удаление задач обновляют сводные таблицы одним запросом на таблицу, независимо от размера пакета."""
+    task_repository = TaskRepository(session_factory)
+
+    async def get_totals() -> tuple:
+        async with session_factory() as session:
+            user_totals = await session.get(UserTaskStatsModel, 1)
+            categories = (await session.execute(
+                    select(CategoryTaskStatsModel.category_id, CategoryTaskStatsModel.tasks_count)
+                    .order_by(CategoryTaskStatsModel.category_id)
+            )).all()
+        return (user_totals.tasks_count, user_totals.pomodoro_count), [tuple(row) for row in categories]
+
+    async def run() -> None:
+        user = await UserRepository(session_factory=session_factory).create_user("kapral", b"hash", "aa@mm.com")
+        async with session_factory() as session:
+            session.add_all([CategoryModel(id=1, name="Работа"), CategoryModel(id=2, name="Учеба")])
+            await session.commit()
+
+        query_counter.reset()
+        tasks = await task_repository.create_tasks(
+                [
+                    TaskCreateSchema(name=f"Задача {index}", pomodoro_count=index, category_id=index % 2 + 1)
+                    for index in range(1, 6)
+                ],
+                user.id,
+        )
+        assert len(query_counter) == 1 + 3
+        assert await get_totals() == ((5, 15), [(1, 2), (2, 3)])
+
+        # Массовое удаление использует ANY(array) PostgreSQL, поэтому на SQLite проверяется удаление по одной задаче.
+        for task in tasks[:3]:
+            await task_repository.delete_task(task.id)
+        assert await get_totals() == ((2, 9), [(1, 1), (2, 1)])
+
+    asyncio.run(run())
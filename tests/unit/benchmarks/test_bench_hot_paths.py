@@ -0,0 +1,27 @@
+"""Тестирование сравнения микробенчмарков с базовыми значениями."""
+
+from pathlib import Path
+
+from benchmarks.bench_hot_paths import compare, load_baseline, save_baseline
+
+
+def test_compare_flags_regressions_past_threshold() -> None:
+    """Регрессией считается только замедление больше порога, замеры без базового значения не сравниваются."""
+    comparison = compare(
+            {"fast": 90.0, "slower": 115.0, "regressed": 130.0, "new": 1.0},
+            {"fast": 100.0, "slower": 100.0, "regressed": 100.0},
+            threshold=0.2,
+    )
+
+    assert [name for name, case in comparison.items() if case["regressed"]] == ["regressed"]
+    assert comparison["slower"]["ratio"] == 1.15
+    assert comparison["new"]["baseline_us_per_op"] is None
+
+
+def test_baseline_round_trip(tmp_path: Path) -> None:
+    """Сохраненные базовые значения читаются обратно, отсутствующий файл - пустые базовые значения."""
+    path = tmp_path / "baseline.json"
+    assert load_baseline(path) == {}
+
+    save_baseline(path, {"token.decode_jwt": 150.2134})
+    assert load_baseline(path) == {"token.decode_jwt": 150.213}
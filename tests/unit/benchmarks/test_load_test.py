@@ -0,0 +1,41 @@
+"""Тестирование отчета нагрузочного прогона."""
+
+import argparse
+from collections import Counter
+
+import pytest
+
+from benchmarks.load_test import ScenarioStats, build_report, parse_scenarios, percentile
+
+
+def test_percentile_interpolates() -> None:
+    """Перцентиль интерполируется между соседними значениями, крайние перцентили - минимум и максимум."""
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4.0
+    assert percentile([], 99) == 0.0
+
+
+def test_parse_scenarios() -> None:
+    """Веса сценариев разбираются из строки, неизвестный сценарий отклоняется."""
+    assert parse_scenarios("login=1, list=2.5,create") == {"login": 1.0, "list": 2.5, "create": 1.0}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_scenarios("logout=1")
+
+
+def test_build_report() -> None:
+    """Сводка по всем запросам объединяет сценарии, доля ошибок и пропускная способность считаются от запросов."""
+    results = {
+        "list": ScenarioStats(latencies=[0.01, 0.03], statuses=Counter({200: 2})),
+        "delete": ScenarioStats(latencies=[0.02, 0.04], errors=1, statuses=Counter({204: 1, 404: 1})),
+    }
+    report = build_report(results, 2.0, {"concurrency": 1})
+
+    assert report["total"]["requests"] == 4
+    assert report["total"]["throughput_rps"] == 2.0
+    assert report["total"]["error_rate"] == 0.25
+    assert report["total"]["statuses"] == {"200": 2, "204": 1, "404": 1}
+    assert report["total"]["latency_ms"]["max"] == pytest.approx(40.0)
+    assert report["scenarios"]["delete"]["error_rate"] == 0.5
+    assert report["scenarios"]["list"]["latency_ms"]["p50"] == pytest.approx(20.0)
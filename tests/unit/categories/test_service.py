@@ -0,0 +1,55 @@
+"""Тестирование справочника категорий в памяти процесса."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.categories import CategoryRepository, CategoryCacheRepository, CategoryService, CategorySnapshot
+from app.exceptions import CategoryNotFoundError
+from app.infrastructure.cache.memory import MemoryCache
+from app.tasks import CategoryModel, CategorySchema
+from tests.unit.conftest import QueryCounter
+
+
+def test_snapshot_groups_ids_by_name() -> None:
+    """Имена категорий не уникальны: одно имя преобразуется во все идентификаторы."""
+    snapshot = CategorySnapshot.from_categories(
+            [
+                CategorySchema(id=1, name="Работа"),
+                CategorySchema(id=2, name="Учеба"),
+                CategorySchema(id=3, name="Работа", type="офис"),
+            ]
+    )
+    assert snapshot.ids_by_name == {"Работа": (1, 3), "Учеба": (2,)}
+    assert list(snapshot.categories) == [1, 2, 3]
+
+
+def test_reads_are_served_from_memory(session_factory: async_sessionmaker, query_counter: QueryCounter) -> None:
+    """После загрузки справочника чтение категорий не обращается к базе до инвалидации."""
+    local_cache = MemoryCache(max_size=1, ttl=60)
+    category_service = CategoryService(
+            category_repository=CategoryRepository(session_factory),
+            category_cache_repository=CategoryCacheRepository(redis_session=None, local_cache=local_cache),
+    )
+
+    async def run() -> None:
+        async with session_factory() as session:
+            session.add_all([CategoryModel(id=1, name="Работа"), CategoryModel(id=2, name="Учеба")])
+            await session.commit()
+
+        query_counter.reset()
+        await category_service.preload()
+        assert len(query_counter) == 1
+
+        assert (await category_service.get_category(2)).name == "Учеба"
+        assert await category_service.get_category_ids_by_name("Работа") == (1,)
+        with pytest.raises(CategoryNotFoundError):
+            await category_service.get_category_ids_by_name("Отдых")
+        assert len(query_counter) == 1
+
+        local_cache.clear()
+        assert [category.id for category in await category_service.get_categories()] == [1, 2]
+        assert len(query_counter) == 2
+
+    asyncio.run(run())
@@ -0,0 +1,63 @@
+"""Общие фикстуры unit-тестов."""
+
+import asyncio
+import re
+from typing import Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncEngine
+
+from app.analytics import UserTaskStatsModel  # noqa: F401 - регистрация таблиц в Base.metadata
+from app.infrastructure.database import Base, create_session_factory
+from app.tasks import TaskModel  # noqa: F401
+from app.users.users_profile import UserProfile  # noqa: F401
+
+
+class QueryCounter:
+    """Счетчик SQL-запросов, отправленных в базу данных."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        self.statements.append(statement)
+
+    def count(self, table: str) -> int:
+        """Возвращает количество запросов, изменяющих или читающих таблицу table."""
+        pattern = re.compile(rf"\b(INTO|UPDATE|FROM)\s+{table}\b")
+        return sum(1 for statement in self.statements if pattern.search(statement))
+
+    def reset(self) -> None:
+        """Сбрасывает счетчик."""
+        self.statements.clear()
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def sqlite_engine() -> Iterator[AsyncEngine]:
+    """In-memory SQLite с таблицами приложения. Поддерживает RETURNING, поэтому подходит для подсчета запросов."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    async def create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def session_factory(sqlite_engine: AsyncEngine) -> async_sessionmaker:
+    """Фабрика асинхронных сессий с теми же настройками, что и в приложении."""
+    return create_session_factory(sqlite_engine)
+
+
+@pytest.fixture
+def query_counter(sqlite_engine: AsyncEngine) -> QueryCounter:
+    """Счетчик SQL-запросов."""
+    return QueryCounter(sqlite_engine)
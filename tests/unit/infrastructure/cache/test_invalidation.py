@@ -0,0 +1,45 @@
+"""Тестирование подписчика на канал инвалидации."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.invalidation import CacheInvalidationListener
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_listener_survives_malformed_message() -> None:
+    """Ошибка обработчика сообщения очищает кэш и не останавливает подписчика."""
+    handled = []
+    clears = []
+
+    def on_message(data: bytes) -> None:
+        handled.append(int(data))
+
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        listener = CacheInvalidationListener(
+                fakeredis.FakeAsyncRedis(server=server),
+                "test:invalidate",
+                on_message=on_message,
+                on_subscribe=lambda: clears.append(True),
+        )
+        publisher = fakeredis.FakeAsyncRedis(server=server)
+        listener.start()
+        try:
+            assert await listener.wait_subscribed(timeout=1)
+            await publisher.publish("test:invalidate", "not-a-number")
+            await publisher.publish("test:invalidate", "1")
+            for _ in range(100):
+                if handled:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await listener.stop()
+            await publisher.aclose()
+
+    asyncio.run(scenario())
+
+    assert handled == [1]
+    assert len(clears) == 2
@@ -0,0 +1,48 @@
+"""Тестирование in-process кэша."""
+
+import time
+
+from app.infrastructure.cache.memory import MemoryCache
+
+
+def test_lru_eviction() -> None:
+    """При переполнении вытесняется самая давно использованная запись."""
+    cache = MemoryCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_expiration() -> None:
+    """Запись с истекшим временем жизни не возвращается."""
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_stale_value_is_not_stored_after_invalidation() -> None:
+    """Значение, прочитанное до инвалидации, не сохраняется."""
+    cache = MemoryCache(max_size=10, ttl=60)
+    epoch = cache.epoch
+    cache.delete("a")
+    cache.set("a", 1, epoch=epoch)
+
+    assert cache.get("a") is None
+
+
+def test_stats() -> None:
+    """Попадания и промахи учитываются в статистике."""
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
@@ -0,0 +1,47 @@
+"""Тестирование пула соединений Redis со статистикой."""
+
+import asyncio
+
+import pytest
+from redis import asyncio as redis
+from redis.exceptions import ConnectionError
+
+from app.infrastructure.cache.pool import InstrumentedConnectionPool
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_exhausted_pool_fails_after_timeout_and_reports_usage() -> None:
+    """Когда все соединения заняты, команда ждет не дольше timeout, а статистика показывает загрузку пула."""
+    # FakeConnection переименован в FakeAsyncRedisConnection в новых версиях fakeredis
+    connection_class = (
+        getattr(fakeredis.aioredis, "FakeAsyncRedisConnection", None) or fakeredis.aioredis.FakeConnection
+    )
+    pool = InstrumentedConnectionPool(
+            connection_class=connection_class,
+            server=fakeredis.FakeServer(),
+            max_connections=1,
+            timeout=0.05,
+    )
+    client = redis.Redis(connection_pool=pool)
+
+    async def scenario() -> tuple[dict, dict, bytes]:
+        await client.set("key", "value")
+        connection = await pool.get_connection()
+        with pytest.raises(ConnectionError):
+            await client.get("key")
+        exhausted = pool.get_stats()
+        await pool.release(connection)
+        value = await client.get("key")
+        released = pool.get_stats()
+        await pool.aclose()
+        return exhausted, released, value
+
+    exhausted, released, value = asyncio.run(scenario())
+
+    assert exhausted["in_use"] == 1
+    assert exhausted["errors"] == 1
+    assert exhausted["wait_ms"]["max"] >= 50
+    assert value == b"value"
+    assert released["in_use"] == 0
+    assert released["idle"] == 1
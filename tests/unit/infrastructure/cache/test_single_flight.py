@@ -0,0 +1,65 @@
+"""Тестирование объединения одновременных загрузок."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_load() -> None:
+    """Одновременные вызовы с одним ключом выполняют одну загрузку."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(single_flight.do("key", load) for _ in range(10)))
+
+    assert asyncio.run(run()) == [42] * 10
+    assert calls == 1
+    assert len(single_flight) == 0
+
+
+def test_error_is_shared_and_not_cached() -> None:
+    """Исключение загрузки получают все ожидающие, следующий вызов запускает загрузку заново."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    async def run() -> None:
+        results = await asyncio.gather(*(single_flight.do("key", load) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        with pytest.raises(ValueError):
+            await single_flight.do("key", load)
+
+    asyncio.run(run())
+    assert calls == 2
+
+
+def test_cancelled_waiter_does_not_cancel_load() -> None:
+    """Отмена одного из ожидающих не отменяет загрузку для остальных."""
+    single_flight = SingleFlight()
+
+    async def load() -> int:
+        await asyncio.sleep(0.02)
+        return 1
+
+    async def run() -> int:
+        first = asyncio.create_task(single_flight.do("key", load))
+        second = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == 1
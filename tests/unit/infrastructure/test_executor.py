@@ -0,0 +1,84 @@
+"""Тестирование ограниченного пула потоков."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.exceptions import ExecutorSaturatedError
+from app.infrastructure.executor import BoundedExecutor
+
+
+def test_run_returns_result_and_records_stats() -> None:
+    """Функция выполняется в потоке пула, время ожидания и выполнения учитывается."""
+    executor = BoundedExecutor("test", workers=2, queue_size=2)
+
+    async def scenario() -> str:
+        return await executor.run(lambda: threading.current_thread().name)
+
+    try:
+        thread_name = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    stats = executor.get_stats()
+
+    assert thread_name.startswith("test")
+    assert stats["submitted"] == stats["completed"] == 1
+    assert stats["running"] == stats["queued"] == 0
+    assert stats["run_ms"]["max"] >= 0
+
+
+def test_saturated_queue_fails_fast() -> None:
+    """Когда потоки заняты и очередь заполнена, новый вызов сразу отклоняется."""
+    executor = BoundedExecutor("test", workers=1, queue_size=1)
+    release = threading.Event()
+
+    async def scenario() -> dict:
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        stats = executor.get_stats()
+        release.set()
+        await asyncio.gather(running, queued)
+        return stats
+
+    try:
+        stats = asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert stats["running"] == stats["queued"] == 1
+    assert stats["rejected"] == 1
+    assert executor.get_stats()["completed"] == 2
+
+
+def test_cancelled_call_keeps_slot_until_thread_finishes() -> None:
+    """Отмена ожидающей корутины не освобождает место в пуле, пока поток выполняет функцию."""
+    executor = BoundedExecutor("test", workers=1, queue_size=0)
+    release = threading.Event()
+
+    async def scenario() -> tuple[dict, dict]:
+        call = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        stats_while_running = executor.get_stats()
+        release.set()
+        await asyncio.sleep(0.05)
+        return stats_while_running, executor.get_stats()
+
+    try:
+        while_running, after = asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert while_running["running"] == 1
+    assert while_running["completed"] == 0
+    assert after["running"] == 0
+    assert after["completed"] == 1
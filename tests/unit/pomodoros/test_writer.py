@@ -0,0 +1,86 @@
+"""Тестирование буфера пакетной записи сессий помидоров."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from asyncpg.exceptions import ForeignKeyViolationError
+
+from app.exceptions import PomodoroSessionQueueFullError
+from app.pomodoros.writer import PomodoroSessionWriter
+
+
+class InMemorySessionRepository:
+    """Репозиторий, запоминающий пакеты вместо COPY. Сессии задач из deleted_task_ids нарушают внешний ключ."""
+
+    def __init__(self, deleted_task_ids: frozenset[int] = frozenset()):
+        self.batches: list[list[tuple]] = []
+        self.deleted_task_ids = deleted_task_ids
+
+    async def copy_sessions(self, records: list[tuple]) -> None:
+        if any(record[0] in self.deleted_task_ids for record in records):
+            raise ForeignKeyViolationError("task does not exist")
+        self.batches.append(records)
+
+    async def get_existing_task_ids(self, task_ids: list[int]) -> set[int]:
+        return set(task_ids) - self.deleted_task_ids
+
+
+def make_records(count: int, task_id: int = 1) -> list[tuple]:
+    now = datetime.now()
+    return [(task_id, 1, now, now, now, now) for _ in range(count)]
+
+
+def test_flush_by_size_and_drain_on_stop() -> None:
+    """Полные пакеты записываются по размеру, остаток - при остановке."""
+    repository = InMemorySessionRepository()
+    writer = PomodoroSessionWriter(repository, queue_size=100, flush_size=4, flush_interval=60)
+
+    async def run() -> None:
+        writer.start()
+        writer.submit(make_records(10))
+        await writer.stop()
+
+    asyncio.run(run())
+    assert [len(batch) for batch in repository.batches] == [4, 4, 2]
+    assert writer.get_stats() == {"accepted": 10, "written": 10, "dropped": 0, "flushes": 3, "queued": 0}
+
+
+def test_flush_by_interval() -> None:
+    """Неполный пакет записывается через flush_interval без остановки."""
+    repository = InMemorySessionRepository()
+    writer = PomodoroSessionWriter(repository, queue_size=100, flush_size=1000, flush_interval=0.01)
+
+    async def run() -> None:
+        writer.start()
+        writer.submit(make_records(3))
+        await asyncio.sleep(0.1)
+        assert [len(batch) for batch in repository.batches] == [3]
+        await writer.stop()
+
+    asyncio.run(run())
+
+
+def test_queue_full_rejects_whole_batch() -> None:
+    """Пакет, не помещающийся в очередь, отклоняется целиком."""
+    writer = PomodoroSessionWriter(InMemorySessionRepository(), queue_size=5, flush_size=10, flush_interval=1)
+    writer.submit(make_records(3))
+    with pytest.raises(PomodoroSessionQueueFullError):
+        writer.submit(make_records(3))
+    assert writer.queue.qsize() == 3
+
+
+def test_sessions_of_deleted_tasks_are_dropped() -> None:
+    """Если задача удалена до записи, ее сессии отбрасываются, а остальные записываются."""
+    repository = InMemorySessionRepository(deleted_task_ids=frozenset({2}))
+    writer = PomodoroSessionWriter(repository, queue_size=100, flush_size=10, flush_interval=60)
+
+    async def run() -> None:
+        writer.start()
+        writer.submit(make_records(3, task_id=1) + make_records(2, task_id=2))
+        await writer.stop()
+
+    asyncio.run(run())
+    assert [len(batch) for batch in repository.batches] == [3]
+    assert writer.stats.written == 3
+    assert writer.stats.dropped == 2
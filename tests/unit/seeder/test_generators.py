@@ -0,0 +1,31 @@
+"""Тестирование генерации тестовых данных."""
+
+from datetime import datetime
+
+from app.seeder.generators import SeedConfig, TASK_COLUMNS, generate_tasks
+from app.seeder.loader import split_batches
+
+NOW = datetime(2024, 5, 1)
+
+
+def test_batches_cover_all_ids() -> None:
+    """Пакеты покрывают идентификаторы 1..count без пропусков и пересечений."""
+    config = SeedConfig(users=10, categories=3, tasks=25, batch_size=10)
+    batches = split_batches("tasks", config.tasks, config, b"", NOW)
+    assert [(batch.start_id, batch.end_id) for batch in batches] == [(1, 11), (11, 21), (21, 26)]
+
+
+def test_tasks_are_deterministic_and_valid() -> None:
+    """Пакет задач зависит только от параметров, ссылки и уникальность имен соблюдены."""
+    config = SeedConfig(users=100, categories=5, tasks=2000, days=30)
+    tasks = generate_tasks(config, 1, 2001, NOW)
+
+    assert tasks == generate_tasks(config, 1, 2001, NOW)
+    assert len(tasks[0]) == len(TASK_COLUMNS)
+    assert len({(name, user_id) for _, name, _, _, user_id, _, _ in tasks}) == len(tasks)
+    assert all(1 <= user_id <= config.users and 1 <= category_id <= config.categories
+               for _, _, _, category_id, user_id, _, _ in tasks)
+    assert all((NOW - created_at).days < config.days for *_, created_at, _ in tasks)
+
+    user_task_counts = [sum(1 for task in tasks if task[4] == user_id) for user_id in (1, config.users)]
+    assert user_task_counts[0] > user_task_counts[1]
@@ -0,0 +1,45 @@
+"""Тестирование сброса кэша задач всех пользователей."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.tasks.repository.cache_repository import TaskCacheRepository
+from app.tasks.repository.local_cache import TASKS_INVALIDATION_CHANNEL
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_invalidate_all_drops_task_keys_and_notifies_workers() -> None:
+    """Поколения увеличиваются, данные задач удаляются, L1 очищается, воркерам публикуется пустое сообщение."""
+
+    async def scenario() -> tuple[set, dict, bytes, int]:
+        redis = fakeredis.FakeAsyncRedis()
+        local_cache = MemoryCache(max_size=10, ttl=60)
+        repository = TaskCacheRepository(redis, local_cache=local_cache)
+        await redis.set("tasks:v3:gen:user:1", 3)
+        await redis.hset("tasks:v3:user:1:json", "1", "task")
+        await redis.hset("tasks:v3:pages:g2:json", "page", "tasks")
+        await redis.set("categories:other", 1)
+        local_cache.set(("tasks:v3:user:1:json", 3), [])
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(TASKS_INVALIDATION_CHANNEL)
+        await pubsub.get_message(timeout=1)
+
+        await repository.invalidate_all()
+
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        await pubsub.aclose()
+        generations = {
+            "user": await redis.get("tasks:v3:gen:user:1"),
+            "all": await redis.get("tasks:v3:gen:all"),
+        }
+        return set(await redis.keys("*")), generations, message["data"], len(local_cache)
+
+    keys, generations, message, local_size = asyncio.run(scenario())
+
+    assert keys == {b"tasks:v3:gen:user:1", b"tasks:v3:gen:all", b"categories:other"}
+    assert generations == {"user": b"4", "all": b"1"}
+    assert message == b""
+    assert local_size == 0
@@ -0,0 +1,28 @@
+"""Тестирование форматов хранения списка задач в кэше."""
+
+import pytest
+
+from app.tasks.repository.codecs import get_task_list_codec
+from app.tasks.schemas import TaskSchema
+
+TASKS = [
+    TaskSchema(id=1, name="Первая", pomodoro_count=3, category_id=1, user_id=10),
+    TaskSchema(id=2, name="Вторая", pomodoro_count=5, category_id=2, user_id=10),
+]
+
+
+@pytest.mark.parametrize("codec_name", ["json", "msgpack"])
+@pytest.mark.parametrize("tasks", [TASKS, []])
+def test_codec_roundtrip(codec_name: str, tasks: list[TaskSchema]) -> None:
+    """Список задач после сериализации и разбора не меняется."""
+    if codec_name == "msgpack":
+        pytest.importorskip("msgpack")
+    codec = get_task_list_codec(codec_name)
+
+    assert codec.decode(codec.encode(tasks)) == tasks
+
+
+def test_unknown_codec() -> None:
+    """Неизвестный формат приводит к ValueError."""
+    with pytest.raises(ValueError):
+        get_task_list_codec("xml")
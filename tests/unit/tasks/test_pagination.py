@@ -0,0 +1,25 @@
+"""Тестирование курсоров keyset-пагинации."""
+
+import pytest
+
+from app.exceptions import InvalidCursorError
+from app.tasks.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize("last_id", [1, 42, 2 ** 40])
+def test_cursor_roundtrip(last_id: int) -> None:
+    """Курсор декодируется в тот же идентификатор."""
+    assert decode_cursor(encode_cursor(last_id)) == last_id
+
+
+@pytest.mark.parametrize("cursor", [None, ""])
+def test_empty_cursor_is_first_page(cursor: str | None) -> None:
+    """Отсутствие курсора означает первую страницу."""
+    assert decode_cursor(cursor) is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJpZCI6ICJ4In0"])
+def test_invalid_cursor(cursor: str) -> None:
+    """Некорректный курсор приводит к InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -0,0 +1,129 @@
+"""Проверка количества SQL-запросов на изменяющих методах TaskRepository и UserRepository."""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.exceptions import TaskNameConflictError
+
+from app.tasks import TaskRepository, TaskCreateSchema, CategoryModel
+from app.users.users_profile import UserRepository
+from tests.unit.conftest import QueryCounter
+
+
+def test_write_methods_use_single_statement(session_factory: async_sessionmaker, query_counter: QueryCounter) -> None:
+    """
+    Каждый изменяющий метод выполняет ровно один запрос к своей таблице и возвращает полную строку.
+
+    Создание и удаление задач дополнительно выполняют по одному запросу к каждой из трех сводных таблиц аналитики.
+    """
+    user_repository = UserRepository(session_factory=session_factory)
+    task_repository = TaskRepository(session_factory)
+
+    async def run() -> None:
+        async with session_factory() as session:
+            session.add(CategoryModel(id=1, name="Работа"))
+            await session.commit()
+
+        query_counter.reset()
+        user = await user_repository.create_user("kapral", b"hash", "aa@mm.com")
+        assert len(query_counter) == 1
+        assert (user.id, user.username, user.active) == (1, "kapral", True)
+
+        query_counter.reset()
+        task = await task_repository.create_task(
+                TaskCreateSchema(name="Первая", pomodoro_count=3, category_id=1),
+                user.id,
+        )
+        assert query_counter.count("tasks") == 1
+        assert len(query_counter) == 1 + 3
+        assert (task.name, task.pomodoro_count, task.user_id) == ("Первая", 3, user.id)
+
+        query_counter.reset()
+        renamed = await task_repository.update_task_name(task.id, "Переименованная", user.id)
+        assert len(query_counter) == 1
+        assert renamed.name == "Переименованная"
+
+        query_counter.reset()
+        assert await task_repository.update_task_name(task.id, "Чужая", user.id + 1) is None
+        assert len(query_counter) == 1
+
+        query_counter.reset()
+        assert await task_repository.delete_task(task.id) == user.id
+        assert query_counter.count("tasks") == 1
+        assert len(query_counter) == 1 + 3
+
+    asyncio.run(run())
+
+
+def test_bulk_create_with_taken_name_raises_conflict(session_factory: async_sessionmaker) -> None:
+    """Массовое создание с именем, которое уже занято задачей пользователя, не создает ни одной задачи."""
+    user_repository = UserRepository(session_factory=session_factory)
+    task_repository = TaskRepository(session_factory)
+
+    async def run() -> None:
+        async with session_factory() as session:
+            session.add(CategoryModel(id=1, name="Работа"))
+            await session.commit()
+        user = await user_repository.create_user("kapral", b"hash", "aa@mm.com")
+        await task_repository.create_task(TaskCreateSchema(name="Первая", pomodoro_count=1, category_id=1), user.id)
+
+        with pytest.raises(TaskNameConflictError):
+            await task_repository.create_tasks(
+                    [
+                        TaskCreateSchema(name="Вторая", pomodoro_count=1, category_id=1),
+                        TaskCreateSchema(name="Первая", pomodoro_count=1, category_id=1),
+                    ],
+                    user.id,
+            )
+        assert [task.name for task in await task_repository.get_user_tasks(user.id)] == ["Первая"]
+
+    asyncio.run(run())
+
+
+def test_bulk_rename_checks_conflicts_after_update(session_factory: async_sessionmaker) -> None:
+    """
+    Обмен имен между задачами запроса не считается конфликтом: после нарушения индекса посреди UPDATE
+    переименование повторяется через временные имена. Имя задачи вне запроса остается занятым.
+
+    SQLite не поддерживает UPDATE ... FROM (VALUES ...) AS new_names (id, name), поэтому сам запрос подменяется:
+    без временных имен он нарушает индекс, как построчная проверка name_idx в PostgreSQL.
+    """
+    task_repository = TaskRepository(session_factory)
+    attempts = []
+
+    async def rename_tasks(
+            new_names_items: list[tuple[int, str]],
+            user_id: int,
+            chunk_size: int,
+            with_placeholders: bool
+    ) -> Sequence[tuple[int, str]]:
+        attempts.append(with_placeholders)
+        if not with_placeholders:
+            raise IntegrityError("UPDATE tasks", {}, Exception("name_idx"))
+        return new_names_items
+
+    task_repository._rename_tasks = rename_tasks
+
+    async def run() -> None:
+        async with session_factory() as session:
+            session.add(CategoryModel(id=1, name="Работа"))
+            await session.commit()
+        user = await UserRepository(session_factory=session_factory).create_user("kapral", b"hash", "aa@mm.com")
+        for name in ("A", "B", "C"):
+            await task_repository.create_task(TaskCreateSchema(name=name, pomodoro_count=1, category_id=1), user.id)
+
+        assert await task_repository.update_task_names({1: "B", 2: "A"}, user.id, 10) == [(1, "B"), (2, "A")]
+        assert attempts == [False, True]
+
+        attempts.clear()
+        with pytest.raises(TaskNameConflictError):
+            await task_repository.update_task_names({1: "C", 2: "D"}, user.id, 10)
+        with pytest.raises(TaskNameConflictError):
+            await task_repository.update_task_names({1: "B"}, user.id, 10)
+        assert attempts == [False, False]
+
+    asyncio.run(run())
@@ -0,0 +1,59 @@
+"""Тестирование проверки имен задач в TaskService."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.exceptions import TaskNameConflictError
+from app.tasks import TaskCreateSchema
+from app.tasks.service import TaskService
+
+
+class InMemoryTaskRepository:
+    """Репозиторий задач, создающий задачи в памяти."""
+
+    def __init__(self):
+        self.created = []
+
+    async def create_tasks(self, bodies: list[TaskCreateSchema], user_id: int) -> list[SimpleNamespace]:
+        """Создает задачи с последовательными идентификаторами."""
+        tasks = [
+            SimpleNamespace(id=len(self.created) + index, user_id=user_id, **body.model_dump())
+            for index, body in enumerate(bodies, start=1)
+        ]
+        self.created.extend(tasks)
+        return tasks
+
+
+class NoopTaskCacheRepository:
+    """Кэш задач, не выполняющий никаких действий."""
+
+    async def invalidate_user_tasks(self, user_id: int) -> None:
+        """Ничего не делает."""
+
+
+def make_task_service() -> tuple[TaskService, InMemoryTaskRepository]:
+    """Создает сервис задач с репозиторием в памяти."""
+    repository = InMemoryTaskRepository()
+    return TaskService(task_repository=repository, task_cache_repository=NoopTaskCacheRepository()), repository
+
+
+def test_create_tasks_allows_several_unnamed_tasks() -> None:
+    """Задачи без имени не считаются повторяющимися."""
+    task_service, repository = make_task_service()
+    bodies = [TaskCreateSchema(pomodoro_count=1) for _ in range(3)] + [TaskCreateSchema(name="a", pomodoro_count=1)]
+
+    tasks = asyncio.run(task_service.create_tasks(bodies, user_id=1))
+
+    assert len(tasks) == len(repository.created) == 4
+
+
+def test_create_tasks_rejects_repeated_names() -> None:
+    """Повторяющиеся имена отклоняются до обращения к базе данных."""
+    task_service, repository = make_task_service()
+    bodies = [TaskCreateSchema(name="a", pomodoro_count=1), TaskCreateSchema(name="a", pomodoro_count=2)]
+
+    with pytest.raises(TaskNameConflictError):
+        asyncio.run(task_service.create_tasks(bodies, user_id=1))
+    assert repository.created == []
@@ -0,0 +1,48 @@
+"""Тестирование контейнера объектов приложения."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.container import Container
+from app.dependencies import get_auth_service, get_container, get_user_service
+from app.settings.main_settings import Settings
+
+
+def test_services_share_container_objects() -> None:
+    """Сервисы создаются один раз и используют общие настройки, репозитории и клиент Redis."""
+    container = Container.create()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(container=container)))
+
+    async def resolve() -> tuple:
+        resolved = await get_container(request)
+        return await get_auth_service(resolved), await get_user_service(resolved)
+
+    try:
+        auth_service, user_service = asyncio.run(resolve())
+    finally:
+        asyncio.run(container.aclose())
+
+    assert auth_service is container.auth_service
+    assert user_service.auth_service is auth_service
+    assert auth_service.settings is container.settings is container.token_service.settings
+    assert user_service.user_cache_repository.redis is container.task_cache_repository.redis is container.redis
+
+
+def test_objects_are_built_from_container_settings() -> None:
+    """Пул потоков, хэшер паролей, пул Redis и кэши создаются из настроек контейнера, а не из окружения."""
+    settings = Settings().model_copy(update={
+        "crypto_executor_workers": 3,
+        "bcrypt_rounds": 5,
+        "redis_max_connections": 7,
+        "users_cache_size": 11,
+    })
+    container = Container.create(settings)
+    asyncio.run(container.aclose())
+
+    assert container.crypto_executor.workers == 3
+    assert container.password_hasher.rounds == 5
+    assert container.redis_pool.max_connections == 7
+    assert container.user_cache_repository.local_cache.max_size == 11
+    assert container.key_manager.auth_jwt is settings.auth_jwt
+    assert container.pomodoro_session_writer.flush_size == settings.pomodoro_sessions_flush_size
+    assert container.pomodoro_session_service.pomodoro_session_writer is container.pomodoro_session_writer
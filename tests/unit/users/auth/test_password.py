@@ -0,0 +1,69 @@
+"""Тестирование подбора стоимости bcrypt и перехэширования паролей при входе."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.infrastructure.executor import BoundedExecutor
+from app.settings.main_settings import Settings
+from app.users.auth.password import PasswordHasher, calibrate_bcrypt_rounds, get_bcrypt_rounds
+from app.users.auth.service import AuthService
+
+
+class UserRepositoryStub:
+    """Репозиторий с одним пользователем, запоминающий сохраненные хэши паролей."""
+
+    def __init__(self, password_hash: bytes):
+        self.user = SimpleNamespace(id=1, username="user", email=None, active=True, password=password_hash)
+        self.updated_passwords = []
+
+    async def get_user_by_name(self, username: str) -> SimpleNamespace:
+        return self.user
+
+    async def update_password(self, user_id: int, password: bytes) -> None:
+        self.updated_passwords.append((user_id, password))
+
+
+def test_calibration_respects_bounds() -> None:
+    """Стоимость не выходит за пределы диапазона при любом целевом времени."""
+    assert calibrate_bcrypt_rounds(0.0, min_rounds=4, max_rounds=6, samples=1) == 4
+    assert calibrate_bcrypt_rounds(60.0, min_rounds=4, max_rounds=6, samples=1) == 6
+
+
+def test_fixed_rounds_skip_calibration() -> None:
+    """Явно заданная стоимость используется без замера и записывается в хэш."""
+    hasher = PasswordHasher(target_seconds=60.0, min_rounds=4, max_rounds=16, fixed_rounds=5)
+
+    assert hasher.calibrate() == 5
+    assert get_bcrypt_rounds(hasher.hash("password")) == 5
+
+
+def test_login_rehashes_password_with_different_cost() -> None:
+    """После входа хэш с устаревшей стоимостью заменяется в фоне, хэш с текущей стоимостью не меняется."""
+    old_hasher = PasswordHasher(target_seconds=0, min_rounds=4, max_rounds=4, fixed_rounds=4)
+    hasher = PasswordHasher(target_seconds=0, min_rounds=4, max_rounds=5, fixed_rounds=5)
+    repository = UserRepositoryStub(old_hasher.hash("password"))
+    executor = BoundedExecutor("test", workers=1, queue_size=1)
+    auth_service = AuthService(
+            user_repository=repository,
+            settings=Settings(),
+            token_service=None,
+            crypto_executor=executor,
+            password_hasher=hasher,
+    )
+
+    async def login() -> None:
+        await auth_service.validate_user("user", "password")
+        await asyncio.sleep(0.2)
+
+    try:
+        asyncio.run(login())
+        [(user_id, new_hash)] = repository.updated_passwords
+        repository.user.password = new_hash
+        asyncio.run(login())
+    finally:
+        executor.shutdown()
+
+    assert user_id == 1
+    assert get_bcrypt_rounds(new_hash) == 5
+    assert hasher.verify("password", new_hash)
+    assert len(repository.updated_passwords) == 1
@@ -2,14 +2,22 @@
 
 import pytest
 
+from app.infrastructure.cache.memory import MemoryCache
 from app.settings.main_settings import Settings
+from app.users.auth.token.keys import JWTKeyManager
 from app.users.auth.token.service import TokenService
+from app.users.auth.token.verified_cache import VerifiedTokenCache
 
 
 @pytest.fixture
 def mock_token_service() -> TokenService:
     """Фикстура для инициализации класса TokenService."""
-    token_service = TokenService(settings=Settings())
+    settings = Settings()
+    token_service = TokenService(
+            settings=settings,
+            key_manager=JWTKeyManager(settings.auth_jwt),
+            verified_tokens=VerifiedTokenCache(MemoryCache(max_size=10, ttl=60)),
+    )
     yield token_service
 
 
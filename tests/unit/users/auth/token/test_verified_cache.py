@@ -0,0 +1,58 @@
+"""Тестирование кэша проверенных JWT."""
+
+import time
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.settings.main_settings import Settings
+from app.users.auth.token.keys import JWTKeyManager
+from app.users.auth.token.service import TokenService
+from app.users.auth.token.verified_cache import VerifiedTokenCache
+
+
+def make_token_service() -> TokenService:
+    """Создает TokenService со своими кэшем и набором ключей."""
+    settings = Settings()
+    return TokenService(
+            settings=settings,
+            key_manager=JWTKeyManager(settings.auth_jwt),
+            verified_tokens=VerifiedTokenCache(MemoryCache(max_size=10, ttl=60)),
+    )
+
+
+def test_repeated_token_is_served_from_cache() -> None:
+    """Повторная проверка токена берется из кэша, изменение результата не портит кэш."""
+    token_service = make_token_service()
+    token = token_service.encode_jwt({"sub": "1"})
+
+    payload = token_service.verify_jwt(token)
+    payload["sub"] = "2"
+
+    assert token_service.verify_jwt(token)["sub"] == "1"
+    assert token_service.get_verified_cache_stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5, "size": 1}
+
+
+def test_revoke_and_key_reload_force_full_verification() -> None:
+    """После отзыва токена или перезагрузки ключей токен проверяется заново."""
+    token_service = make_token_service()
+    token = token_service.encode_jwt({"sub": "1"})
+    token_service.verify_jwt(token)
+
+    token_service.verified_tokens.revoke(token)
+    assert token_service.verified_tokens.get(token, token_service.key_manager.get_generation()) is None
+
+    token_service.verify_jwt(token)
+    token_service.key_manager.reload()
+    assert token_service.verified_tokens.get(token, token_service.key_manager.get_generation()) is None
+
+
+def test_entry_does_not_outlive_token() -> None:
+    """Запись живет не дольше срока действия токена."""
+    verified_tokens = VerifiedTokenCache(MemoryCache(max_size=10, ttl=60))
+
+    verified_tokens.set("expired", 1, {"sub": "1", "exp": time.time() - 1})
+    verified_tokens.set("expiring", 1, {"sub": "1", "exp": time.time() + 0.05})
+    time.sleep(0.1)
+
+    assert verified_tokens.get("expired", 1) is None
+    assert verified_tokens.get("expiring", 1) is None
+    assert len(verified_tokens.cache) == 0
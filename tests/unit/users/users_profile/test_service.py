@@ -0,0 +1,111 @@
+"""Тестирование кэша профилей пользователей в UserService."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.cache.memory import MemoryCache
+from app.users.auth.exceptions import UserIsNotActiveError
+from app.users.auth.token.verified_cache import VerifiedTokenCache
+from app.users.users_profile.cache_repository import UserCacheRepository
+from app.users.users_profile.service import UserService
+from benchmarks.bench_user_cache import CountingUserRepository
+
+
+class PublishingRedis:
+    """Redis, запоминающий опубликованные сообщения."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.messages.append((channel, message))
+
+
+class ActiveUserRepository(CountingUserRepository):
+    """Репозиторий пользователей с изменением признака активности."""
+
+    def __init__(self, latency: float):
+        super().__init__(latency)
+        self.inactive_users = set()
+
+    async def get_user(self, user_id: int) -> SimpleNamespace:
+        """Возвращает строку пользователя с текущим признаком активности."""
+        user = await super().get_user(user_id)
+        user.active = user_id not in self.inactive_users
+        return user
+
+    async def set_user_active(self, user_id: int, active: bool) -> bool:
+        if active:
+            self.inactive_users.discard(user_id)
+        else:
+            self.inactive_users.add(user_id)
+        return True
+
+
+def make_user_service() -> tuple[UserService, ActiveUserRepository, PublishingRedis]:
+    repository = ActiveUserRepository(latency=0)
+    redis = PublishingRedis()
+    verified_tokens = VerifiedTokenCache(MemoryCache(max_size=10, ttl=60))
+    user_service = UserService(
+            user_repository=repository,
+            auth_service=SimpleNamespace(token_service=SimpleNamespace(verified_tokens=verified_tokens)),
+            user_cache_repository=UserCacheRepository(redis, MemoryCache(max_size=10, ttl=60)),
+    )
+    return user_service, repository, redis
+
+
+def test_concurrent_lookups_load_user_once() -> None:
+    """Одновременные и повторные запросы профиля выполняют один запрос к базе."""
+    user_service, repository, _ = make_user_service()
+
+    async def scenario() -> None:
+        await asyncio.gather(*(user_service.get_user_by_token_sub({"sub": "1"}) for _ in range(5)))
+        await user_service.get_user_by_token_sub({"sub": "1"})
+
+    asyncio.run(scenario())
+
+    assert repository.queries == 1
+
+
+def test_deactivation_rejects_cached_user() -> None:
+    """
+    Деактивация удаляет профиль из кэша, публикует инвалидацию для других воркеров и сбрасывает проверенные
+    токены пользователя: следующий запрос с его токеном отклоняется.
+    """
+    user_service, repository, redis = make_user_service()
+    verified_tokens = user_service.auth_service.token_service.verified_tokens
+    verified_tokens.set("token", 1, {"sub": "1"})
+    verified_tokens.set("other", 1, {"sub": "2"})
+
+    async def scenario() -> None:
+        await user_service.get_user_by_token_sub({"sub": "1"})
+        await user_service.set_user_active(1, False)
+        with pytest.raises(UserIsNotActiveError):
+            await user_service.get_user_by_token_sub({"sub": "1"})
+
+    asyncio.run(scenario())
+
+    assert repository.queries == 2
+    assert redis.messages == [("users:invalidate", "1")]
+    assert verified_tokens.get("token", 1) is None
+    assert verified_tokens.get("other", 1) == {"sub": "2"}
+
+
+def test_invalidation_message_drops_profile_and_tokens() -> None:
+    """Сообщение канала инвалидации из другого воркера удаляет профиль и проверенные токены пользователя."""
+    user_service, repository, _ = make_user_service()
+    verified_tokens = user_service.auth_service.token_service.verified_tokens
+    verified_tokens.set("token", 1, {"sub": "1"})
+
+    async def scenario() -> None:
+        await user_service.get_user_by_token_sub({"sub": "1"})
+        repository.inactive_users.add(1)
+        user_service.handle_invalidation_message(b"1")
+        with pytest.raises(UserIsNotActiveError):
+            await user_service.get_user_by_token_sub({"sub": "1"})
+
+    asyncio.run(scenario())
+
+    assert verified_tokens.get("token", 1) is None